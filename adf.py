@@ -0,0 +1,141 @@
+"""
+Convert Atlassian Document Format (ADF) to plain markdown-ish text
+"""
+
+import re
+
+BLANK_LINES = re.compile(r"\n{3,}")
+
+
+def _apply_marks(text: str, marks: list | None) -> str:
+    """
+    Wrap a text node in markdown for its code/strong/em/strike/link marks
+    """
+    for mark in marks or []:
+        mark_type = mark.get("type")
+        if mark_type == "code":
+            text = f"`{text}`"
+        elif mark_type == "strong":
+            text = f"**{text}**"
+        elif mark_type == "em":
+            text = f"*{text}*"
+        elif mark_type == "strike":
+            text = f"~~{text}~~"
+        elif mark_type == "link":
+            href = mark.get("attrs", {}).get("href")
+            if href:
+                text = f"[{text}]({href})"
+    return text
+
+
+def _inline(text: str) -> str:
+    """
+    Join a rendered block onto one line, for table cells
+    """
+    return " ".join(line.strip() for line in text.splitlines() if line.strip())
+
+
+def _quote(text: str) -> str:
+    """
+    Prefix every line of a rendered block with "> "
+    """
+    return "\n".join(f"> {line}".rstrip() for line in text.strip().splitlines()) + "\n\n"
+
+
+def _render(document, depth: int = 0) -> str:
+    """
+    Flatten one ADF node into text iteratively; only table rows and
+    blockquotes render their (shallow) subtrees separately for post-processing
+    """
+    parts = []
+    # Stack items are either a node with its list depth, or a literal string to emit
+    stack = [(document, depth)]
+
+    while stack:
+        node, depth = stack.pop()
+
+        if isinstance(node, str):
+            parts.append(node)
+            continue
+
+        node_type = node.get("type")
+        attrs = node.get("attrs") or {}
+        children = node.get("content") or []
+
+        if node_type == "text":
+            parts.append(_apply_marks(node.get("text", ""), node.get("marks")))
+            continue
+        if node_type == "hardBreak":
+            parts.append("\n")
+            continue
+        if node_type == "mention":
+            parts.append(attrs.get("text") or "@user")
+            continue
+        if node_type == "emoji":
+            parts.append(attrs.get("text") or attrs.get("shortName", ""))
+            continue
+        if node_type in ("inlineCard", "blockCard", "embedCard"):
+            parts.append(attrs.get("url", ""))
+            continue
+        if node_type == "rule":
+            parts.append("\n---\n")
+            continue
+
+        before, after = "", ""
+
+        if node_type in ("bulletList", "orderedList"):
+            indent = "  " * depth
+            start = attrs.get("order", 1)
+            stack.append(("\n" if depth == 0 else "", depth))
+            for offset in range(len(children) - 1, -1, -1):
+                stack.append((children[offset], depth + 1))
+                marker = "- " if node_type == "bulletList" else f"{start + offset}. "
+                stack.append((indent + marker, depth))
+            continue
+
+        if node_type == "paragraph":
+            after = "\n"
+        elif node_type == "heading":
+            before = "#" * attrs.get("level", 1) + " "
+            after = "\n\n"
+        elif node_type == "codeBlock":
+            before = f"```{attrs.get('language', '')}\n"
+            after = "\n```\n"
+        elif node_type == "blockquote":
+            parts.append(_quote("".join(_render(child, depth) for child in children)))
+            continue
+        elif node_type == "tableRow":
+            parts.append(" | ".join(_inline(_render(cell, depth)) for cell in children) + "\n")
+            continue
+        elif node_type == "table":
+            after = "\n"
+
+        if before:
+            parts.append(before)
+        if after:
+            stack.append((after, depth))
+        for child in reversed(children):
+            stack.append((child, depth))
+
+    return "".join(parts)
+
+
+def adf_to_text(document) -> str:
+    """
+    Flatten an ADF document into text in an iterative pass.
+
+    Handles paragraphs, headings, nested bullet/ordered lists, code blocks,
+    blockquotes, tables, inline marks, mentions, emoji and cards. Output is
+    collected in a list and joined once, so large descriptions stay linear.
+    Table cells are rendered inline, one row per line, and every line of a
+    blockquote gets its "> " prefix.
+    """
+    if document is None:
+        return ""
+    if isinstance(document, str):
+        return document.strip()
+    if not isinstance(document, dict):
+        return str(document)
+
+    return BLANK_LINES.sub("\n\n", _render(document)).strip()
+
@@ -0,0 +1,199 @@
+"""
+Async JIRA HTTP client (httpx) used by the async fetch nodes
+"""
+
+import asyncio
+import time
+
+import httpx
+
+from config import (
+    API_KEY,
+    JIRA_POOL_SIZE,
+    JIRA_TIMEOUT,
+    CACHE_DIR,
+    JIRA_CACHE_ENABLED,
+    JIRA_CACHE_MAX_MB,
+    JIRA_CACHE_TTL,
+    JIRA_OFFLINE,
+    JIRA_REQUESTS_PER_SECOND,
+    JIRA_MAX_RETRIES,
+)
+from http_cache import ResponseCache
+from jira_client import CLIENT_COUNTERS
+from rate_limiter import RETRY_STATUSES, backoff_delay, get_limiter, retry_after_seconds
+
+
+def _cached_response(entry: dict | None, url: str, status_code: int = 200) -> httpx.Response:
+    """
+    Build an httpx.Response served from the cache (or a 504 miss when offline)
+    """
+    if entry is not None:
+        response = httpx.Response(status_code, headers=entry.get("headers", {}),
+                                  content=entry["body"].encode("utf-8"))
+    else:
+        response = httpx.Response(status_code, content=b"Not available in offline cache")
+    response.request = httpx.Request("GET", url)
+    response.extensions["from_cache"] = True
+    return response
+
+
+class AsyncJiraClient:
+    """
+    Keep-alive async JIRA client sharing the on-disk response cache
+    """
+
+    def __init__(self, jira_url: str, email: str, api_key: str):
+        self.base_url = jira_url.rstrip('/')
+        self.email = email
+
+        self.http = httpx.AsyncClient(
+            auth=(email, api_key),
+            headers={"Accept": "application/json", "Accept-Encoding": "gzip, deflate"},
+            limits=httpx.Limits(max_connections=JIRA_POOL_SIZE, max_keepalive_connections=JIRA_POOL_SIZE),
+            timeout=JIRA_TIMEOUT,
+        )
+
+        self.cache = None
+        if JIRA_CACHE_ENABLED or JIRA_OFFLINE:
+            self.cache = ResponseCache(CACHE_DIR / "jira", JIRA_CACHE_MAX_MB * 1024 * 1024, JIRA_CACHE_TTL)
+
+        self.limiter = get_limiter("JIRA", JIRA_REQUESTS_PER_SECOND, JIRA_POOL_SIZE)
+
+        self.request_count = 0
+        self.retries = 0
+        self.cache_hits = 0
+        self.bytes_received = 0
+        self.total_seconds = 0.0
+
+    async def get(self, path: str, params: dict | None = None, use_cache: bool = True) -> httpx.Response:
+        """
+        GET a JIRA REST path (or absolute URL) and report its timing
+        """
+        url = path if path.startswith("http") else f"{self.base_url}{path}"
+
+        start = time.perf_counter()
+        if self.cache and (use_cache or JIRA_OFFLINE):
+            response = await self._cached_get(url, params)
+        else:
+            response = await self._network_get(url, params)
+        elapsed = time.perf_counter() - start
+
+        # Single event loop thread, so plain counters are safe
+        self.total_seconds += elapsed
+        source = "cache" if response.extensions.get("from_cache") else "network"
+        if source == "cache":
+            self.cache_hits += 1
+
+        print(f"   ⏱️  GET {path} -> {response.status_code} in {elapsed * 1000:.0f} ms ({source}, async)")
+        return response
+
+    async def _network_get(self, url: str, params: dict | None, headers: dict | None = None) -> httpx.Response:
+        """
+        Rate-limited GET, retrying 429/5xx and transport errors with jittered backoff
+        """
+        attempt = 0
+        while True:
+            await self.limiter.aacquire()
+            try:
+                response = await self.http.get(url, params=params, headers=headers)
+            except httpx.TransportError as e:
+                if attempt >= JIRA_MAX_RETRIES:
+                    raise
+                delay = backoff_delay(attempt)
+                print(f"   🔁 {type(e).__name__} on {url}, retrying in {delay:.1f}s")
+                response = None
+            finally:
+                self.limiter.release()
+
+            if response is not None:
+                self.request_count += 1
+                self.bytes_received += len(response.content)
+
+                if response.status_code not in RETRY_STATUSES or attempt >= JIRA_MAX_RETRIES:
+                    self.limiter.on_success(response.headers)
+                    return response
+
+                delay = backoff_delay(attempt, retry_after_seconds(response.headers))
+                print(f"   🔁 {response.status_code} on {url}, retrying in {delay:.1f}s")
+
+            self.retries += 1
+            attempt += 1
+
+            if response is not None and response.status_code == 429:
+                self.limiter.on_throttle(delay)
+            else:
+                await asyncio.sleep(delay)
+
+    async def _cached_get(self, url: str, params: dict | None) -> httpx.Response:
+        """
+        Serve from the disk cache when fresh, otherwise revalidate or refetch
+        """
+        key = self.cache.make_key(url, params, self.email)
+        entry = self.cache.load(key)
+
+        if entry is not None and (JIRA_OFFLINE or self.cache.is_fresh(entry)):
+            return _cached_response(entry, url)
+
+        if JIRA_OFFLINE:
+            return _cached_response(None, url, status_code=504)
+
+        response = await self._network_get(url, params, self.cache.conditional_headers(entry))
+
+        if response.status_code == 304 and entry is not None:
+            self.cache.refresh(key, entry)
+            return _cached_response(entry, url)
+
+        if response.status_code == 200:
+            self.cache.store(key, url, response)
+
+        return response
+
+    def print_stats(self):
+        """
+        Print per-run request, cache and latency totals
+        """
+        print(f"🌐 Async JIRA client: {self.request_count} network requests, {self.retries} retries, "
+              f"{self.cache_hits} cache hits, {self.bytes_received / 1024:.1f} KiB received "
+              f"({self.total_seconds:.2f}s total request time)")
+
+
+_async_clients: dict[tuple, AsyncJiraClient] = {}
+
+
+def get_async_jira_client(state) -> AsyncJiraClient:
+    """
+    Return the shared async client for the JIRA site and user in the given state
+    (the API key comes from config, as for get_jira_client).
+
+    httpx clients are bound to the event loop they were first used on, so the
+    running loop is part of the key.
+    """
+    loop = asyncio.get_running_loop()
+    key = (state['jira_url'].rstrip('/'), state['email'], API_KEY, id(loop))
+
+    client = _async_clients.get(key)
+    if client is None:
+        client = AsyncJiraClient(*key[:3])
+        _async_clients[key] = client
+
+    return client
+
+
+def async_client_totals() -> dict:
+    """
+    Counters summed over the open async clients, matching jira_client.client_totals()
+    """
+    clients = list(_async_clients.values())
+    return {name: sum(getattr(client, name) for client in clients) for name in CLIENT_COUNTERS}
+
+
+async def close_async_clients():
+    """
+    Print stats for and close every async client created on the running loop
+    """
+    loop_id = id(asyncio.get_running_loop())
+    for key in [key for key in _async_clients if key[3] == loop_id]:
+        client = _async_clients.pop(key)
+        client.print_stats()
+        await client.http.aclose()
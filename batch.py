@@ -0,0 +1,140 @@
+"""
+Multi-sprint / multi-board batch runs of the JIRA workflow
+"""
+
+import asyncio
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+from checkpoints import (
+    open_checkpointer,
+    open_async_checkpointer,
+    run_checkpointed,
+    arun_checkpointed,
+    regenerate,
+)
+from config import BATCH_WORKERS, METRICS_ENABLED
+from graph import create_jira_graph
+from metrics import write_metrics
+from nodes import fetch_user_info
+from ticket_store import ticket_count
+
+
+def load_targets(path: str | Path) -> list:
+    """
+    Load batch targets from a JSON list of {"project", "board", "sprint"} objects
+    """
+    with open(path) as f:
+        targets = json.load(f)
+
+    for target in targets:
+        if not target.get("project") or not target.get("sprint"):
+            raise ValueError(f"Batch target needs 'project' and 'sprint': {target}")
+
+    return targets
+
+
+def _write_index(results: list, docs_dir: Path) -> Path:
+    """
+    Write a combined markdown index linking every generated doc
+    """
+    lines = [
+        "# Release Documentation Index",
+        "",
+        f"Generated {datetime.now().strftime('%Y-%m-%d %H:%M')}",
+        "",
+        "| Project | Board | Sprint | Tickets | Release doc |",
+        "|---|---|---|---|---|",
+    ]
+
+    for target, final_state in results:
+        doc_path = final_state.get("release_doc_path")
+        if doc_path:
+            doc_cell = f"[{Path(doc_path).name}]({os.path.relpath(doc_path, docs_dir)})"
+        else:
+            doc_cell = f"❌ {final_state.get('error') or 'not generated'}"
+        lines.append(
+            f"| {target['project']} | {target.get('board') or '-'} | {target['sprint']} "
+            f"| {ticket_count(final_state)} | {doc_cell} |"
+        )
+
+    index_path = docs_dir / "index.md"
+    index_path.write_text("\n".join(lines) + "\n")
+    return index_path
+
+
+async def _run_targets_async(target_states: list, fresh: bool) -> list:
+    """
+    Run the async graph for every target, at most BATCH_WORKERS at a time
+    """
+    from async_jira_client import close_async_clients
+
+    semaphore = asyncio.Semaphore(max(1, BATCH_WORKERS))
+
+    async with open_async_checkpointer() as checkpointer:
+        app = create_jira_graph(async_mode=True, checkpointer=checkpointer)
+
+        async def run_target(target_state):
+            async with semaphore:
+                return await arun_checkpointed(app, target_state, fresh)
+
+        try:
+            return await asyncio.gather(*(run_target(target_state) for target_state in target_states))
+        finally:
+            await close_async_clients()
+
+
+def run_batch(base_state: dict, targets: list, docs_dir: Path, async_mode: bool = False,
+              fresh: bool = False, regenerate_only: bool = False) -> list:
+    """
+    Authenticate once, then run the graph for every target on a worker pool.
+
+    Each target is its own checkpoint thread, so a rerun resumes only the
+    targets that failed; regenerate_only re-runs just the doc generation.
+    """
+    # One /myself round-trip for the whole batch; the shared client keeps the session.
+    # Regenerating never talks to JIRA, so it skips the check.
+    auth_state = base_state if regenerate_only else fetch_user_info(base_state)
+    if auth_state["status"] == "error":
+        print(f"❌ Batch aborted: {auth_state['error']}")
+        return []
+
+    target_states = [
+        {
+            **auth_state,
+            "project_key": target["project"],
+            "board_name": target.get("board"),
+            "sprint_name": target["sprint"],
+        }
+        for target in targets
+    ]
+
+    print(f"📦 Running {len(targets)} targets with {BATCH_WORKERS} workers\n")
+
+    if async_mode and not regenerate_only:
+        final_states = asyncio.run(_run_targets_async(target_states, fresh))
+    else:
+        with open_checkpointer() as checkpointer:
+            app = create_jira_graph(checkpointer=checkpointer)
+
+            def run_target(target_state):
+                if regenerate_only:
+                    return regenerate(app, target_state)
+                return run_checkpointed(app, target_state, fresh)
+
+            with ThreadPoolExecutor(max_workers=max(1, BATCH_WORKERS)) as executor:
+                final_states = list(executor.map(run_target, target_states))
+
+    results = list(zip(targets, final_states))
+
+    index_path = _write_index(results, docs_dir)
+    print(f"🗂️  Batch index saved to {index_path}")
+
+    if METRICS_ENABLED:
+        json_path, prom_path = write_metrics(final_states, docs_dir)
+        print(f"📊 Metrics saved to {json_path} and {prom_path}")
+
+    return results
@@ -0,0 +1,3 @@
+"""
+End-to-end benchmarks against local mock JIRA and OpenAI servers
+"""
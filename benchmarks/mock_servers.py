@@ -0,0 +1,469 @@
+"""
+Local stand-ins for the JIRA REST API and the OpenAI chat completions endpoint.
+
+One threaded HTTP server answers both, generating a synthetic sprint of the
+requested size, with optional per-request latency and a share of 429s.
+Issue queries honor `fields` and the `updated >= -Nm`, `key in (...)` and
+`ORDER BY updated DESC` parts of their JQL, so projection and incremental
+sync show up in the bytes sent; MockState.touch() edits tickets.
+"""
+
+import json
+import random
+from email.parser import BytesParser
+from email.policy import HTTP
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+BOARD_ID = 1
+SPRINT_ID = 1000
+SPRINT_COUNT = 120
+PROJECT_KEY = "BENCH"
+TARGET_SPRINT = "Bench Sprint"
+
+SPRINT_PATH = re.compile(r"^/rest/agile/1\.0/board/(\d+)/sprint$")
+ISSUE_PATH = re.compile(r"^/rest/agile/1\.0/sprint/(\d+)/issue$")
+SPRINT_BY_ID_PATH = re.compile(r"^/rest/agile/1\.0/sprint/(\d+)$")
+PROMPT_KEY = re.compile(r"^Key: (\S+)$", re.MULTILINE)
+BATCH_PATH = re.compile(r"^/v1/batches/([\w-]+)$")
+FILE_CONTENT_PATH = re.compile(r"^/v1/files/([\w-]+)/content$")
+KEY_IN_JQL = re.compile(r"key in \(([^)]*)\)")
+UPDATED_SINCE_JQL = re.compile(r"updated >= -(\d+)m")
+ORDER_BY_UPDATED_DESC = re.compile(r"ORDER BY updated DESC", re.IGNORECASE)
+UPDATED_FORMAT = "%Y-%m-%dT%H:%M:%S.000%z"
+EPIC_COUNT = 10
+
+STATUSES = ["To Do", "In Progress", "In Review", "Done"]
+PRIORITIES = ["Lowest", "Low", "Medium", "High", "Highest"]
+
+
+def _adf_description(n: int) -> dict:
+    """
+    A few paragraphs and a bullet list, so ADF conversion does real work
+    """
+    paragraph = {
+        "type": "paragraph",
+        "content": [
+            {"type": "text", "text": f"Ticket {n} changes the ingestion pipeline so that "},
+            {"type": "text", "text": "records are validated", "marks": [{"type": "strong"}]},
+            {"type": "text", "text": " before they are written to the warehouse."},
+        ],
+    }
+    bullets = {
+        "type": "bulletList",
+        "content": [
+            {"type": "listItem", "content": [{"type": "paragraph", "content": [
+                {"type": "text", "text": f"Acceptance criterion {i} for ticket {n}"}]}]}
+            for i in range(1, 4)
+        ],
+    }
+    return {"type": "doc", "version": 1, "content": [paragraph, bullets, paragraph]}
+
+
+def _default_updated(n: int) -> datetime:
+    return datetime(2024, 1, 1 + n % 28, 12, tzinfo=timezone.utc)
+
+
+def _issue(n: int, base_url: str, updated: datetime | None = None) -> dict:
+    key = f"{PROJECT_KEY}-{n}"
+    avatar = {size: f"{base_url}/avatar/{n}?s={size}" for size in ("16x16", "24x24", "32x32", "48x48")}
+    return {
+        "expand": "operations,versionedRepresentations,editmeta,changelog,renderedFields",
+        "id": str(10000 + n),
+        "self": f"{base_url}/rest/api/3/issue/{10000 + n}",
+        "key": key,
+        "fields": {
+            "summary": f"[Pipeline] [ML] Synthetic change number {n}",
+            "description": _adf_description(n),
+            "status": {"self": f"{base_url}/rest/api/3/status/{n % 4}", "name": STATUSES[n % 4],
+                       "statusCategory": {"key": "done", "colorName": "green"}},
+            "priority": {"self": f"{base_url}/rest/api/3/priority/{n % 5}", "name": PRIORITIES[n % 5],
+                         "iconUrl": f"{base_url}/images/priority.svg"},
+            "assignee": {"self": f"{base_url}/rest/api/3/user?accountId={n % 7}",
+                         "displayName": f"Engineer {n % 7}", "avatarUrls": avatar},
+            "issuetype": {"self": f"{base_url}/rest/api/3/issuetype/10001", "name": "Story",
+                          "iconUrl": f"{base_url}/images/story.svg"},
+            "project": {"self": f"{base_url}/rest/api/3/project/1", "key": PROJECT_KEY,
+                        "name": "Benchmark", "avatarUrls": avatar},
+            "sprint": {"id": SPRINT_ID, "name": TARGET_SPRINT, "state": "active"},
+            "created": "2024-01-01T09:00:00.000+0000",
+            "updated": (updated or _default_updated(n)).strftime(UPDATED_FORMAT),
+            # Every story sits under one of a few epics outside the sprint; every fifth blocks the next
+            "parent": {"id": str(n % EPIC_COUNT), "key": f"EPIC-{n % EPIC_COUNT + 1}",
+                       "self": f"{base_url}/rest/api/3/issue/{n % EPIC_COUNT}"},
+            "issuelinks": [
+                {"id": str(n), "type": {"name": "Blocks", "inward": "is blocked by", "outward": "blocks"},
+                 "outwardIssue": {"key": f"{PROJECT_KEY}-{n + 1}"}}
+            ] if n % 5 == 0 else [],
+        },
+    }
+
+
+def _epic(key: str, base_url: str) -> dict:
+    return {
+        "id": key,
+        "self": f"{base_url}/rest/api/3/issue/{key}",
+        "key": key,
+        "fields": {"summary": f"Synthetic epic {key}", "status": {"name": "In Progress"},
+                   "issuetype": {"name": "Epic"}},
+    }
+
+
+def _project(issue: dict, fields: str | None) -> dict:
+    """
+    Keep only the requested fields, as JIRA does; `key` alone returns an empty fields object
+    """
+    if not fields or "*all" in fields.split(","):
+        return issue
+    wanted = set(fields.split(","))
+    issue["fields"] = {name: value for name, value in issue["fields"].items() if name in wanted}
+    return issue
+
+
+def _sprints() -> list:
+    """
+    Many closed sprints and the active target last, as on a long-lived board
+    """
+    sprints = [{"id": SPRINT_ID - SPRINT_COUNT + i, "name": f"Old Sprint {i}", "state": "closed"}
+               for i in range(SPRINT_COUNT)]
+    sprints.append({"id": SPRINT_ID, "name": TARGET_SPRINT, "state": "active"})
+    return sprints
+
+
+class MockState:
+    """
+    Server configuration and counters shared by the handler threads
+    """
+
+    def __init__(self, tickets: int, latency_ms: float = 0.0, throttle_rate: float = 0.0, seed: int = 0):
+        self.tickets = tickets
+        self.latency = latency_ms / 1000
+        self.throttle_rate = throttle_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.throttled = 0
+        self.bytes_sent = 0
+        self.llm_requests = 0
+        # Ticket number -> `updated` time of tickets edited through touch()
+        self.edited = {}
+        # Batch API stub: uploaded and generated files, and batches (completed on creation)
+        self.files = {}
+        self.batches = {}
+
+    def touch(self, *numbers: int):
+        """
+        Mark tickets as edited now, so `updated >= -Nm` queries return them
+        """
+        now = datetime.now(timezone.utc)
+        with self.lock:
+            self.edited.update((n, now) for n in numbers)
+
+    def updated(self, n: int) -> datetime:
+        return self.edited.get(n) or _default_updated(n)
+
+    def matching(self, jql: str) -> list:
+        """
+        Ticket numbers a sprint issue query selects, in result order
+        """
+        numbers = range(1, self.tickets + 1)
+
+        keys = KEY_IN_JQL.search(jql)
+        if keys:
+            wanted = {key.strip() for key in keys.group(1).split(",")}
+            numbers = [n for n in numbers if f"{PROJECT_KEY}-{n}" in wanted]
+
+        since = UPDATED_SINCE_JQL.search(jql)
+        if since:
+            cutoff = datetime.now(timezone.utc).timestamp() - int(since.group(1)) * 60
+            numbers = [n for n in numbers if self.updated(n).timestamp() >= cutoff]
+
+        if ORDER_BY_UPDATED_DESC.search(jql):
+            numbers = sorted(numbers, key=self.updated, reverse=True)
+        return list(numbers)
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "MockServer"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, body: bytes, content_type: str = "application/json", headers: dict | None = None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+        with self.server.state.lock:
+            self.server.state.bytes_sent += len(body)
+
+    def _send_json(self, payload, status: int = 200):
+        self._send(status, json.dumps(payload).encode("utf-8"))
+
+    def _throttle(self) -> bool:
+        state = self.server.state
+        with state.lock:
+            state.requests += 1
+            throttled = state.random.random() < state.throttle_rate
+            if throttled:
+                state.throttled += 1
+        if state.latency:
+            time.sleep(state.latency)
+        if throttled:
+            self._send(429, b'{"errorMessages":["Rate limit exceeded"]}', headers={"Retry-After": "0"})
+        return throttled
+
+    def do_GET(self):
+        if self._throttle():
+            return
+
+        url = urlparse(self.path)
+        query = {name: values[0] for name, values in parse_qs(url.query).items()}
+        base_url = self.server.base_url
+
+        if url.path == "/rest/api/3/myself":
+            return self._send_json({"accountId": "bench", "displayName": "Bench User",
+                                    "emailAddress": "bench@example.com", "active": True})
+
+        if url.path == "/rest/agile/1.0/board":
+            return self._send_json({"startAt": 0, "maxResults": 50, "total": 1, "isLast": True,
+                                    "values": [{"id": BOARD_ID, "name": "Bench board", "type": "scrum"}]})
+
+        if SPRINT_PATH.match(url.path):
+            states = set(query.get("state", "active,future,closed").split(","))
+            sprints = [sprint for sprint in _sprints() if sprint["state"] in states]
+            start_at = int(query.get("startAt", 0))
+            max_results = min(int(query.get("maxResults", 50)), 50)
+            page = sprints[start_at:start_at + max_results]
+            return self._send_json({"startAt": start_at, "maxResults": max_results,
+                                    "isLast": start_at + max_results >= len(sprints), "values": page})
+
+        sprint_by_id = SPRINT_BY_ID_PATH.match(url.path)
+        if sprint_by_id:
+            sprint = next((s for s in _sprints() if s["id"] == int(sprint_by_id.group(1))), None)
+            if sprint is None:
+                return self._send_json({"errorMessages": ["Sprint does not exist"]}, status=404)
+            return self._send_json({**sprint, "originBoardId": BOARD_ID})
+
+        if ISSUE_PATH.match(url.path):
+            numbers = self.server.state.matching(query.get("jql", ""))
+            start_at = int(query.get("startAt", 0))
+            max_results = min(int(query.get("maxResults", 50)), 100)
+            issues = [self._issue(n, query, base_url) for n in numbers[start_at:start_at + max_results]]
+            return self._send_json({"expand": "schema,names", "startAt": start_at, "maxResults": max_results,
+                                    "total": len(numbers), "issues": issues})
+
+        if url.path == "/rest/api/3/search/jql":
+            return self._send_json(self._search(query, base_url))
+
+        batch = BATCH_PATH.match(url.path)
+        if batch and batch.group(1) in self.server.state.batches:
+            return self._send_json(self.server.state.batches[batch.group(1)])
+
+        file_content = FILE_CONTENT_PATH.match(url.path)
+        if file_content and file_content.group(1) in self.server.state.files:
+            return self._send(200, self.server.state.files[file_content.group(1)], content_type="application/jsonl")
+
+        self._send_json({"errorMessages": [f"No mock for {url.path}"]}, status=404)
+
+    def _issue(self, n: int, query: dict, base_url: str) -> dict:
+        return _project(_issue(n, base_url, self.server.state.updated(n)), query.get("fields"))
+
+    def _search(self, query: dict, base_url: str) -> dict:
+        """
+        Token-paginated JQL search: `key in (...)` lookups (epics included), otherwise the sprint query
+        """
+        jql = query.get("jql", "")
+        keys = KEY_IN_JQL.search(jql)
+        if keys:
+            epics = [_project(_epic(key.strip(), base_url), query.get("fields"))
+                     for key in keys.group(1).split(",") if key.strip().startswith("EPIC-")]
+            issues = [self._issue(n, query, base_url) for n in self.server.state.matching(jql)]
+            return {"issues": epics + issues, "isLast": True}
+
+        numbers = self.server.state.matching(jql)
+        start_at = int(query.get("nextPageToken", 0))
+        max_results = min(int(query.get("maxResults", 50)), 100)
+        end = min(len(numbers), start_at + max_results)
+        page = {"issues": [self._issue(n, query, base_url) for n in numbers[start_at:end]],
+                "isLast": end >= len(numbers)}
+        if end < len(numbers):
+            page["nextPageToken"] = str(end)
+        return page
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        path = urlparse(self.path).path
+
+        if path not in ("/v1/chat/completions", "/v1/files", "/v1/batches"):
+            return self._send_json({"error": {"message": "not found"}}, status=404)
+
+        if self._throttle():
+            return
+
+        if path == "/v1/files":
+            return self._send_json(self._upload(body))
+
+        if path == "/v1/batches":
+            return self._send_json(self._run_batch(json.loads(body)))
+
+        with self.server.state.lock:
+            self.server.state.llm_requests += 1
+
+        request = json.loads(body)
+        completion, content, usage = self._completion(request)
+
+        if request.get("stream"):
+            return self._send_stream(request["model"], content, usage, completion["choices"][0]["finish_reason"])
+
+        self._send_json(completion)
+
+    def _completion(self, request: dict) -> tuple:
+        prompt = request["messages"][-1]["content"]
+        content = self._changelog(PROMPT_KEY.findall(prompt))
+        # Cut the reply off at max_tokens (~4 characters each) like the real API
+        finish_reason = "stop"
+        max_chars = request.get("max_tokens", 0) * 4
+        if max_chars and len(content) > max_chars:
+            content, finish_reason = content[:max_chars], "length"
+        usage = {"prompt_tokens": len(prompt) // 4, "completion_tokens": len(content) // 4,
+                 "total_tokens": (len(prompt) + len(content)) // 4}
+        completion = {
+            "id": "chatcmpl-bench",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request["model"],
+            "choices": [{"index": 0, "finish_reason": finish_reason,
+                         "message": {"role": "assistant", "content": content}}],
+            "usage": usage,
+        }
+        return completion, content, usage
+
+    def _store_file(self, data: bytes, filename: str, purpose: str) -> dict:
+        state = self.server.state
+        with state.lock:
+            file_id = f"file-bench-{len(state.files) + 1}"
+            state.files[file_id] = data
+        return {"id": file_id, "object": "file", "bytes": len(data), "created_at": int(time.time()),
+                "filename": filename, "purpose": purpose, "status": "processed"}
+
+    def _upload(self, body: bytes) -> dict:
+        """
+        Accept a multipart/form-data file upload as the Files API does
+        """
+        message = BytesParser(policy=HTTP).parsebytes(
+            f"Content-Type: {self.headers['Content-Type']}\r\n\r\n".encode("utf-8") + body)
+        fields = {part.get_param("name", header="content-disposition"): part for part in message.iter_parts()}
+        upload = fields["file"]
+        purpose = fields["purpose"].get_content().strip() if "purpose" in fields else "batch"
+        return self._store_file(upload.get_payload(decode=True), upload.get_filename() or "upload.jsonl", purpose)
+
+    def _run_batch(self, request: dict) -> dict:
+        """
+        Answer every request of an uploaded batch input file at once; the batch is born completed
+        """
+        state = self.server.state
+        lines = [json.loads(line) for line in state.files[request["input_file_id"]].splitlines() if line.strip()]
+
+        results = []
+        for n, line in enumerate(lines, 1):
+            completion, _, _ = self._completion(line["body"])
+            results.append({"id": f"batch_req_{n}", "custom_id": line["custom_id"], "error": None,
+                            "response": {"status_code": 200, "request_id": f"req_{n}", "body": completion}})
+        with state.lock:
+            state.llm_requests += len(lines)
+
+        output = "".join(json.dumps(result) + "\n" for result in results).encode("utf-8")
+        output_file = self._store_file(output, "batch_output.jsonl", "batch_output")
+        now = int(time.time())
+
+        with state.lock:
+            batch_id = f"batch_bench_{len(state.batches) + 1}"
+            state.batches[batch_id] = {
+                "id": batch_id, "object": "batch", "endpoint": request["endpoint"], "errors": None,
+                "input_file_id": request["input_file_id"], "completion_window": request["completion_window"],
+                "status": "completed", "output_file_id": output_file["id"], "error_file_id": None,
+                "created_at": now, "in_progress_at": now, "finalizing_at": now, "completed_at": now,
+                "request_counts": {"total": len(lines), "completed": len(lines), "failed": 0},
+                "metadata": request.get("metadata"),
+            }
+            return state.batches[batch_id]
+
+    def _changelog(self, keys: list) -> str:
+        """
+        One JSON object per ticket, as generate_release_doc asks for
+        """
+        return "\n".join(
+            json.dumps({
+                "key": key,
+                "tags": ["Pipeline", "ML"],
+                "title": f"Synthetic change {key}",
+                "blurb": "Validates records before they reach the warehouse. "
+                         "Prevents malformed rows from breaking downstream jobs.",
+            })
+            for key in keys
+        ) + "\n"
+
+    def _send_stream(self, model: str, content: str, usage: dict, finish_reason: str = "stop"):
+        def event(delta: dict | None, with_usage: bool = False, finish: str | None = None) -> bytes:
+            chunk = {"id": "chatcmpl-bench", "object": "chat.completion.chunk", "created": int(time.time()),
+                     "model": model, "choices": [], "usage": usage if with_usage else None}
+            if delta is not None:
+                chunk["choices"] = [{"index": 0, "delta": delta, "finish_reason": finish}]
+            return f"data: {json.dumps(chunk)}\n\n".encode("utf-8")
+
+        pieces = [event({"role": "assistant", "content": ""})]
+        pieces.extend(event({"content": line + "\n"}) for line in content.split("\n"))
+        pieces.append(event({}, finish=finish_reason))
+        pieces.append(event(None, with_usage=True))
+        pieces.append(b"data: [DONE]\n\n")
+        self._send(200, b"".join(pieces), content_type="text/event-stream")
+
+
+class MockServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, state: MockState, port: int = 0):
+        super().__init__(("127.0.0.1", port), MockHandler)
+        self.state = state
+        self.base_url = f"http://127.0.0.1:{self.server_address[1]}"
+
+
+def start_mock_server(tickets: int, latency_ms: float = 0.0, throttle_rate: float = 0.0) -> MockServer:
+    """
+    Start a mock JIRA + OpenAI server on a free port in a background thread
+    """
+    server = MockServer(MockState(tickets, latency_ms, throttle_rate))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serve the mock JIRA + OpenAI endpoints until interrupted")
+    parser.add_argument("--tickets", type=int, default=200, help="Tickets in the synthetic sprint")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Added latency per request")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Share of requests answered with 429")
+    args = parser.parse_args()
+
+    server = start_mock_server(args.tickets, args.latency_ms, args.throttle_rate)
+    print(f"Mock server on {server.base_url}")
+    print(f"  JIRA_URL={server.base_url} OPENAI_BASE_URL={server.base_url}/v1 "
+          f"PROJECT_KEY={PROJECT_KEY} SPRINT_NAME='{TARGET_SPRINT}'")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""
+End-to-end benchmark of the JIRA -> release doc graph against local mock servers.
+
+Each sprint size runs in a fresh subprocess so peak RSS is per size, with the
+mock JIRA/OpenAI server in this process counting requests and bytes:
+
+    python -m benchmarks.run_benchmarks --sizes 10,100,1000,10000 --latency-ms 20 --throttle-rate 0.02
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent.absolute()
+
+# Tunables a caller's environment may override
+BENCH_DEFAULTS = {
+    "JIRA_CACHE_ENABLED": "false",
+    "LLM_CACHE_ENABLED": "false",
+    "JIRA_SPRINT_INDEX": "false",
+    "RETRY_BASE_DELAY": "0.05",
+    "LANGCHAIN_TRACING_V2": "false",
+    "CHECKPOINT_ENABLED": "false",
+}
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+# Heavy dependencies whose loading the startup path should defer
+HEAVY_MODULES = ("langgraph", "openai", "httpx")
+
+
+def run_child(result_path: str, async_mode: bool, fetch_only: bool):
+    """
+    Run the graph once in this process and write timing and peak RSS to result_path
+    """
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+    # CLI startup cost: everything `python main.py` imports before any node runs
+    import_start = time.perf_counter()
+    from main import build_initial_state, run_async, run_fetch_only
+    from ticket_store import ticket_count
+    import_seconds = time.perf_counter() - import_start
+    loaded_at_startup = [name for name in HEAVY_MODULES if name in sys.modules]
+
+    initial_state = build_initial_state()
+
+    start = time.perf_counter()
+    if fetch_only:
+        final_state = run_fetch_only(initial_state)
+    elif async_mode:
+        import asyncio
+        final_state = asyncio.run(run_async(initial_state, fresh=True))
+    else:
+        from graph import create_jira_graph
+        final_state = create_jira_graph().invoke(initial_state)
+    wall_seconds = time.perf_counter() - start
+
+    with open(result_path, "w") as f:
+        json.dump({
+            "status": final_state["status"],
+            "error": final_state.get("error"),
+            "tickets": ticket_count(final_state),
+            "import_seconds": import_seconds,
+            "loaded_at_startup": loaded_at_startup,
+            "loaded_at_exit": [name for name in HEAVY_MODULES if name in sys.modules],
+            "wall_seconds": wall_seconds,
+            "peak_rss_mb": _peak_rss_mb(),
+        }, f)
+
+
+def run_size(tickets: int, args) -> dict:
+    """
+    Start a mock server for one sprint size and benchmark a child run against it
+    """
+    from benchmarks.mock_servers import PROJECT_KEY, TARGET_SPRINT, start_mock_server
+
+    server = start_mock_server(tickets, args.latency_ms, args.throttle_rate)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = {**BENCH_DEFAULTS, **os.environ}
+        env.update({
+            "JIRA_URL": server.base_url,
+            "JIRA_API_KEY": "bench",
+            "JIRA_EMAIL": "bench@example.com",
+            "PROJECT_KEY": PROJECT_KEY,
+            "SPRINT_NAME": TARGET_SPRINT,
+            "OPENAI_API_KEY": "bench",
+            "OPENAI_BASE_URL": f"{server.base_url}/v1",
+            "CACHE_DIR": str(Path(tmp) / "cache"),
+        })
+        env.pop("BATCH_TARGETS_FILE", None)
+
+        result_path = str(Path(tmp) / "result.json")
+        command = [sys.executable, "-m", "benchmarks.run_benchmarks", "--child", result_path]
+        if args.async_mode:
+            command.append("--async")
+        if args.fetch_only:
+            command.append("--fetch-only")
+
+        output = None if args.verbose else subprocess.DEVNULL
+        subprocess.run(command, cwd=PROJECT_ROOT, env=env, stdout=output, check=True)
+
+        with open(result_path) as f:
+            result = json.load(f)
+
+    server.shutdown()
+    server.server_close()
+
+    state = server.state
+    return {
+        "size": tickets,
+        **result,
+        "requests": state.requests,
+        "llm_requests": state.llm_requests,
+        "throttled": state.throttled,
+        "bytes_sent": state.bytes_sent,
+    }
+
+
+def print_table(results: list):
+    print(f"{'tickets':>8} {'status':>8} {'wall s':>8} {'import s':>9} {'requests':>9} "
+          f"{'429s':>6} {'LLM calls':>10} {'MiB sent':>9} {'peak RSS MiB':>13}")
+    for result in results:
+        print(f"{result['size']:>8} {result['status']:>8} {result['wall_seconds']:>8.2f} "
+              f"{result['import_seconds']:>9.2f} {result['requests']:>9} {result['throttled']:>6} "
+              f"{result['llm_requests']:>10} {result['bytes_sent'] / (1024 * 1024):>9.2f} "
+              f"{result['peak_rss_mb']:>13.1f}")
+        if result["loaded_at_exit"]:
+            print(f"{'':>8} loaded {', '.join(result['loaded_at_exit'])} "
+                  f"({', '.join(result['loaded_at_startup']) or 'none'} at startup)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the release doc graph against mock servers")
+    parser.add_argument("--sizes", default="10,100,1000,10000", help="Comma-separated sprint sizes")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Added latency per mock request")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Share of requests answered with 429")
+    parser.add_argument("--async", dest="async_mode", action="store_true", help="Benchmark the async graph")
+    parser.add_argument("--fetch-only", action="store_true", help="Benchmark main.py --fetch-only (no LLM step)")
+    parser.add_argument("--output", help="Also write the results as JSON to this path")
+    parser.add_argument("--verbose", action="store_true", help="Show the pipeline's own output")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child, args.async_mode, args.fetch_only)
+        return
+
+    results = []
+    for size in (int(size) for size in args.sizes.split(",")):
+        print(f"⏱️  Benchmarking {size} tickets...")
+        results.append(run_size(size, args))
+
+    print()
+    print_table(results)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\n💾 Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
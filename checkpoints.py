@@ -0,0 +1,182 @@
+"""
+Persistent LangGraph checkpoints, so a failed or interrupted sprint run resumes
+from its last completed node and the release doc can be regenerated from
+stored tickets without fetching again.
+
+Uses langgraph-checkpoint-sqlite (and aiosqlite for async graphs), both listed
+requirements; installs without them run uncheckpointed, with a warning.
+"""
+
+import sqlite3
+from contextlib import asynccontextmanager, closing, contextmanager
+
+from config import CHECKPOINT_ENABLED, CHECKPOINT_DB
+from ticket_store import ticket_count
+
+MISSING_PACKAGE = ("⚠️  langgraph-checkpoint-sqlite or aiosqlite is not installed (pip install -r requirements.txt); "
+                   "runs will not be checkpointed")
+
+# Settings a resumed run takes from the current invocation, not the checkpoint
+CURRENT_FIELDS = ("jira_url", "email", "refresh_tickets")
+
+
+def _serializer():
+    """
+    Checkpoint serializer that may restore TicketRecord, the one custom type in state
+    """
+    from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+    return JsonPlusSerializer(allowed_msgpack_modules=[("state", "TicketRecord")])
+
+
+@contextmanager
+def open_checkpointer():
+    """
+    Yield a SQLite checkpointer for sync graphs, or None when checkpointing is off
+    """
+    if not CHECKPOINT_ENABLED:
+        yield None
+        return
+
+    try:
+        from langgraph.checkpoint.sqlite import SqliteSaver
+    except ImportError:
+        print(MISSING_PACKAGE)
+        yield None
+        return
+
+    CHECKPOINT_DB.parent.mkdir(parents=True, exist_ok=True)
+    with closing(sqlite3.connect(str(CHECKPOINT_DB), check_same_thread=False)) as conn:
+        yield SqliteSaver(conn, serde=_serializer())
+
+
+@asynccontextmanager
+async def open_async_checkpointer():
+    """
+    Yield a SQLite checkpointer for async graphs, or None when checkpointing is off
+    """
+    if not CHECKPOINT_ENABLED:
+        yield None
+        return
+
+    try:
+        import aiosqlite
+        from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+    except ImportError:
+        print(MISSING_PACKAGE)
+        yield None
+        return
+
+    CHECKPOINT_DB.parent.mkdir(parents=True, exist_ok=True)
+    async with aiosqlite.connect(str(CHECKPOINT_DB)) as conn:
+        yield AsyncSqliteSaver(conn, serde=_serializer())
+
+
+def thread_config(state) -> dict:
+    """
+    Checkpoint thread for a sprint target: one thread per project/board/sprint
+    """
+    thread_id = f"{state['project_key']}/{state.get('board_name') or '-'}/{state['sprint_name']}"
+    return {"configurable": {"thread_id": thread_id}}
+
+
+def _failed(values: dict) -> bool:
+    # Fetch failures set status "error"; generation and rendering failures only set error
+    return values.get("status") == "error" or bool(values.get("error"))
+
+
+def _needs_resume(latest) -> bool:
+    # A clean finish has nothing left to run; failures still run the graph to its end
+    return bool(latest.values) and (bool(latest.next) or _failed(latest.values))
+
+
+def _is_resume_point(snapshot) -> bool:
+    return bool(snapshot.next) and snapshot.metadata.get("source") == "loop" and not _failed(snapshot.values)
+
+
+def _is_generation_input(snapshot) -> bool:
+    # Records are in state, or in the columnar store's saved table with TICKET_STORE
+    return snapshot.next == ("generate_release_doc",) and ticket_count(snapshot.values) > 0
+
+
+def _thread_id(config: dict) -> str:
+    return config["configurable"]["thread_id"]
+
+
+def _current_settings(snapshot, initial_state) -> dict:
+    # Settings fixed since the failed run (e.g. a wrong JIRA_URL) apply to the resumed one
+    return {field: initial_state[field] for field in CURRENT_FIELDS
+            if field in initial_state and snapshot.values.get(field) != initial_state[field]}
+
+
+def _writer(parent) -> str:
+    # The update is recorded as coming from a node that produced the resume point, so the
+    # same nodes run next; parallel branches would otherwise make the writer ambiguous
+    return parent.next[-1] if parent is not None and parent.next else "__start__"
+
+
+def run_checkpointed(app, initial_state, fresh: bool = False):
+    """
+    Invoke the graph, resuming the sprint's last failed or interrupted run unless fresh
+    """
+    if app.checkpointer is None:
+        return app.invoke(initial_state)
+
+    config = thread_config(initial_state)
+
+    if not fresh and _needs_resume(app.get_state(config)):
+        resume = next((s for s in app.get_state_history(config) if _is_resume_point(s)), None)
+        if resume is not None:
+            print(f"♻️  Resuming '{_thread_id(config)}' at {', '.join(resume.next)}")
+            resume_config = resume.config
+            update = _current_settings(resume, initial_state)
+            if update:
+                parent = app.get_state(resume.parent_config) if resume.parent_config else None
+                resume_config = app.update_state(resume_config, update, as_node=_writer(parent))
+            return app.invoke(None, resume_config)
+
+    return app.invoke(initial_state, config)
+
+
+async def arun_checkpointed(app, initial_state, fresh: bool = False):
+    """
+    Async run_checkpointed, for graphs compiled with an async checkpointer
+    """
+    if app.checkpointer is None:
+        return await app.ainvoke(initial_state)
+
+    config = thread_config(initial_state)
+
+    if not fresh and _needs_resume(await app.aget_state(config)):
+        async for snapshot in app.aget_state_history(config):
+            if _is_resume_point(snapshot):
+                print(f"♻️  Resuming '{_thread_id(config)}' at {', '.join(snapshot.next)}")
+                resume_config = snapshot.config
+                update = _current_settings(snapshot, initial_state)
+                if update:
+                    parent = await app.aget_state(snapshot.parent_config) if snapshot.parent_config else None
+                    resume_config = await app.aupdate_state(resume_config, update, as_node=_writer(parent))
+                return await app.ainvoke(None, resume_config)
+
+    return await app.ainvoke(initial_state, config)
+
+
+def regenerate(app, initial_state):
+    """
+    Re-run only generation and rendering on the sprint's stored, already processed tickets
+    """
+    if app.checkpointer is None:
+        return {**initial_state, "status": "error", "error": "Regenerating needs checkpointing enabled"}
+
+    config = thread_config(initial_state)
+    stored = next((s for s in app.get_state_history(config) if _is_generation_input(s)), None)
+
+    if stored is None:
+        error = f"No stored tickets for '{_thread_id(config)}'; run it once without --regenerate"
+        print(f"❌ {error}")
+        return {**initial_state, "status": "error", "error": error}
+
+    print(f"♻️  Regenerating '{_thread_id(config)}' from {ticket_count(stored.values)} stored tickets")
+    regen_config = app.update_state(stored.config, {"release_entries": [], "release_doc_path": None},
+                                    as_node="process_tickets")
+    return app.invoke(None, regen_config)
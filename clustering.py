@@ -0,0 +1,147 @@
+"""
+Local near-duplicate clustering of tickets before release doc generation.
+
+Tickets are first grouped by the component tags parsed from their summaries
+(e.g. "[JAMS] [ML] ..."). Within a component, MinHash signatures over word
+shingles find candidate pairs via LSH banding, and a TF-IDF cosine check on
+the normalized summary and description confirms them. Each resulting
+cluster becomes one prompt unit that yields a single change log entry.
+
+Pure Python, so no numpy or scikit-learn dependency is needed.
+"""
+
+import hashlib
+import math
+import re
+from collections import Counter, defaultdict
+
+from state import TicketRecord
+
+TAG_PREFIX = re.compile(r"^\s*((?:\[[^\]]+\]\s*)+)")
+TAG = re.compile(r"\[([^\]]+)\]")
+WORD = re.compile(r"[a-z0-9]+")
+
+# 16 bands of 2 rows: pairs with a shingle Jaccard of ~0.25 or more become candidates
+NUM_PERM = 32
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+# Each bucket member is only paired with the next few, so template-heavy sprints stay linear
+CANDIDATE_WINDOW = 8
+# Only the start of a description is compared, like the truncated prompt text
+DESCRIPTION_WORDS = 80
+
+
+
+def parse_tags(summary: str) -> tuple[list, str]:
+    """
+    Split leading "[Tag]" markers off a summary: (tags, remaining title)
+    """
+    match = TAG_PREFIX.match(summary or "")
+    if not match:
+        return [], (summary or "").strip()
+    return [tag.strip() for tag in TAG.findall(match.group(1))], summary[match.end():].strip()
+
+
+def component(record: TicketRecord) -> tuple:
+    return tuple(sorted({tag.lower() for tag in parse_tags(record.summary)[0]}))
+
+
+def _tokens(record: TicketRecord) -> list:
+    # The title counts twice so a long shared description template does not dominate
+    title = parse_tags(record.summary)[1].lower()
+    return WORD.findall(title) * 2 + WORD.findall(record.description.lower())[:DESCRIPTION_WORDS]
+
+
+def _shingles(tokens: list) -> set:
+    if len(tokens) < 2:
+        return set(tokens)
+    return {f"{a} {b}" for a, b in zip(tokens, tokens[1:])}
+
+
+def _signature(shingles: set) -> tuple:
+    """
+    MinHash signature: one SHAKE-128 digest per shingle supplies NUM_PERM
+    independent 32-bit hashes, and the column-wise minimum is taken in C
+    """
+    rows = [memoryview(hashlib.shake_128(s.encode("utf-8")).digest(NUM_PERM * 4)).cast("I")
+            for s in shingles or {""}]
+    return tuple(map(min, zip(*rows)))
+
+
+def _tfidf(token_lists: list) -> list:
+    """
+    L2-normalized sparse TF-IDF vectors (term -> weight) for each token list
+    """
+    document_frequency = Counter(term for tokens in token_lists for term in set(tokens))
+    n = len(token_lists)
+    vectors = []
+    for tokens in token_lists:
+        counts = Counter(tokens)
+        vector = {term: (1 + math.log(count)) * (math.log((1 + n) / (1 + document_frequency[term])) + 1)
+                  for term, count in counts.items()}
+        norm = math.sqrt(sum(weight * weight for weight in vector.values())) or 1.0
+        vectors.append({term: weight / norm for term, weight in vector.items()})
+    return vectors
+
+
+def _cosine(a: dict, b: dict) -> float:
+    return sum(a[term] * b[term] for term in a.keys() & b.keys())
+
+
+def cluster_records(records: list, threshold: float, max_size: int) -> list:
+    """
+    Group records into prompt units of near-duplicate tickets from the same component.
+
+    Returns lists of records, ordered by component (in order of first
+    appearance) and then by each unit's first ticket. No unit grows past
+    max_size tickets.
+    """
+    if not records:
+        return []
+
+    token_lists = [_tokens(record) for record in records]
+    vectors = _tfidf(token_lists)
+    components = [component(record) for record in records]
+
+    # LSH buckets are scoped to a component, so tickets only cluster with their own component
+    buckets = defaultdict(list)
+    for idx, tokens in enumerate(token_lists):
+        signature = _signature(_shingles(tokens))
+        for band in range(BANDS):
+            buckets[(components[idx], band, signature[band * ROWS:(band + 1) * ROWS])].append(idx)
+
+    candidates = set()
+    for members in buckets.values():
+        for i, a in enumerate(members):
+            for b in members[i + 1:i + 1 + CANDIDATE_WINDOW]:
+                candidates.add((a, b))
+
+    parent = list(range(len(records)))
+    size = [1] * len(records)
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    # Most similar pairs merge first, so the size cap keeps the strongest links
+    scored = sorted(((_cosine(vectors[a], vectors[b]), a, b) for a, b in candidates), reverse=True)
+    for similarity, a, b in scored:
+        if similarity < threshold:
+            break
+        root_a, root_b = find(a), find(b)
+        if root_a != root_b and size[root_a] + size[root_b] <= max_size:
+            parent[root_b] = root_a
+            size[root_a] += size[root_b]
+
+    units = defaultdict(list)
+    for idx in range(len(records)):
+        units[find(idx)].append(idx)
+
+    component_order = {}
+    for name in components:
+        component_order.setdefault(name, len(component_order))
+
+    ordered = sorted(units.values(), key=lambda members: (component_order[components[members[0]]], members[0]))
+    return [[records[idx] for idx in members] for members in ordered]
@@ -4,6 +4,7 @@ Loads from .env file
 """
 
 import os
+from pathlib import Path
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -14,9 +15,109 @@ JIRA_URL = os.getenv("JIRA_URL")
 API_KEY = os.getenv("JIRA_API_KEY")
 EMAIL = os.getenv("JIRA_EMAIL")
 SPRINT_NAME = os.getenv("SPRINT_NAME")
+PROJECT_KEY = os.getenv("PROJECT_KEY", "SPARK")
+BOARD_NAME = os.getenv("BOARD_NAME")  # Defaults to the project's first board
+
+# Batch mode: JSON list of {"project", "board", "sprint"} targets
+BATCH_TARGETS_FILE = os.getenv("BATCH_TARGETS_FILE")
+BATCH_WORKERS = int(os.getenv("BATCH_WORKERS", "4"))
+
+# JIRA fetch tuning
+JIRA_PAGE_SIZE = int(os.getenv("JIRA_PAGE_SIZE", "100"))
+JIRA_FETCH_WORKERS = int(os.getenv("JIRA_FETCH_WORKERS", "4"))
+JIRA_POOL_SIZE = int(os.getenv("JIRA_POOL_SIZE", str(max(10, JIRA_FETCH_WORKERS))))
+JIRA_TIMEOUT = float(os.getenv("JIRA_TIMEOUT", "30"))
+JIRA_SPRINT_STATES = [s.strip() for s in os.getenv("JIRA_SPRINT_STATES", "active,future,closed").split(",") if s.strip()]
+JIRA_SPRINT_PAGE_SIZE = int(os.getenv("JIRA_SPRINT_PAGE_SIZE", "50"))
+JIRA_SPRINT_INDEX = os.getenv("JIRA_SPRINT_INDEX", "true").lower() == "true"
+# Fields fetched per issue: console (everything printed), release_doc (lean) or json (full payloads)
+JIRA_FIELD_PROFILE = os.getenv("JIRA_FIELD_PROFILE", "console")
+
+# Ticket fetch mode: agile (sprint issue endpoint, Stories only) or search (JQL search with nextPageToken)
+JIRA_FETCH_MODE = os.getenv("JIRA_FETCH_MODE", "agile").lower()
+# Search-mode JQL; {sprint_id}, {sprint_name} and {project} are filled in per target
+JIRA_JQL = os.getenv("JIRA_JQL", "sprint = {sprint_id} ORDER BY Rank ASC")
+# Related issues resolved in batched key lookups in search mode: parent, epic, links
+JIRA_RELATED = [r.strip() for r in os.getenv("JIRA_RELATED", "parent,epic,links").split(",") if r.strip()]
+JIRA_EPIC_LINK_FIELD = os.getenv("JIRA_EPIC_LINK_FIELD")  # e.g. customfield_10014 on company-managed projects
+JIRA_KEY_BATCH_SIZE = int(os.getenv("JIRA_KEY_BATCH_SIZE", "100"))
+JIRA_EXPAND_CHANGELOG = os.getenv("JIRA_EXPAND_CHANGELOG", "false").lower() == "true"
+
+# Rate limiting and retries (shared by JIRA and OpenAI calls)
+JIRA_REQUESTS_PER_SECOND = float(os.getenv("JIRA_REQUESTS_PER_SECOND", "10"))
+JIRA_MAX_RETRIES = int(os.getenv("JIRA_MAX_RETRIES", "5"))
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "5"))
+RETRY_BASE_DELAY = float(os.getenv("RETRY_BASE_DELAY", "1.0"))
+RETRY_MAX_DELAY = float(os.getenv("RETRY_MAX_DELAY", "60"))
+
+# Run the fetch nodes on asyncio/httpx via ainvoke
+ASYNC_MODE = os.getenv("ASYNC_MODE", "false").lower() == "true"
+
+# JIRA response cache
+CACHE_DIR = Path(os.getenv("CACHE_DIR", Path(__file__).parent.absolute() / ".cache"))
+JIRA_CACHE_ENABLED = os.getenv("JIRA_CACHE_ENABLED", "true").lower() == "true"
+JIRA_CACHE_MAX_MB = int(os.getenv("JIRA_CACHE_MAX_MB", "200"))
+JIRA_CACHE_TTL = int(os.getenv("JIRA_CACHE_TTL")) if os.getenv("JIRA_CACHE_TTL") else None
+JIRA_OFFLINE = os.getenv("JIRA_OFFLINE", "false").lower() == "true"
+
+# Keep raw JIRA payloads in state after normalization (the NDJSON export no longer needs them)
+KEEP_RAW_TICKETS = os.getenv("KEEP_RAW_TICKETS", "false").lower() == "true"
+
+# Keep normalized tickets in a columnar store referenced from state instead of a records list
+TICKET_STORE = os.getenv("TICKET_STORE", "false").lower() == "true"
+
+# Streaming NDJSON ticket export to docs/
+JIRA_EXPORT = os.getenv("JIRA_EXPORT", "true").lower() == "true"
+JIRA_EXPORT_COMPRESSION = os.getenv("JIRA_EXPORT_COMPRESSION", "none").lower()  # none, gzip or zstd
+
+# Incremental ticket sync
+JIRA_INCREMENTAL = os.getenv("JIRA_INCREMENTAL", "false").lower() == "true"
 
 # OpenAI Configuration
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o")
+OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL")  # None uses the OpenAI default
+
+# Release doc generation
+RELEASE_DOC_CHUNKED = os.getenv("RELEASE_DOC_CHUNKED", "false").lower() == "true"
+LLM_BATCH_TOKENS = int(os.getenv("LLM_BATCH_TOKENS", "6000"))
+LLM_PARALLELISM = int(os.getenv("LLM_PARALLELISM", "4"))
+LLM_REQUESTS_PER_MINUTE = int(os.getenv("LLM_REQUESTS_PER_MINUTE", "60"))
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+LLM_CACHE_MAX_MB = int(os.getenv("LLM_CACHE_MAX_MB", "50"))
+RELEASE_DOC_STREAM = os.getenv("RELEASE_DOC_STREAM", "false").lower() == "true"
+# Group near-duplicate tickets of the same component into one prompt unit and entry
+TICKET_CLUSTERING = os.getenv("TICKET_CLUSTERING", "false").lower() == "true"
+CLUSTER_SIMILARITY = float(os.getenv("CLUSTER_SIMILARITY", "0.5"))
+CLUSTER_MAX_SIZE = int(os.getenv("CLUSTER_MAX_SIZE", "6"))
+# Formats rendered locally from one generation pass: markdown, html, confluence, json
+RELEASE_DOC_FORMATS = [
+    fmt.strip() for fmt in os.getenv("RELEASE_DOC_FORMATS", "markdown,html,confluence,json").split(",") if fmt.strip()
+]
+
+# Deferred generation through the OpenAI Batch API (submitted at the end of a run, collected later)
+OPENAI_BATCH_MODE = os.getenv("OPENAI_BATCH_MODE", "false").lower() == "true"
+OPENAI_BATCH_WINDOW = os.getenv("OPENAI_BATCH_WINDOW", "24h")
+OPENAI_BATCH_POLL_SECONDS = float(os.getenv("OPENAI_BATCH_POLL_SECONDS", "60"))
+
+# Token budgeting (exact counts need the optional tiktoken package)
+LLM_CONTEXT_TOKENS = int(os.getenv("LLM_CONTEXT_TOKENS", "128000"))
+LLM_MAX_OUTPUT_TOKENS = int(os.getenv("LLM_MAX_OUTPUT_TOKENS", "16000"))
+LLM_TOKENS_PER_ENTRY = int(os.getenv("LLM_TOKENS_PER_ENTRY", "200"))
+LLM_DESCRIPTION_TOKENS = int(os.getenv("LLM_DESCRIPTION_TOKENS", "500"))
+
+# Watch mode: poll interval and optional local JIRA webhook endpoint (port 0 disables it)
+WATCH_INTERVAL = float(os.getenv("WATCH_INTERVAL", "60"))
+WATCH_WEBHOOK_HOST = os.getenv("WATCH_WEBHOOK_HOST", "127.0.0.1")
+WATCH_WEBHOOK_PORT = int(os.getenv("WATCH_WEBHOOK_PORT", "0"))
+WATCH_WEBHOOK_SECRET = os.getenv("WATCH_WEBHOOK_SECRET")
+
+# Resumable runs (needs the optional langgraph-checkpoint-sqlite package)
+CHECKPOINT_ENABLED = os.getenv("CHECKPOINT_ENABLED", "true").lower() == "true"
+CHECKPOINT_DB = Path(os.getenv("CHECKPOINT_DB", CACHE_DIR / "checkpoints.sqlite"))
+
+# Per-node metrics in state and docs/metrics.json + docs/metrics.prom
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
 
 # LangSmith Configuration (Optional - for tracing)
 LANGCHAIN_TRACING_V2 = os.getenv("LANGCHAIN_TRACING_V2", "false")
@@ -31,19 +132,38 @@ if LANGCHAIN_TRACING_V2.lower() == "true":
     if LANGCHAIN_PROJECT:
         os.environ["LANGCHAIN_PROJECT"] = LANGCHAIN_PROJECT
 
-# Validate required environment variables
-required_vars = {
-    "JIRA_URL": JIRA_URL,
-    "JIRA_API_KEY": API_KEY,
-    "JIRA_EMAIL": EMAIL,
-    "SPRINT_NAME": SPRINT_NAME,
-    "OPENAI_API_KEY": OPENAI_API_KEY,
+# Environment variables each pipeline stage needs
+STAGE_REQUIREMENTS = {
+    "fetch": {
+        "JIRA_URL": JIRA_URL,
+        "JIRA_API_KEY": API_KEY,
+        "JIRA_EMAIL": EMAIL,
+        # Batch mode takes sprint names from the targets file instead
+        "SPRINT_NAME": SPRINT_NAME or BATCH_TARGETS_FILE,
+    },
+    "generate": {
+        "SPRINT_NAME": SPRINT_NAME or BATCH_TARGETS_FILE,
+        "OPENAI_API_KEY": OPENAI_API_KEY,
+    },
 }
 
-missing_vars = [var for var, value in required_vars.items() if not value]
-if missing_vars:
-    raise ValueError(
-        f"Missing required environment variables: {', '.join(missing_vars)}\n"
-        f"Please create a .env file with all required variables. "
-        f"See .env.example for template."
-    )
+
+def validate_config(*stages: str):
+    """
+    Raise if an environment variable needed by the selected stages is missing.
+
+    Called by the entry point once it knows which stages will run, so
+    fetch-only runs do not need an OpenAI key.
+    """
+    missing_vars = []
+    for stage in stages or tuple(STAGE_REQUIREMENTS):
+        for var, value in STAGE_REQUIREMENTS[stage].items():
+            if not value and var not in missing_vars:
+                missing_vars.append(var)
+
+    if missing_vars:
+        raise ValueError(
+            f"Missing required environment variables: {', '.join(missing_vars)}\n"
+            f"Please create a .env file with all required variables. "
+            f"See .env.example for template."
+        )
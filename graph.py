@@ -4,38 +4,75 @@ LangGraph workflow creation
 
 from langgraph.graph import StateGraph, START, END
 from state import JiraState
+from metrics import instrument
+from config import METRICS_ENABLED
 from nodes import (
     fetch_user_info,
     fetch_sprints,
     fetch_tickets_agile,
+    fetch_tickets_search,
+    normalize_tickets,
     process_tickets,
-    generate_release_doc
+    generate_release_doc,
+    render_release_docs,
+    TICKET_FETCH_NODE,
 )
 
 
-def create_jira_graph():
+def create_jira_graph(async_mode: bool = False, checkpointer=None):
     """
-    Create the LangGraph workflow for fetching JIRA tickets
+    Create the LangGraph workflow for fetching JIRA tickets.
+
+    With async_mode the fetch nodes use httpx and the graph must be run with
+    ainvoke; the user-info check then runs in parallel with the sprint lookup.
+    A checkpointer (see checkpoints.py) makes runs resumable per sprint.
+    JIRA_FETCH_MODE=search swaps the sprint issue fetch for the JQL search
+    node, which LangGraph runs in a worker thread under ainvoke.
     """
     # Initialize the graph
     workflow = StateGraph(JiraState)
 
+    def add_node(name, node):
+        workflow.add_node(name, instrument(name, node) if METRICS_ENABLED else node)
+
     # Add nodes
-    workflow.add_node("fetch_user_info", fetch_user_info)
-    workflow.add_node("fetch_sprints", fetch_sprints)
-    workflow.add_node("fetch_tickets_agile", fetch_tickets_agile)
-    workflow.add_node("process_tickets", process_tickets)
-    workflow.add_node("generate_release_doc", generate_release_doc)
+    if async_mode:
+        # httpx is only needed for async runs
+        from nodes.async_fetch import afetch_user_info, afetch_sprints, afetch_tickets_agile
+
+        add_node("fetch_user_info", afetch_user_info)
+        add_node("fetch_sprints", afetch_sprints)
+        if TICKET_FETCH_NODE == "fetch_tickets_agile":
+            add_node("fetch_tickets_agile", afetch_tickets_agile)
+    else:
+        add_node("fetch_user_info", fetch_user_info)
+        add_node("fetch_sprints", fetch_sprints)
+        if TICKET_FETCH_NODE == "fetch_tickets_agile":
+            add_node("fetch_tickets_agile", fetch_tickets_agile)
+    if TICKET_FETCH_NODE == "fetch_tickets_search":
+        add_node("fetch_tickets_search", fetch_tickets_search)
+    add_node("normalize_tickets", normalize_tickets)
+    add_node("process_tickets", process_tickets)
+    add_node("generate_release_doc", generate_release_doc)
+    add_node("render_release_docs", render_release_docs)
 
     # Add edges
-    workflow.add_edge(START, "fetch_user_info")
-    workflow.add_edge("fetch_user_info", "fetch_sprints")
-    workflow.add_edge("fetch_sprints", "fetch_tickets_agile")
-    workflow.add_edge("fetch_tickets_agile", "process_tickets")
+    if async_mode:
+        # Auth check and sprint lookup are independent; tickets wait for both
+        workflow.add_edge(START, "fetch_user_info")
+        workflow.add_edge(START, "fetch_sprints")
+        workflow.add_edge(["fetch_user_info", "fetch_sprints"], TICKET_FETCH_NODE)
+    else:
+        workflow.add_edge(START, "fetch_user_info")
+        workflow.add_edge("fetch_user_info", "fetch_sprints")
+        workflow.add_edge("fetch_sprints", TICKET_FETCH_NODE)
+    workflow.add_edge(TICKET_FETCH_NODE, "normalize_tickets")
+    workflow.add_edge("normalize_tickets", "process_tickets")
     workflow.add_edge("process_tickets", "generate_release_doc")
-    workflow.add_edge("generate_release_doc", END)
+    workflow.add_edge("generate_release_doc", "render_release_docs")
+    workflow.add_edge("render_release_docs", END)
 
     # Compile the graph
-    app = workflow.compile()
+    app = workflow.compile(checkpointer=checkpointer)
 
     return app
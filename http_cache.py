@@ -0,0 +1,170 @@
+"""
+Persistent on-disk cache for JIRA GET responses
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# Seconds a cached response is served without revalidation, by endpoint
+ENDPOINT_TTLS = [
+    (re.compile(r"/rest/api/3/myself$"), 3600),
+    (re.compile(r"/rest/agile/1.0/board$"), 86400),
+    (re.compile(r"/rest/agile/1.0/board/\d+/sprint$"), 600),
+    (re.compile(r"/rest/agile/1.0/sprint/\d+/issue$"), 300),
+]
+
+# Response headers worth keeping alongside the body
+KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+class ResponseCache:
+    """
+    Gzip-compressed response store keyed by URL and params, evicted LRU by size
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int, ttl_override: int | None = None):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.ttl_override = ttl_override
+        self._lock = threading.Lock()
+        self._total_bytes = None
+
+    @staticmethod
+    def make_key(url: str, params: dict | None, identity: str) -> str:
+        """
+        Stable key for a request: URL, sorted params and the calling user
+        """
+        canonical = json.dumps([url, sorted((params or {}).items()), identity], default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json.gz"
+
+    def ttl_for(self, url: str) -> int:
+        """
+        TTL in seconds for the endpoint behind this URL
+        """
+        if self.ttl_override is not None:
+            return self.ttl_override
+        path = url.split("?", 1)[0]
+        for pattern, ttl in ENDPOINT_TTLS:
+            if pattern.search(path):
+                return ttl
+        return 0
+
+    def load(self, key: str) -> dict | None:
+        """
+        Return the cached entry for a key, marking it recently used
+        """
+        path = self._path(key)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        # mtime doubles as the LRU clock
+        os.utime(path)
+        return entry
+
+    def is_fresh(self, entry: dict) -> bool:
+        return time.time() - entry["stored_at"] < self.ttl_for(entry["url"])
+
+    @staticmethod
+    def conditional_headers(entry: dict | None) -> dict:
+        """
+        If-None-Match / If-Modified-Since headers for revalidating an entry
+        """
+        if not entry:
+            return {}
+        headers = {}
+        cached_headers = entry.get("headers", {})
+        if cached_headers.get("ETag"):
+            headers["If-None-Match"] = cached_headers["ETag"]
+        if cached_headers.get("Last-Modified"):
+            headers["If-Modified-Since"] = cached_headers["Last-Modified"]
+        return headers
+
+    def store(self, key: str, url: str, response: requests.Response):
+        """
+        Compress and persist a 200 response, then evict down to the size cap
+        """
+        entry = {
+            "url": url,
+            "stored_at": time.time(),
+            "headers": {name: response.headers[name] for name in KEPT_HEADERS if name in response.headers},
+            "body": response.text,
+        }
+        self._write(key, entry)
+
+    def refresh(self, key: str, entry: dict):
+        """
+        Restart the TTL of an entry after a 304 Not Modified
+        """
+        entry["stored_at"] = time.time()
+        self._write(key, entry)
+
+    def _write(self, key: str, entry: dict):
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".tmp{threading.get_ident()}")
+
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump(entry, f)
+
+        with self._lock:
+            old_size = path.stat().st_size if path.exists() else 0
+            os.replace(tmp_path, path)
+            if self._total_bytes is None:
+                self._total_bytes = sum(p.stat().st_size for p in self.cache_dir.glob("*.json.gz"))
+            else:
+                self._total_bytes += path.stat().st_size - old_size
+
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        """
+        Drop least recently used entries until under the size cap (lock held)
+        """
+        entries = sorted(
+            ((p.stat().st_mtime, p.stat().st_size, p) for p in self.cache_dir.glob("*.json.gz")),
+        )
+        total = sum(size for _, size, _ in entries)
+
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+        self._total_bytes = total
+
+
+def build_response(entry: dict | None, url: str, status_code: int = 200) -> requests.Response:
+    """
+    Build a requests.Response served from the cache (or a 504 miss when offline)
+    """
+    response = requests.Response()
+    response.url = url
+    response.status_code = status_code
+    response.encoding = "utf-8"
+
+    if entry is not None:
+        response.headers = CaseInsensitiveDict(entry.get("headers", {}))
+        response._content = entry["body"].encode("utf-8")
+    else:
+        response.reason = "Gateway Timeout"
+        response._content = b"Not available in offline cache"
+
+    response.from_cache = True
+    return response
@@ -0,0 +1,206 @@
+"""
+Shared JIRA HTTP client used by all fetch nodes
+"""
+
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config import (
+    API_KEY,
+    JIRA_POOL_SIZE,
+    JIRA_TIMEOUT,
+    CACHE_DIR,
+    JIRA_CACHE_ENABLED,
+    JIRA_CACHE_MAX_MB,
+    JIRA_CACHE_TTL,
+    JIRA_OFFLINE,
+    JIRA_REQUESTS_PER_SECOND,
+    JIRA_MAX_RETRIES,
+)
+from http_cache import ResponseCache, build_response
+from rate_limiter import RETRY_STATUSES, backoff_delay, get_limiter, retry_after_seconds
+
+
+class JiraClient:
+    """
+    Keep-alive JIRA client with a pooled session and shared auth/headers
+    """
+
+    def __init__(self, jira_url: str, email: str, api_key: str):
+        self.base_url = jira_url.rstrip('/')
+        self.email = email
+
+        self.session = requests.Session()
+        self.session.auth = (email, api_key)
+        self.session.headers.update({
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip, deflate",
+        })
+
+        # One host, so one pool sized for the parallel page fetcher
+        self.adapter = HTTPAdapter(pool_connections=1, pool_maxsize=JIRA_POOL_SIZE)
+        self.session.mount("https://", self.adapter)
+        self.session.mount("http://", self.adapter)
+
+        self.cache = None
+        if JIRA_CACHE_ENABLED or JIRA_OFFLINE:
+            self.cache = ResponseCache(CACHE_DIR / "jira", JIRA_CACHE_MAX_MB * 1024 * 1024, JIRA_CACHE_TTL)
+
+        # Shared across clients so batch runs respect one JIRA budget
+        self.limiter = get_limiter("JIRA", JIRA_REQUESTS_PER_SECOND, JIRA_POOL_SIZE)
+
+        self._lock = threading.Lock()
+        self.request_count = 0
+        self.retries = 0
+        self.cache_hits = 0
+        self.bytes_received = 0
+        self.total_seconds = 0.0
+
+    def get(self, path: str, params: dict | None = None, use_cache: bool = True) -> requests.Response:
+        """
+        GET a JIRA REST path (or absolute URL) and report its timing
+        """
+        url = path if path.startswith("http") else f"{self.base_url}{path}"
+
+        start = time.perf_counter()
+        if self.cache and (use_cache or JIRA_OFFLINE):
+            response = self._cached_get(url, params)
+        else:
+            response = self._network_get(url, params)
+        elapsed = time.perf_counter() - start
+
+        source = "cache" if getattr(response, "from_cache", False) else "network"
+        with self._lock:
+            self.total_seconds += elapsed
+            if source == "cache":
+                self.cache_hits += 1
+
+        print(f"   ⏱️  GET {path} -> {response.status_code} in {elapsed * 1000:.0f} ms ({source})")
+        return response
+
+    def _network_get(self, url: str, params: dict | None, headers: dict | None = None) -> requests.Response:
+        """
+        Rate-limited GET, retrying 429/5xx and connection errors with jittered backoff
+        """
+        attempt = 0
+        while True:
+            self.limiter.acquire()
+            try:
+                response = self.session.get(url, params=params, headers=headers, timeout=JIRA_TIMEOUT)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt >= JIRA_MAX_RETRIES:
+                    raise
+                delay = backoff_delay(attempt)
+                print(f"   🔁 {type(e).__name__} on {url}, retrying in {delay:.1f}s")
+                response = None
+            finally:
+                self.limiter.release()
+
+            if response is not None:
+                with self._lock:
+                    self.request_count += 1
+                    self.bytes_received += len(response.content)
+
+                if response.status_code not in RETRY_STATUSES or attempt >= JIRA_MAX_RETRIES:
+                    self.limiter.on_success(response.headers)
+                    return response
+
+                delay = backoff_delay(attempt, retry_after_seconds(response.headers))
+                print(f"   🔁 {response.status_code} on {url}, retrying in {delay:.1f}s")
+
+            with self._lock:
+                self.retries += 1
+            attempt += 1
+
+            if response is not None and response.status_code == 429:
+                # The limiter pause makes every worker wait, not just this one
+                self.limiter.on_throttle(delay)
+            else:
+                time.sleep(delay)
+
+    def _cached_get(self, url: str, params: dict | None) -> requests.Response:
+        """
+        Serve from the disk cache when fresh, otherwise revalidate or refetch
+        """
+        key = self.cache.make_key(url, params, self.email)
+        entry = self.cache.load(key)
+
+        if entry is not None and (JIRA_OFFLINE or self.cache.is_fresh(entry)):
+            return build_response(entry, url)
+
+        if JIRA_OFFLINE:
+            return build_response(None, url, status_code=504)
+
+        response = self._network_get(url, params, self.cache.conditional_headers(entry))
+
+        if response.status_code == 304 and entry is not None:
+            self.cache.refresh(key, entry)
+            return build_response(entry, url)
+
+        if response.status_code == 200:
+            self.cache.store(key, url, response)
+
+        return response
+
+    def connection_count(self) -> int:
+        """
+        Number of TCP/TLS connections opened by the pool so far
+        """
+        pools = self.adapter.poolmanager.pools
+        return sum(pools[key].num_connections for key in pools.keys())
+
+    def print_stats(self):
+        """
+        Print per-run request, connection and latency totals
+        """
+        print(f"🌐 JIRA client: {self.request_count} network requests over "
+              f"{self.connection_count()} connections, {self.retries} retries, {self.cache_hits} cache hits, "
+              f"{self.bytes_received / 1024:.1f} KiB received ({self.total_seconds:.2f}s total)")
+
+
+# Counters summed by client_totals()
+CLIENT_COUNTERS = ("request_count", "retries", "cache_hits", "bytes_received")
+
+_clients: dict[tuple[str, str, str], JiraClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_jira_client(state) -> JiraClient:
+    """
+    Return the shared client for the JIRA site and user in the given state.
+
+    The API key comes from config rather than state, so it is never checkpointed.
+    """
+    key = (state['jira_url'].rstrip('/'), state['email'], API_KEY)
+
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = JiraClient(*key)
+            _clients[key] = client
+
+    return client
+
+
+def client_totals() -> dict:
+    """
+    Request, retry, cache and byte counters summed over every client in this process
+    """
+    with _clients_lock:
+        clients = list(_clients.values())
+
+    return {name: sum(getattr(client, name) for client in clients) for name in CLIENT_COUNTERS}
+
+
+def print_client_stats():
+    """
+    Print stats for every client created in this process
+    """
+    with _clients_lock:
+        clients = list(_clients.values())
+
+    for client in clients:
+        client.print_stats()
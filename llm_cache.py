@@ -0,0 +1,102 @@
+"""
+Content-addressed cache of generated change log entries
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+from state import TicketRecord
+
+
+class EntryCache:
+    """
+    Per-ticket generated entries keyed by ticket content, prompt version and model
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(ticket: TicketRecord, prompt_version: str, model: str) -> str:
+        """
+        Hash of the normalized ticket fields that influence the generated entry
+        """
+        normalized = {
+            "key": ticket.key,
+            "summary": " ".join(ticket.summary.split()),
+            "description": " ".join(ticket.description.split()),
+            "status": ticket.status,
+            "priority": ticket.priority,
+            "parent": ticket.parent,
+            "links": ticket.links,
+        }
+        payload = json.dumps([normalized, prompt_version, model], sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def make_unit_key(cls, tickets: list, prompt_version: str, model: str) -> str:
+        """
+        Key for a prompt unit; a single ticket keeps its per-ticket key
+        """
+        if len(tickets) == 1:
+            return cls.make_key(tickets[0], prompt_version, model)
+        member_keys = [cls.make_key(ticket, prompt_version, model) for ticket in tickets]
+        return hashlib.sha256(json.dumps(["unit", member_keys]).encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.txt"
+
+    def get(self, key: str) -> str | None:
+        """
+        Return the cached entry, counting the lookup as a hit or miss
+        """
+        path = self._path(key)
+        try:
+            entry = path.read_text(encoding="utf-8")
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        # mtime doubles as the LRU clock
+        os.utime(path)
+        with self._lock:
+            self.hits += 1
+        return entry
+
+    def put(self, key: str, entry: str):
+        """
+        Store an entry; call evict() once the run's new entries are written
+        """
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".tmp{threading.get_ident()}")
+        tmp_path.write_text(entry, encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    def evict(self):
+        """
+        Drop least recently used entries until the cache fits its size cap
+        """
+        with self._lock:
+            entries = sorted(
+                (p.stat().st_mtime, p.stat().st_size, p) for p in self.cache_dir.glob("*.txt")
+            )
+            total = sum(size for _, size, _ in entries)
+
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
@@ -2,10 +2,31 @@
 LangGraph workflow to fetch JIRA tickets using REST API
 """
 
-import json
+import argparse
+import asyncio
 from pathlib import Path
-from config import JIRA_URL, API_KEY, EMAIL
-from graph import create_jira_graph
+from config import (
+    JIRA_URL,
+    EMAIL,
+    PROJECT_KEY,
+    BOARD_NAME,
+    SPRINT_NAME,
+    BATCH_TARGETS_FILE,
+    ASYNC_MODE,
+    METRICS_ENABLED,
+    OPENAI_BATCH_MODE,
+    validate_config,
+)
+from checkpoints import (
+    open_checkpointer,
+    open_async_checkpointer,
+    run_checkpointed,
+    arun_checkpointed,
+    regenerate,
+)
+from jira_client import print_client_stats
+from metrics import instrument, write_metrics
+from state import merge_metrics
 
 # Get the directory where this script is located
 SCRIPT_DIR = Path(__file__).parent.absolute()
@@ -14,40 +35,209 @@ DOCS_DIR = SCRIPT_DIR / "docs"
 # Ensure docs directory exists
 DOCS_DIR.mkdir(exist_ok=True)
 
+# Nodes run by --fetch-only, in graph order; None is the configured ticket fetch node
+FETCH_ONLY_NODES = ("fetch_user_info", "fetch_sprints", None, "normalize_tickets", "process_tickets")
 
-def main():
+
+def build_initial_state():
     """
-    Main function to run the JIRA ticket fetching workflow
+    Initial state for a single-sprint run, from config
     """
-    print("🚀 Starting JIRA Ticket Fetcher\n")
-
-    # Create the graph
-    app = create_jira_graph()
-
-    # Initial state
-    initial_state = {
+    return {
         "jira_url": JIRA_URL,
-        "api_key": API_KEY,
         "email": EMAIL,
+        "project_key": PROJECT_KEY,
+        "board_name": BOARD_NAME,
+        "sprint_name": SPRINT_NAME,
+        "refresh_tickets": False,
         "user_info": {},
+        "auth_error": None,
         "projects": [],
         "sprints": [],
         "tickets": [],
+        "records": [],
+        "ticket_store_id": None,
+        "ticket_store_path": None,
+        "export_path": None,
+        "release_entries": [],
+        "release_doc_path": None,
+        "release_doc_paths": {},
+        "metrics": {},
         "error": None,
         "status": "pending"
     }
 
-    # Run the workflow
-    final_state = app.invoke(initial_state)
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Fetch JIRA sprint tickets and generate release docs")
+    parser.add_argument(
+        "--targets",
+        default=BATCH_TARGETS_FILE,
+        help="JSON file of {project, board, sprint} targets to run as one batch",
+    )
+    parser.add_argument(
+        "--async",
+        dest="async_mode",
+        action="store_true",
+        default=ASYNC_MODE,
+        help="Run the fetch nodes concurrently on asyncio/httpx",
+    )
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="Start over instead of resuming the sprint's last failed or interrupted run",
+    )
+    parser.add_argument(
+        "--regenerate",
+        action="store_true",
+        help="Only re-run release doc generation on the sprint's checkpointed tickets",
+    )
+    parser.add_argument(
+        "--fetch-only",
+        action="store_true",
+        help="Fetch and print the sprint's tickets without LangGraph or OpenAI",
+    )
+    parser.add_argument(
+        "--collect",
+        action="store_true",
+        help="Download finished OpenAI batches into the entry cache before running, so the docs get written",
+    )
+    parser.add_argument(
+        "--wait",
+        action="store_true",
+        help="With --collect, poll until every submitted batch has finished",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and regenerate the docs of the sprint (or --targets) whenever its tickets change",
+    )
+    args = parser.parse_args()
+    if args.watch and (args.fetch_only or args.regenerate or args.collect or OPENAI_BATCH_MODE):
+        parser.error("--watch regenerates docs as tickets change and cannot be combined with "
+                     "--fetch-only, --regenerate, --collect or OPENAI_BATCH_MODE")
+    if args.fetch_only and (args.targets or args.regenerate or args.collect):
+        parser.error("--fetch-only runs a single sprint and cannot be combined with "
+                     "--targets, --regenerate or --collect")
+    if args.wait and not args.collect:
+        parser.error("--wait only applies to --collect")
+    return args
+
+
+def run_fetch_only(initial_state):
+    """
+    Run the fetch and print nodes in order as plain functions, never importing langgraph or openai
+    """
+    import nodes
+
+    state = initial_state
+    for name in FETCH_ONLY_NODES:
+        name = name or nodes.TICKET_FETCH_NODE
+        node = getattr(nodes, name)
+        if METRICS_ENABLED:
+            node = instrument(name, node)
+        update = node(state)
+        state = {**state, **update, "metrics": merge_metrics(state.get("metrics"), update.get("metrics"))}
+
+    return state
+
+
+async def run_async(initial_state, fresh: bool = False):
+    """
+    Build and run the async graph, then close its HTTP clients
+    """
+    from async_jira_client import close_async_clients
+    from graph import create_jira_graph
+
+    # The async checkpointer is bound to this event loop
+    async with open_async_checkpointer() as checkpointer:
+        app = create_jira_graph(async_mode=True, checkpointer=checkpointer)
+        try:
+            return await arun_checkpointed(app, initial_state, fresh)
+        finally:
+            await close_async_clients()
+
+
+def submit_deferred():
+    """
+    Submit the prompts queued by this OPENAI_BATCH_MODE run as Batch API jobs
+    """
+    from openai_batch import submit_pending
+
+    if submit_pending():
+        print("🌙 Release docs will be written by a later run with --collect (add --wait to block until done)")
+
+
+def main():
+    """
+    Main function to run the JIRA ticket fetching workflow
+    """
+    args = parse_args()
+
+    # Only the stages that will run need their settings
+    if args.fetch_only:
+        validate_config("fetch")
+    elif args.regenerate:
+        validate_config("generate")
+    else:
+        validate_config("fetch", "generate")
+
+    print("🚀 Starting JIRA Ticket Fetcher\n")
+
+    # Initial state
+    initial_state = build_initial_state()
+
+    if args.watch:
+        from batch import load_targets
+        from watch import run_watch
+
+        run_watch(initial_state, load_targets(args.targets) if args.targets else None, DOCS_DIR)
+        return
+
+    if args.collect:
+        from openai_batch import collect_batches
+
+        collect_batches(wait=args.wait)
+
+    if args.targets:
+        from batch import load_targets, run_batch
+
+        run_batch(initial_state, load_targets(args.targets), DOCS_DIR, async_mode=args.async_mode,
+                  fresh=args.fresh, regenerate_only=args.regenerate)
+        print("\n✅ Batch completed!")
+        print_client_stats()
+        if OPENAI_BATCH_MODE:
+            submit_deferred()
+        return
+
+    # Run the workflow; regeneration only touches the sync generate node
+    if args.fetch_only:
+        final_state = run_fetch_only(initial_state)
+    elif args.async_mode and not args.regenerate:
+        final_state = asyncio.run(run_async(initial_state, fresh=args.fresh))
+    else:
+        from graph import create_jira_graph
+
+        with open_checkpointer() as checkpointer:
+            app = create_jira_graph(checkpointer=checkpointer)
+            if args.regenerate:
+                final_state = regenerate(app, initial_state)
+            else:
+                final_state = run_checkpointed(app, initial_state, fresh=args.fresh)
 
     print("\n✅ Workflow completed!")
+    print_client_stats()
+
+    if OPENAI_BATCH_MODE and not args.fetch_only:
+        submit_deferred()
+
+    if METRICS_ENABLED:
+        json_path, prom_path = write_metrics([final_state], DOCS_DIR)
+        print(f"📊 Metrics saved to {json_path} and {prom_path}")
 
-    # Optionally save tickets to JSON file
-    if final_state["status"] == "success" and final_state["tickets"]:
-        output_path = DOCS_DIR / "jira_tickets.json"
-        with open(output_path, "w") as f:
-            json.dump(final_state["tickets"], f, indent=2)
-        print(f"💾 Tickets saved to {output_path}")
+    # Tickets were streamed to NDJSON by the fetch node as pages arrived
+    if final_state["status"] == "success" and final_state.get("export_path"):
+        print(f"💾 Tickets saved to {final_state['export_path']}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,163 @@
+"""
+Per-node instrumentation for the graph, and JSON / Prometheus textfile export
+"""
+
+import functools
+import inspect
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+from jira_client import client_totals
+
+METRIC_PREFIX = "jira_release"
+
+# Metric name -> help text, in export order
+METRIC_HELP = {
+    "wall_seconds": "Wall-clock time spent in the node",
+    "cpu_seconds": "Process CPU time spent while the node ran",
+    "http_requests": "JIRA network requests made",
+    "http_bytes": "JIRA response bytes received",
+    "http_retries": "JIRA requests retried after throttling or transient errors",
+    "cache_hits": "JIRA responses served from the disk cache",
+    "llm_requests": "OpenAI completions requested",
+    "prompt_tokens": "OpenAI prompt tokens used",
+    "completion_tokens": "OpenAI completion tokens used",
+}
+
+_llm_lock = threading.Lock()
+_llm_usage = {"llm_requests": 0, "prompt_tokens": 0, "completion_tokens": 0}
+
+
+def record_llm_usage(prompt_tokens: int, completion_tokens: int):
+    """
+    Count one OpenAI completion and its token usage
+    """
+    with _llm_lock:
+        _llm_usage["llm_requests"] += 1
+        _llm_usage["prompt_tokens"] += prompt_tokens or 0
+        _llm_usage["completion_tokens"] += completion_tokens or 0
+
+
+def _counters() -> dict:
+    totals = client_totals()
+    # Only look at async clients when an async run already imported httpx
+    if "async_jira_client" in sys.modules:
+        for name, value in sys.modules["async_jira_client"].async_client_totals().items():
+            totals[name] += value
+
+    with _llm_lock:
+        llm_usage = dict(_llm_usage)
+
+    return {
+        "http_requests": totals["request_count"],
+        "http_bytes": totals["bytes_received"],
+        "http_retries": totals["retries"],
+        "cache_hits": totals["cache_hits"],
+        **llm_usage,
+    }
+
+
+def _snapshot() -> dict:
+    return {"wall_seconds": time.perf_counter(), "cpu_seconds": time.process_time(), **_counters()}
+
+
+def _with_metrics(name: str, result: dict, before: dict) -> dict:
+    after = _snapshot()
+    node_metrics = {metric: after[metric] - before[metric] for metric in METRIC_HELP}
+    node_metrics["wall_seconds"] = round(node_metrics["wall_seconds"], 6)
+    node_metrics["cpu_seconds"] = round(node_metrics["cpu_seconds"], 6)
+
+    print(f"📊 {name}: {node_metrics['wall_seconds']:.2f}s wall, {node_metrics['cpu_seconds']:.2f}s CPU, "
+          f"{node_metrics['http_requests']} requests, {node_metrics['prompt_tokens']}+"
+          f"{node_metrics['completion_tokens']} tokens")
+
+    # The state reducer merges this into the metrics of earlier nodes
+    return {**result, "metrics": {name: node_metrics}}
+
+
+def instrument(name: str, node):
+    """
+    Wrap a sync or async node so it records its timing and request/token deltas in state["metrics"].
+
+    Counters are process-wide, so nodes of concurrent batch targets see each other's requests.
+    """
+    if inspect.iscoroutinefunction(node):
+        @functools.wraps(node)
+        async def async_wrapper(state):
+            before = _snapshot()
+            result = await node(state)
+            return _with_metrics(name, result, before)
+
+        return async_wrapper
+
+    @functools.wraps(node)
+    def wrapper(state):
+        before = _snapshot()
+        result = node(state)
+        return _with_metrics(name, result, before)
+
+    return wrapper
+
+
+def _totals(node_metrics: dict) -> dict:
+    return {metric: sum(values.get(metric, 0) for values in node_metrics.values()) for metric in METRIC_HELP}
+
+
+def _label(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _write_atomic(path: Path, text: str):
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(text)
+    os.replace(tmp_path, path)
+
+
+def _run_labels(final_state) -> dict:
+    # Targets in different projects or boards may share a sprint name
+    return {
+        "project": final_state.get("project_key"),
+        "board": final_state.get("board_name"),
+        "sprint": final_state["sprint_name"],
+    }
+
+
+def write_metrics(final_states: list, docs_dir: Path) -> tuple[Path, Path]:
+    """
+    Write the metrics of each run's final state to metrics.json and a Prometheus textfile
+    """
+    generated_at = datetime.now()
+    runs = [(_run_labels(final_state), final_state.get("metrics", {})) for final_state in final_states]
+
+    report = {
+        "generated_at": generated_at.isoformat(timespec="seconds"),
+        "runs": [
+            {**labels, "nodes": node_metrics, "totals": _totals(node_metrics)}
+            for labels, node_metrics in runs
+        ],
+    }
+    json_path = docs_dir / "metrics.json"
+    _write_atomic(json_path, json.dumps(report, indent=2) + "\n")
+
+    lines = []
+    for metric, help_text in METRIC_HELP.items():
+        name = f"{METRIC_PREFIX}_node_{metric}"
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} gauge")
+        for labels, node_metrics in runs:
+            run_labels = ",".join(f'{label}="{_label(value or "")}"' for label, value in labels.items())
+            for node, values in node_metrics.items():
+                lines.append(f'{name}{{{run_labels},node="{_label(node)}"}} {values.get(metric, 0)}')
+    lines.append(f"# HELP {METRIC_PREFIX}_last_run_timestamp_seconds When these metrics were written")
+    lines.append(f"# TYPE {METRIC_PREFIX}_last_run_timestamp_seconds gauge")
+    lines.append(f"{METRIC_PREFIX}_last_run_timestamp_seconds {generated_at.timestamp():.0f}")
+
+    prom_path = docs_dir / "metrics.prom"
+    _write_atomic(prom_path, "\n".join(lines) + "\n")
+
+    return json_path, prom_path
@@ -5,13 +5,27 @@ Node functions for JIRA workflow
 from .fetch_user_info import fetch_user_info
 from .fetch_sprints import fetch_sprints
 from .fetch_tickets_agile import fetch_tickets_agile
+from .fetch_tickets_search import fetch_tickets_search
+from .normalize_tickets import normalize_tickets
 from .process_tickets import process_tickets
 from .generate_release_doc import generate_release_doc
+from .render_release_docs import render_release_docs
+from config import JIRA_FETCH_MODE
+
+if JIRA_FETCH_MODE not in ("agile", "search"):
+    raise ValueError(f"Unknown JIRA_FETCH_MODE '{JIRA_FETCH_MODE}', expected agile or search")
+
+# Graph node that fetches the sprint's tickets for the configured JIRA_FETCH_MODE
+TICKET_FETCH_NODE = "fetch_tickets_search" if JIRA_FETCH_MODE == "search" else "fetch_tickets_agile"
 
 __all__ = [
     "fetch_user_info",
     "fetch_sprints",
     "fetch_tickets_agile",
+    "fetch_tickets_search",
+    "normalize_tickets",
     "process_tickets",
     "generate_release_doc",
+    "render_release_docs",
+    "TICKET_FETCH_NODE",
 ]
@@ -0,0 +1,283 @@
+"""
+Async variants of the JIRA fetch nodes, for running the graph with ainvoke.
+
+These nodes return only the state keys they change, so the user-info check
+can run as a parallel branch next to the sprint lookup.
+"""
+
+import asyncio
+
+from state import JiraState
+from async_jira_client import get_async_jira_client
+from config import (
+    JIRA_PAGE_SIZE,
+    JIRA_FETCH_WORKERS,
+    JIRA_INCREMENTAL,
+    JIRA_SPRINT_STATES,
+    JIRA_SPRINT_PAGE_SIZE,
+    JIRA_SPRINT_INDEX,
+    JIRA_EXPORT,
+)
+from sync_store import (
+    load_snapshot,
+    save_snapshot,
+    high_water_mark,
+    minutes_since,
+    merge_snapshot,
+    lookup_sprint,
+    remember_sprint,
+    forget_sprint,
+)
+from .fetch_sprints import _state_passes, current_indexed_sprint, indexed_sprint_path
+from projection import trim_page
+from ticket_export import TicketExporter, export_path_for
+from .fetch_tickets_agile import ISSUE_FIELDS, PROFILE_FIELDS, STORY_JQL
+
+
+async def afetch_user_info(state: JiraState) -> dict:
+    """
+    Verify authentication; runs in parallel with the sprint lookup
+    """
+    if state.get("user_info"):
+        return {}
+
+    print("👤 Fetching current user information (async)...")
+
+    try:
+        client = get_async_jira_client(state)
+        response = await client.get("/rest/api/3/myself")
+
+        if response.status_code == 200:
+            user_data = response.json()
+            print(f"✅ Authenticated as {user_data.get('displayName', 'N/A')} "
+                  f"({user_data.get('emailAddress', 'N/A')})")
+            return {"user_info": user_data}
+
+        error_msg = f"Failed to fetch user info: {response.status_code} - {response.text}"
+    except Exception as e:
+        error_msg = f"Exception occurred: {str(e)}"
+
+    print(f"❌ {error_msg}")
+    return {"user_info": {}, "auth_error": error_msg}
+
+
+async def _find_sprint_in_states(client, board_id, sprint_name, states):
+    """
+    Page through one state group of the board's sprints until the sprint is found
+    """
+    listed = []
+    start_at = 0
+
+    while True:
+        params = {"state": ",".join(states), "startAt": start_at, "maxResults": JIRA_SPRINT_PAGE_SIZE}
+        response = await client.get(f"/rest/agile/1.0/board/{board_id}/sprint", params=params)
+
+        if response.status_code != 200:
+            raise RuntimeError(f"Failed to fetch sprints: {response.status_code} - {response.text}")
+
+        page = response.json()
+        values = page.get("values", [])
+        listed.extend(values)
+
+        for sprint in values:
+            if sprint.get("name") == sprint_name:
+                return sprint, listed
+
+        if page.get("isLast", True) or not values:
+            return None, listed
+        start_at += len(values)
+
+
+async def afetch_sprints(state: JiraState) -> dict:
+    """
+    Find the target sprint; open sprints are searched before closed ones, stopping once found
+    """
+    project_key = state.get("project_key") or "SPARK"
+    board_filter = state.get("board_name")
+    sprint_name = state["sprint_name"]
+    print(f"🏃 Fetching sprints for {project_key} project (async)...")
+
+    known_sprint = lookup_sprint(project_key, board_filter, sprint_name) if JIRA_SPRINT_INDEX else None
+
+    try:
+        client = get_async_jira_client(state)
+
+        if known_sprint:
+            sprint = current_indexed_sprint(await client.get(indexed_sprint_path(known_sprint)), sprint_name)
+            if sprint:
+                print(f"Found sprint '{sprint_name}' (ID: {sprint['id']}) in local sprint index")
+                return {"sprints": [sprint], "status": "success"}
+            print(f"⚠️  Indexed sprint ID {known_sprint['id']} no longer names '{sprint_name}'; listing sprints")
+            forget_sprint(project_key, board_filter, sprint_name)
+
+        response = await client.get("/rest/agile/1.0/board", params={"projectKeyOrId": project_key})
+        if response.status_code != 200:
+            raise RuntimeError(f"Failed to fetch boards: {response.status_code} - {response.text}")
+
+        boards = response.json().get("values", [])
+        if board_filter:
+            boards = [b for b in boards if b.get("name") == board_filter]
+        if board_filter and not boards:
+            raise RuntimeError(f"Board '{board_filter}' not found in {project_key} project")
+        if not boards:
+            print(f"❌ No boards found for {project_key} project")
+            return {"sprints": [], "status": "success"}
+
+        board_id = boards[0].get("id")
+        print(f"Found board: {boards[0].get('name', 'Unknown')} (ID: {board_id})")
+
+        # The closed pass can be hundreds of sprints, so it only runs when the open pass misses
+        listed = []
+        sprint = None
+        for states in _state_passes(JIRA_SPRINT_STATES):
+            sprint, pass_listed = await _find_sprint_in_states(client, board_id, sprint_name, states)
+            listed.extend(pass_listed)
+            if sprint is not None:
+                break
+
+        if sprint is None:
+            print(f"❌ Sprint '{sprint_name}' not among {len(listed)} listed sprints")
+            return {"sprints": listed, "status": "success"}
+
+        print(f"Found sprint '{sprint_name}' (ID: {sprint.get('id')}, State: {sprint.get('state')})")
+        if JIRA_SPRINT_INDEX:
+            remember_sprint(project_key, board_filter, sprint)
+        return {"sprints": [sprint], "status": "success"}
+
+    except Exception as e:
+        error_msg = f"Exception occurred: {str(e)}"
+        print(f"❌ {error_msg}")
+        return {"sprints": [], "status": "error", "error": error_msg}
+
+
+async def _afetch_page(client, path, params, start_at, semaphore, use_cache=True):
+    async with semaphore:
+        response = await client.get(path, params={**params, "startAt": start_at}, use_cache=use_cache)
+
+    if response.status_code != 200:
+        raise RuntimeError(
+            f"Failed to fetch tickets (startAt={start_at}): {response.status_code} - {response.text}"
+        )
+    return trim_page(response.json(), PROFILE_FIELDS)
+
+
+async def _afetch_all_issues(client, path, params, use_cache=True, on_page=None):
+    """
+    Fetch the first page for the total, then all remaining pages concurrently, in order.
+
+    `on_page` is called with each page's issues, in order, as soon as it and
+    every page before it have arrived.
+    """
+    params = {"maxResults": JIRA_PAGE_SIZE, **params}
+    semaphore = asyncio.Semaphore(max(1, JIRA_FETCH_WORKERS))
+
+    first_page = await _afetch_page(client, path, params, 0, semaphore, use_cache)
+    issues = first_page.get("issues", [])
+    total = first_page.get("total", len(issues))
+    page_size = first_page.get("maxResults") or len(issues)
+    if on_page:
+        on_page(issues)
+
+    if page_size and total > len(issues):
+        tasks = [
+            asyncio.ensure_future(_afetch_page(client, path, params, start_at, semaphore, use_cache))
+            for start_at in range(len(issues), total, page_size)
+        ]
+        try:
+            for task in tasks:
+                page_issues = (await task).get("issues", [])
+                issues.extend(page_issues)
+                if on_page:
+                    on_page(page_issues)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    return issues
+
+
+async def _afetch_incremental(client, path, snapshot):
+    """
+    Key-list diff and updated-since delta, fetched concurrently
+    """
+    minutes = minutes_since(snapshot["high_water"])
+
+    key_pages, changed = await asyncio.gather(
+        _afetch_all_issues(client, path, {"fields": "key", "jql": STORY_JQL}, use_cache=False),
+        _afetch_all_issues(client, path, {
+            "fields": ISSUE_FIELDS,
+            "jql": f"{STORY_JQL} AND updated >= -{minutes}m",
+        }, use_cache=False),
+    )
+    current_keys = [issue.get("key") for issue in key_pages]
+    tickets = merge_snapshot(snapshot["issues"], changed, current_keys)
+
+    known = {issue.get("key") for issue in tickets}
+    missing = [key for key in current_keys if key not in known]
+    if missing:
+        added = await _afetch_all_issues(client, path, {
+            "fields": ISSUE_FIELDS,
+            "jql": f"{STORY_JQL} AND key in ({','.join(missing)})",
+        }, use_cache=False)
+        tickets = merge_snapshot(tickets, added, current_keys)
+
+    removed = {issue.get("key") for issue in snapshot["issues"]} - set(current_keys)
+    print(f"🔄 Incremental sync since {snapshot['high_water']}: {len(changed)} updated, "
+          f"{len(missing)} added, {len(removed)} removed")
+
+    return tickets
+
+
+async def afetch_tickets_agile(state: JiraState) -> dict:
+    """
+    Join point of the auth and sprint branches; fetches the sprint's issue pages concurrently
+    """
+    if state.get("auth_error"):
+        return {"tickets": [], "status": "error", "error": state["auth_error"]}
+    if state["status"] == "error":
+        return {"tickets": []}
+
+    print("🔍 Fetching tickets using Agile API (async)...")
+
+    try:
+        client = get_async_jira_client(state)
+        sprint_name = state["sprint_name"]
+
+        sprint_id = next(
+            (sprint.get("id") for sprint in state.get("sprints", []) if sprint.get("name") == sprint_name),
+            None,
+        )
+        if not sprint_id:
+            print(f"❌ Sprint '{sprint_name}' not found in fetched sprints")
+            return {"tickets": [], "status": "error", "error": f"Sprint '{sprint_name}' not found"}
+
+        path = f"/rest/agile/1.0/sprint/{sprint_id}/issue"
+        snapshot = load_snapshot(sprint_id) if JIRA_INCREMENTAL else None
+        exporter = TicketExporter(export_path_for(state)) if JIRA_EXPORT else None
+
+        try:
+            if snapshot and minutes_since(snapshot.get("high_water")):
+                tickets = await _afetch_incremental(client, path, snapshot)
+                if exporter:
+                    exporter.write_issues(tickets)
+            else:
+                tickets = await _afetch_all_issues(client, path, {"fields": ISSUE_FIELDS, "jql": STORY_JQL},
+                                                   use_cache=not state.get("refresh_tickets"),
+                                                   on_page=exporter.write_issues if exporter else None)
+        except Exception:
+            if exporter:
+                exporter.abort()
+            raise
+
+        export_path = str(exporter.finalize()) if exporter else None
+
+        if JIRA_INCREMENTAL:
+            save_snapshot(sprint_id, tickets, high_water_mark(tickets))
+
+        print(f"✅ Successfully fetched {len(tickets)} tickets")
+        return {"tickets": tickets, "export_path": export_path, "status": "success", "error": None}
+
+    except Exception as e:
+        error_msg = f"Exception occurred: {str(e)}"
+        print(f"❌ {error_msg}")
+        return {"tickets": [], "status": "error", "error": error_msg}
@@ -2,31 +2,105 @@
 Fetch sprints from JIRA
 """
 
-import requests
 from state import JiraState
+from jira_client import get_jira_client
+from config import JIRA_SPRINT_STATES, JIRA_SPRINT_PAGE_SIZE, JIRA_SPRINT_INDEX
+from sync_store import lookup_sprint, remember_sprint, forget_sprint
 
 
-def fetch_sprints(state: JiraState) -> JiraState:
+def indexed_sprint_path(sprint: dict) -> str:
+    return f"/rest/agile/1.0/sprint/{sprint['id']}"
+
+
+def current_indexed_sprint(response, sprint_name: str) -> dict | None:
     """
-    Fetch all sprints for SPARK project
+    The indexed sprint as JIRA has it now, or None when it was deleted or renamed
     """
-    print("🏃 Fetching sprints for SPARK project...")
+    if response.status_code == 404:
+        return None
+    if response.status_code != 200:
+        raise RuntimeError(f"Failed to check indexed sprint: {response.status_code} - {response.text}")
+    sprint = response.json()
+    return sprint if sprint.get("name") == sprint_name else None
 
-    try:
-        base_url = state['jira_url'].rstrip('/')
 
-        # First, get the board ID for SPARK project
-        board_url = f"{base_url}/rest/agile/1.0/board"
+def _state_passes(states: list) -> list:
+    """
+    Query open sprints before closed ones; boards can have hundreds of closed sprints
+    """
+    open_states = [s for s in states if s != "closed"]
+    passes = [open_states] if open_states else []
+    if "closed" in states:
+        passes.append(["closed"])
+    return passes
 
-        headers = {
-            "Accept": "application/json",
-        }
 
-        auth = (state['email'], state['api_key'])
+def _find_sprint(client, board_id, sprint_name):
+    """
+    Page through the board's sprints by state, stopping once the named sprint is found.
+
+    Returns (sprint or None, sprints listed so far).
+    """
+    listed = []
+
+    for states in _state_passes(JIRA_SPRINT_STATES):
+        start_at = 0
+        while True:
+            params = {
+                "state": ",".join(states),
+                "startAt": start_at,
+                "maxResults": JIRA_SPRINT_PAGE_SIZE,
+            }
+            response = client.get(f"/rest/agile/1.0/board/{board_id}/sprint", params=params)
+
+            if response.status_code != 200:
+                raise RuntimeError(f"Failed to fetch sprints: {response.status_code} - {response.text}")
+
+            page = response.json()
+            values = page.get("values", [])
+            listed.extend(values)
+
+            for sprint in values:
+                if sprint.get("name") == sprint_name:
+                    return sprint, listed
+
+            if page.get("isLast", True) or not values:
+                break
+            start_at += len(values)
+
+    return None, listed
+
+
+def fetch_sprints(state: JiraState) -> JiraState:
+    """
+    Find the target sprint on the target project's board
+    """
+    project_key = state.get("project_key") or "SPARK"
+    sprint_name = state["sprint_name"]
+    print(f"🏃 Fetching sprints for {project_key} project...")
+
+    # A persisted name -> id index lets repeat runs skip the listing entirely
+    known_sprint = lookup_sprint(project_key, state.get("board_name"), sprint_name) if JIRA_SPRINT_INDEX else None
 
-        # Get boards for SPARK project
-        params = {"projectKeyOrId": "SPARK"}
-        response = requests.get(board_url, headers=headers, auth=auth, params=params)
+    try:
+        client = get_jira_client(state)
+
+        if known_sprint:
+            # One request confirms the id still names this sprint; a stale entry falls back to the listing
+            sprint = current_indexed_sprint(client.get(indexed_sprint_path(known_sprint)), sprint_name)
+            if sprint:
+                print(f"Found sprint '{sprint_name}' (ID: {sprint['id']}) in local sprint index")
+                return {
+                    **state,
+                    "sprints": [sprint],
+                    "status": "success"
+                }
+            print(f"⚠️  Indexed sprint ID {known_sprint['id']} no longer names '{sprint_name}'; listing sprints")
+            forget_sprint(project_key, state.get("board_name"), sprint_name)
+
+        # Get boards for the project
+        params = {"projectKeyOrId": project_key}
+        response = client.get("/rest/agile/1.0/board", params=params)
 
         print(f"Board API Status: {response.status_code}")
 
@@ -44,54 +118,63 @@ def fetch_sprints(state: JiraState) -> JiraState:
         boards = boards_data.get("values", [])
 
         if not boards:
-            print("❌ No boards found for SPARK project")
+            print(f"❌ No boards found for {project_key} project")
             return {
                 **state,
                 "sprints": [],
                 "status": "success"
             }
 
-        # Get sprints from the first board
-        board_id = boards[0].get("id")
-        board_name = boards[0].get("name", "Unknown")
+        # Get sprints from the requested board, or the first board
+        board = boards[0]
+        if state.get("board_name"):
+            board = next((b for b in boards if b.get("name") == state["board_name"]), None)
+            if board is None:
+                error_msg = f"Board '{state['board_name']}' not found in {project_key} project"
+                print(f"❌ {error_msg}")
+                return {
+                    **state,
+                    "sprints": [],
+                    "status": "error",
+                    "error": error_msg
+                }
+
+        board_id = board.get("id")
+        board_name = board.get("name", "Unknown")
         print(f"Found board: {board_name} (ID: {board_id})")
 
         # Fetch sprints for this board
-        sprint_url = f"{base_url}/rest/agile/1.0/board/{board_id}/sprint"
-        sprint_response = requests.get(sprint_url, headers=headers, auth=auth)
-
-        print(f"Sprint API Status: {sprint_response.status_code}")
-
-        if sprint_response.status_code == 200:
-            sprint_data = sprint_response.json()
-            sprints = sprint_data.get("values", [])
-
-            print(f"\n{'='*80}")
-            print(f"🏃 AVAILABLE SPRINTS IN SPARK PROJECT ({len(sprints)} total)")
-            print(f"{'='*80}\n")
-
-            for idx, sprint in enumerate(sprints, 1):
-                sprint_id = sprint.get("id", "N/A")
-                sprint_name = sprint.get("name", "No name")
-                sprint_state = sprint.get("state", "Unknown")
-                print(f"{idx}. [{sprint_id}] {sprint_name} (State: {sprint_state})")
-
-            print(f"\n{'='*80}\n")
+        sprint, listed = _find_sprint(client, board_id, sprint_name)
 
+        if sprint:
+            print(f"Found sprint '{sprint_name}' (ID: {sprint.get('id')}, State: {sprint.get('state')}) "
+                  f"after listing {len(listed)} sprints")
+            if JIRA_SPRINT_INDEX:
+                remember_sprint(project_key, state.get("board_name"), sprint)
             return {
                 **state,
-                "sprints": sprints,
+                "sprints": [sprint],
                 "status": "success"
             }
-        else:
-            error_msg = f"Failed to fetch sprints: {sprint_response.status_code} - {sprint_response.text}"
-            print(f"❌ {error_msg}")
-            return {
-                **state,
-                "sprints": [],
-                "status": "error",
-                "error": error_msg
-            }
+
+        # Not found: show what is available so the sprint name can be fixed
+        print(f"\n{'='*80}")
+        print(f"🏃 AVAILABLE SPRINTS IN {project_key} PROJECT ({len(listed)} total)")
+        print(f"{'='*80}\n")
+
+        for idx, listed_sprint in enumerate(listed, 1):
+            sprint_id = listed_sprint.get("id", "N/A")
+            listed_name = listed_sprint.get("name", "No name")
+            sprint_state = listed_sprint.get("state", "Unknown")
+            print(f"{idx}. [{sprint_id}] {listed_name} (State: {sprint_state})")
+
+        print(f"\n{'='*80}\n")
+
+        return {
+            **state,
+            "sprints": listed,
+            "status": "success"
+        }
 
     except Exception as e:
         error_msg = f"Exception occurred: {str(e)}"
@@ -2,9 +2,133 @@
 Fetch tickets using JIRA Agile REST API
 """
 
-import requests
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
 from state import JiraState
-from config import SPRINT_NAME
+from jira_client import get_jira_client
+from config import JIRA_PAGE_SIZE, JIRA_FETCH_WORKERS, JIRA_INCREMENTAL, JIRA_FIELD_PROFILE, JIRA_EXPORT
+from projection import profile_fields, trim_page
+from ticket_export import TicketExporter, export_path_for
+from sync_store import (
+    load_snapshot,
+    save_snapshot,
+    high_water_mark,
+    minutes_since,
+    merge_snapshot,
+)
+
+# Only the fields the configured output profile reads are requested
+PROFILE_FIELDS = profile_fields(JIRA_FIELD_PROFILE)
+ISSUE_FIELDS = ",".join(PROFILE_FIELDS)
+STORY_JQL = "issuetype = 'Story'"
+
+
+def _fetch_page(client, path, params, start_at, use_cache=True):
+    """
+    Fetch a single startAt window of sprint issues
+    """
+    page_params = {**params, "startAt": start_at}
+    response = client.get(path, params=page_params, use_cache=use_cache)
+
+    if response.status_code != 200:
+        raise RuntimeError(
+            f"Failed to fetch tickets (startAt={start_at}): {response.status_code} - {response.text}"
+        )
+
+    # Drop self URLs, avatars and unused fields before the page is retained
+    return trim_page(response.json(), PROFILE_FIELDS)
+
+
+def _iter_remaining_pages(client, path, params, first_page, use_cache=True):
+    """
+    Yield the issues of every page after the first, in startAt order.
+
+    Pages are fetched in parallel, with at most JIRA_FETCH_WORKERS pages in
+    flight or waiting for their turn at once. That bounds the parallel
+    fetch; the caller still collects every issue into one list (and can
+    export each page as it arrives via `on_page`).
+    """
+    total = first_page.get("total", 0)
+    # Jira may cap the page size below what we asked for, so step by what it returned
+    page_size = first_page.get("maxResults") or len(first_page.get("issues", []))
+    start = len(first_page.get("issues", []))
+
+    if not page_size or start >= total:
+        return
+
+    workers = max(1, JIRA_FETCH_WORKERS)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+
+        for start_at in range(start, total, page_size):
+            pending.append(executor.submit(_fetch_page, client, path, params, start_at, use_cache))
+            if len(pending) >= workers:
+                yield pending.popleft().result().get("issues", [])
+
+        while pending:
+            yield pending.popleft().result().get("issues", [])
+
+
+def _fetch_all_issues(client, path, params, use_cache=True, on_page=None):
+    """
+    Fetch every page of a sprint issue query and merge them in order.
+
+    `on_page` is called with each page's issues as soon as it arrives, in order.
+    """
+    params = {"maxResults": JIRA_PAGE_SIZE, **params}  # Jira Cloud caps pages at 50-100 issues
+
+    first_page = _fetch_page(client, path, params, 0, use_cache)
+    issues = first_page.get("issues", [])
+    total = first_page.get("total", len(issues))
+    if on_page:
+        on_page(issues)
+
+    if total > len(issues):
+        print(f"📄 Query matched {total} tickets, fetching remaining pages "
+              f"with {JIRA_FETCH_WORKERS} workers...")
+
+    for page_issues in _iter_remaining_pages(client, path, params, first_page, use_cache):
+        issues.extend(page_issues)
+        if on_page:
+            on_page(page_issues)
+
+    return issues
+
+
+def _fetch_incremental(client, path, snapshot):
+    """
+    Refresh a stored sprint snapshot with only the issues updated since its mark
+    """
+    minutes = minutes_since(snapshot["high_water"])
+
+    # Cheap key-list pass to learn current membership and order
+    key_pages = _fetch_all_issues(client, path, {"fields": "key", "jql": STORY_JQL}, use_cache=False)
+    current_keys = [issue.get("key") for issue in key_pages]
+
+    changed = _fetch_all_issues(client, path, {
+        "fields": ISSUE_FIELDS,
+        "jql": f"{STORY_JQL} AND updated >= -{minutes}m",
+    }, use_cache=False)
+
+    tickets = merge_snapshot(snapshot["issues"], changed, current_keys)
+
+    # Issues moved into the sprint without a fresh `updated` are not in the delta
+    known = {issue.get("key") for issue in tickets}
+    missing = [key for key in current_keys if key not in known]
+    if missing:
+        added = _fetch_all_issues(client, path, {
+            "fields": ISSUE_FIELDS,
+            "jql": f"{STORY_JQL} AND key in ({','.join(missing)})",
+        }, use_cache=False)
+        tickets = merge_snapshot(tickets, added, current_keys)
+
+    removed = {issue.get("key") for issue in snapshot["issues"]} - set(current_keys)
+    print(f"🔄 Incremental sync since {snapshot['high_water']}: {len(changed)} updated, "
+          f"{len(missing)} added, {len(removed)} removed")
+
+    return tickets
 
 
 def fetch_tickets_agile(state: JiraState) -> JiraState:
@@ -14,87 +138,65 @@ def fetch_tickets_agile(state: JiraState) -> JiraState:
     print("🔍 Fetching tickets using Agile API...")
 
     try:
-        base_url = state['jira_url'].rstrip('/')
+        client = get_jira_client(state)
 
         # Find the sprint ID from the fetched sprints
+        sprint_name = state["sprint_name"]
         sprint_id = None
 
         for sprint in state.get("sprints", []):
-            if sprint.get("name") == SPRINT_NAME:
+            if sprint.get("name") == sprint_name:
                 sprint_id = sprint.get("id")
                 break
 
         if not sprint_id:
-            print(f"❌ Sprint '{SPRINT_NAME}' not found in fetched sprints")
+            print(f"❌ Sprint '{sprint_name}' not found in fetched sprints")
             return {
                 **state,
                 "tickets": [],
                 "status": "error",
-                "error": f"Sprint '{SPRINT_NAME}' not found"
+                "error": f"Sprint '{sprint_name}' not found"
             }
 
         print(f"Found sprint ID: {sprint_id}")
 
         # Use Agile API to fetch issues for this sprint
-        url = f"{base_url}/rest/agile/1.0/sprint/{sprint_id}/issue"
-
-        headers = {
-            "Accept": "application/json"
-        }
-
-        auth = (state['email'], state['api_key'])
+        path = f"/rest/agile/1.0/sprint/{sprint_id}/issue"
+        print(f"Request URL: {client.base_url}{path}")
+
+        snapshot = load_snapshot(sprint_id) if JIRA_INCREMENTAL else None
+        exporter = TicketExporter(export_path_for(state)) if JIRA_EXPORT else None
+
+        try:
+            if snapshot and minutes_since(snapshot.get("high_water")):
+                tickets = _fetch_incremental(client, path, snapshot)
+                if exporter:
+                    exporter.write_issues(tickets)
+            else:
+                # Query parameters - Add JQL filter for Story type
+                tickets = _fetch_all_issues(client, path, {"fields": ISSUE_FIELDS, "jql": STORY_JQL},
+                                            use_cache=not state.get("refresh_tickets"),
+                                            on_page=exporter.write_issues if exporter else None)
+        except Exception:
+            if exporter:
+                exporter.abort()
+            raise
+
+        export_path = str(exporter.finalize()) if exporter else None
+
+        if JIRA_INCREMENTAL:
+            save_snapshot(sprint_id, tickets, high_water_mark(tickets))
+
+        print(f"✅ Successfully fetched {len(tickets)} tickets")
 
-        # Query parameters - Add JQL filter for Story type
-        params = {
-            "maxResults": 1000,  # Fetch up to 1000 tickets (JIRA API max)
-            "fields": "summary,description,status,assignee,created,updated,priority,issuetype,project,sprint",
-            "jql": "issuetype = 'Story'"
+        return {
+            **state,
+            "tickets": tickets,
+            "export_path": export_path,
+            "status": "success",
+            "error": None
         }
 
-        # Make GET request
-        response = requests.get(url, headers=headers, auth=auth, params=params)
-
-        print(f"Response Status: {response.status_code}")
-        print(f"Request URL: {url}")
-
-        if response.status_code == 200:
-            data = response.json()
-
-            print(f"✅ Successfully fetched data from JIRA Agile API")
-            tickets = data.get("issues", [])
-
-            print(f"✅ Successfully fetched {len(tickets)} tickets")
-
-            # Debug: Print sprint data from first ticket
-            if tickets:
-                first_ticket_fields = tickets[0].get("fields", {})
-                sprint_data = first_ticket_fields.get("sprint")
-
-                print(f"\n🏃 Sprint data in first ticket:")
-                if sprint_data:
-                    print(f"  Sprint: {sprint_data}")
-                else:
-                    print(f"  No sprint field found. Available fields:")
-                    for field_name in first_ticket_fields.keys():
-                        print(f"    - {field_name}")
-                print()
-
-            return {
-                **state,
-                "tickets": tickets,
-                "status": "success",
-                "error": None
-            }
-        else:
-            error_msg = f"Failed to fetch tickets: {response.status_code} - {response.text}"
-            print(f"❌ {error_msg}")
-            return {
-                **state,
-                "tickets": [],
-                "status": "error",
-                "error": error_msg
-            }
-
     except Exception as e:
         error_msg = f"Exception occurred: {str(e)}"
         print(f"❌ {error_msg}")
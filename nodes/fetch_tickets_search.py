@@ -0,0 +1,230 @@
+"""
+Fetch tickets with the JIRA JQL search API, resolving related issues in batches
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from state import JiraState
+from jira_client import get_jira_client
+from config import (
+    JIRA_PAGE_SIZE,
+    JIRA_FETCH_WORKERS,
+    JIRA_FIELD_PROFILE,
+    JIRA_EXPORT,
+    JIRA_JQL,
+    JIRA_RELATED,
+    JIRA_EPIC_LINK_FIELD,
+    JIRA_KEY_BATCH_SIZE,
+    JIRA_EXPAND_CHANGELOG,
+)
+from projection import profile_fields, trim_links, trim_page
+from ticket_export import TicketExporter, export_path_for
+
+# Token-paginated replacement for /rest/api/3/search
+SEARCH_PATH = "/rest/api/3/search/jql"
+
+# Fields fetched for parents, epics and linked issues
+RELATED_FIELDS = ["summary", "status", "issuetype"]
+
+
+def search_fields() -> list:
+    """
+    The profile's fields plus whatever the configured related lookups need
+    """
+    fields = list(profile_fields(JIRA_FIELD_PROFILE))
+    if "*all" in fields:
+        return fields
+
+    if "parent" in JIRA_RELATED:
+        fields.append("parent")
+    if "epic" in JIRA_RELATED and JIRA_EPIC_LINK_FIELD:
+        fields.append(JIRA_EPIC_LINK_FIELD)
+    if "links" in JIRA_RELATED:
+        fields.append("issuelinks")
+    return fields
+
+
+def search_issues(client, jql: str, fields: list, expand: str | None = None, on_page=None,
+                  use_cache: bool = True) -> list:
+    """
+    Follow nextPageToken through every page of a JQL search.
+
+    The token of each page is only known once the previous one arrives, so
+    pages are fetched one after another. `on_page` is called with each
+    page's issues in order.
+    """
+    params = {"jql": jql, "fields": ",".join(fields), "maxResults": JIRA_PAGE_SIZE}
+    if expand:
+        params["expand"] = expand
+
+    issues = []
+    token = None
+
+    while True:
+        page_params = {**params, "nextPageToken": token} if token else params
+        response = client.get(SEARCH_PATH, params=page_params, use_cache=use_cache)
+
+        if response.status_code != 200:
+            raise RuntimeError(f"JQL search failed: {response.status_code} - {response.text}")
+
+        page = trim_page(response.json(), fields)
+        page_issues = page.get("issues", [])
+        issues.extend(page_issues)
+        if on_page:
+            on_page(page_issues)
+
+        token = page.get("nextPageToken")
+        if page.get("isLast") or not token:
+            return issues
+
+
+def _related_refs(issue: dict) -> dict:
+    """
+    Keys of an issue's parent, epic and linked issues, as configured
+    """
+    fields = issue.get("fields", {})
+    refs = {"parent": None, "epic": None, "links": []}
+
+    if "parent" in JIRA_RELATED and isinstance(fields.get("parent"), dict):
+        refs["parent"] = fields["parent"].get("key")
+    if "epic" in JIRA_RELATED and JIRA_EPIC_LINK_FIELD and isinstance(fields.get(JIRA_EPIC_LINK_FIELD), str):
+        refs["epic"] = fields[JIRA_EPIC_LINK_FIELD]
+    if "links" in JIRA_RELATED:
+        links = fields.get("issuelinks") or []
+        # The json profile keeps raw link objects
+        if any("key" not in link for link in links):
+            links = trim_links(links)
+        refs["links"] = [link for link in links if link.get("key")]
+
+    return refs
+
+
+def _summary(issue: dict) -> dict:
+    fields = issue.get("fields", {})
+    return {
+        "key": issue.get("key"),
+        "summary": fields.get("summary"),
+        "status": (fields.get("status") or {}).get("name"),
+        "issue_type": (fields.get("issuetype") or {}).get("name"),
+    }
+
+
+def lookup_issues(client, keys: list) -> dict:
+    """
+    Fetch summaries for many issue keys with batched `key in (...)` searches
+    """
+    batches = [keys[i:i + JIRA_KEY_BATCH_SIZE] for i in range(0, len(keys), JIRA_KEY_BATCH_SIZE)]
+
+    def lookup(batch):
+        try:
+            return search_issues(client, f"key in ({','.join(batch)})", RELATED_FIELDS)
+        except RuntimeError as e:
+            # Related summaries are optional; e.g. a link to an issue we cannot see fails the batch
+            print(f"⚠️  Related issue lookup failed for {len(batch)} keys: {e}")
+            return []
+
+    with ThreadPoolExecutor(max_workers=max(1, min(JIRA_FETCH_WORKERS, len(batches)))) as executor:
+        return {issue.get("key"): _summary(issue) for found in executor.map(lookup, batches) for issue in found}
+
+
+def resolve_related(client, tickets: list) -> int:
+    """
+    Attach parent, epic and linked issue summaries to each ticket under "related".
+
+    Keys already in the sprint are read from the fetched tickets; the rest
+    are looked up together. Returns the number of keys looked up.
+    """
+    refs_by_key = {ticket.get("key"): _related_refs(ticket) for ticket in tickets}
+
+    wanted = set()
+    for refs in refs_by_key.values():
+        wanted.update(key for key in (refs["parent"], refs["epic"]) if key)
+        wanted.update(link["key"] for link in refs["links"])
+
+    known = {ticket.get("key"): _summary(ticket) for ticket in tickets}
+    missing = sorted(wanted - known.keys())
+    if missing:
+        known.update(lookup_issues(client, missing))
+
+    for ticket in tickets:
+        refs = refs_by_key[ticket.get("key")]
+        ticket["related"] = {
+            "parent": known.get(refs["parent"]),
+            "epic": known.get(refs["epic"]),
+            "links": [{**known.get(link["key"], {"key": link["key"]}), "type": link["type"]}
+                      for link in refs["links"]],
+        }
+
+    return len(missing)
+
+
+def fetch_tickets_search(state: JiraState) -> JiraState:
+    """
+    Fetch tickets matching JIRA_JQL via the search API, with related issues resolved.
+
+    In async graphs this is the join point of the auth and sprint branches.
+    """
+    if state.get("auth_error"):
+        return {**state, "tickets": [], "status": "error", "error": state["auth_error"]}
+    if state["status"] == "error":
+        return {**state, "tickets": []}
+
+    print("🔍 Fetching tickets using JQL search...")
+
+    try:
+        client = get_jira_client(state)
+
+        sprint_name = state["sprint_name"]
+        sprint_id = next((s.get("id") for s in state.get("sprints", []) if s.get("name") == sprint_name), None)
+
+        if "{sprint_id}" in JIRA_JQL and not sprint_id:
+            print(f"❌ Sprint '{sprint_name}' not found in fetched sprints")
+            return {
+                **state,
+                "tickets": [],
+                "status": "error",
+                "error": f"Sprint '{sprint_name}' not found"
+            }
+
+        jql = JIRA_JQL.format(sprint_id=sprint_id, sprint_name=sprint_name, project=state["project_key"])
+        print(f"JQL: {jql}")
+
+        tickets = search_issues(client, jql, search_fields(),
+                                expand="changelog" if JIRA_EXPAND_CHANGELOG else None,
+                                use_cache=not state.get("refresh_tickets"))
+
+        if JIRA_RELATED and tickets:
+            looked_up = resolve_related(client, tickets)
+            print(f"🔗 Resolved related issues ({', '.join(JIRA_RELATED)}), "
+                  f"{looked_up} looked up in batches of {JIRA_KEY_BATCH_SIZE}")
+
+        # Written once related issues are attached, so the export carries them too
+        export_path = None
+        if JIRA_EXPORT:
+            exporter = TicketExporter(export_path_for(state))
+            try:
+                exporter.write_issues(tickets)
+            except Exception:
+                exporter.abort()
+                raise
+            export_path = str(exporter.finalize())
+
+        print(f"✅ Successfully fetched {len(tickets)} tickets")
+
+        return {
+            **state,
+            "tickets": tickets,
+            "export_path": export_path,
+            "status": "success",
+            "error": None
+        }
+
+    except Exception as e:
+        error_msg = f"Exception occurred: {str(e)}"
+        print(f"❌ {error_msg}")
+        return {
+            **state,
+            "tickets": [],
+            "status": "error",
+            "error": error_msg
+        }
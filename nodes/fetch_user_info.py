@@ -2,28 +2,27 @@
 Fetch user information from JIRA
 """
 
-import requests
 from state import JiraState
+from jira_client import get_jira_client
 
 
 def fetch_user_info(state: JiraState) -> JiraState:
     """
     Fetch current user information to verify authentication
     """
+    # Batch runs authenticate once and share the result across targets
+    if state.get("user_info"):
+        print(f"👤 Already authenticated as {state['user_info'].get('displayName', 'N/A')}\n")
+        return state
+
     print("👤 Fetching current user information...\n")
 
     try:
-        base_url = state['jira_url'].rstrip('/')
-        url = f"{base_url}/rest/api/3/myself"
-
-        headers = {
-            "Accept": "application/json",
-        }
-
-        auth = (state['email'], state['api_key'])
+        client = get_jira_client(state)
+        url = f"{client.base_url}/rest/api/3/myself"
 
         # Make GET request to fetch user info
-        response = requests.get(url, headers=headers, auth=auth)
+        response = client.get("/rest/api/3/myself")
 
         print(f"User API Status: {response.status_code}")
         print(f"User API URL: {url}")
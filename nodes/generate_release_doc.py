@@ -2,10 +2,55 @@
 Generate release documentation using ChatGPT
 """
 
+import hashlib
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from openai import OpenAI
-from state import JiraState
-from config import OPENAI_API_KEY, SPRINT_NAME, JIRA_URL
+from typing import TYPE_CHECKING
+from state import JiraState, TicketRecord
+from llm_cache import EntryCache
+from rate_limiter import backoff_delay, get_limiter, retry_after_seconds
+from metrics import record_llm_usage
+from release_renderers import doc_basename, markdown_entry, parse_entries
+from clustering import cluster_records
+from openai_batch import queue_requests
+from ticket_store import ticket_records
+from token_budget import (
+    count_tokens,
+    truncate_to_tokens,
+    output_budget,
+    entries_per_completion,
+    fits_context,
+    exact_counts,
+)
+from config import (
+    OPENAI_API_KEY,
+    OPENAI_MODEL,
+    OPENAI_BASE_URL,
+    JIRA_URL,
+    RELEASE_DOC_CHUNKED,
+    LLM_BATCH_TOKENS,
+    LLM_PARALLELISM,
+    LLM_REQUESTS_PER_MINUTE,
+    LLM_CACHE_ENABLED,
+    LLM_CACHE_MAX_MB,
+    CACHE_DIR,
+    RELEASE_DOC_STREAM,
+    LLM_MAX_RETRIES,
+    LLM_MAX_OUTPUT_TOKENS,
+    LLM_DESCRIPTION_TOKENS,
+    TICKET_CLUSTERING,
+    CLUSTER_SIMILARITY,
+    CLUSTER_MAX_SIZE,
+    OPENAI_BATCH_MODE,
+)
+
+# openai is only imported once generation actually runs, keeping fetch-only startup fast
+if TYPE_CHECKING:
+    from openai import OpenAI
 
 # Get the project root directory (parent of nodes directory)
 PROJECT_ROOT = Path(__file__).parent.parent.absolute()
@@ -14,146 +59,617 @@ DOCS_DIR = PROJECT_ROOT / "docs"
 # Ensure docs directory exists
 DOCS_DIR.mkdir(exist_ok=True)
 
+SYSTEM_PROMPT = "You are a technical documentation writer specializing in clear, concise release notes."
 
-def generate_release_doc(state: JiraState) -> JiraState:
+
+@lru_cache(maxsize=None)
+def _retryable_openai_errors() -> tuple:
     """
-    Generate release documentation using ChatGPT
+    OpenAI errors worth retrying; everything else fails the node immediately
     """
-    print("\n" + "="*80)
-    print("📝 GENERATING RELEASE DOCUMENTATION")
-    print("="*80 + "\n")
+    import openai
 
-    if state["status"] == "error":
-        print(f"❌ Cannot generate release doc: {state['error']}")
-        return state
+    return (
+        openai.RateLimitError,
+        openai.APITimeoutError,
+        openai.APIConnectionError,
+        openai.InternalServerError,
+    )
 
-    tickets = state["tickets"]
 
-    if not tickets:
-        print("No tickets to document.")
-        return state
+# Bump when the way tickets are formatted into the prompt changes; edits to
+# SYSTEM_PROMPT or the prompt template already change the entry cache keys
+PROMPT_VERSION = "5"
 
-    try:
-        # Format tickets data for ChatGPT
-        tickets_data = []
-        for ticket in tickets:
-            key = ticket.get("key", "N/A")
-            fields = ticket.get("fields", {})
-
-            summary = fields.get("summary", "No summary")
-            description = fields.get("description", "")
-            assignee = fields.get("assignee")
-            assignee_name = assignee.get("displayName", "Unassigned") if assignee else "Unassigned"
-            priority = fields.get("priority", {}).get("name", "None")
-            status = fields.get("status", {}).get("name", "Unknown")
-
-            # Handle ADF description format
-            if isinstance(description, dict):
-                description_text = ""
-                if "content" in description:
-                    for content_item in description.get("content", []):
-                        if content_item.get("type") == "paragraph":
-                            for text_item in content_item.get("content", []):
-                                if text_item.get("type") == "text":
-                                    description_text += text_item.get("text", "")
-                            description_text += "\n"
-                description = description_text.strip()
-
-            tickets_data.append({
-                "key": key,
-                "summary": summary,
-                "description": description,
-                "assignee": assignee_name,
-                "priority": priority,
-                "status": status
-            })
-
-        # Create the prompt for ChatGPT
-        jira_base_url = JIRA_URL.rstrip('/')
-        prompt = f"""You are a technical documentation writer creating a release document for a sprint.
+# Regenerations of units a reply left out that made no progress, before giving up on them
+ENTRY_RETRIES = 2
 
-**IMPORTANT FORMAT REQUIREMENTS:**
-Start with "* Change log" header, then list each ticket using this EXACT format with clickable links:
 
-* Change log
-1. [[TICKET-KEY]({jira_base_url}/browse/TICKET-KEY)] [Component Tags] Title
-Description paragraph (2-3 sentences) explaining what the ticket accomplishes, the problem it solves, and its impact.
+def _with_unit_keys(entries: list, unit_keys: dict) -> list:
+    """
+    Give each grouped unit's entry the keys of every ticket it covers
+    """
+    for entry in entries:
+        keys = unit_keys.get(entry["key"])
+        if keys:
+            entry["keys"] = keys
+    return entries
+
+
+def _unit_keys(units: list) -> dict:
+    return {unit[0].key: [ticket.key for ticket in unit] for unit in units if len(unit) > 1}
+
+
+class _StreamWriter:
+    """
+    Appends streamed entries to the in-progress markdown doc as each JSON line completes.
+
+    Each stream buffers its own text and only writes whole lines, so
+    concurrent batches never interleave mid-entry.
+    """
+
+    def __init__(self, path: Path, header: str, jira_base_url: str, unit_keys: dict):
+        self.path = path
+        self.jira_base_url = jira_base_url
+        self.unit_keys = unit_keys
+        self.count = 0
+        self._file = open(path, "w")
+        self._file.write(header)
+        self._file.flush()
+        self._lock = threading.Lock()
+
+    def feed(self, buffer: list, text: str):
+        buffer.append(text)
+        pending = "".join(buffer)
+        cut = pending.rfind("\n")
+        if cut != -1:
+            buffer[:] = [pending[cut + 1:]]
+            self._write(_with_unit_keys(parse_entries(pending[:cut + 1]), self.unit_keys))
+
+    def finish(self, buffer: list):
+        self._write(_with_unit_keys(parse_entries("".join(buffer)), self.unit_keys))
+        buffer.clear()
+
+    def _write(self, entries: list):
+        with self._lock:
+            for entry in entries:
+                self.count += 1
+                self._file.write(markdown_entry(self.count, entry, self.jira_base_url) + "\n")
+            self._file.flush()
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+@lru_cache(maxsize=4096)
+def _truncated_description(description: str) -> tuple[str, bool]:
+    return truncate_to_tokens(description, LLM_DESCRIPTION_TOKENS)
+
+
+def _related_lines(ticket: TicketRecord) -> str:
+    lines = ""
+    if ticket.parent:
+        lines += f"\nParent: {ticket.parent}"
+    if ticket.links:
+        lines += f"\nLinked: {ticket.links}"
+    return lines
+
+
+def _format_unit(idx: int, unit: list) -> str:
+    """
+    Prompt text for one unit: a single ticket, or a cluster described once by its first ticket
+    """
+    ticket = unit[0]
+    description, _ = _truncated_description(ticket.description)
+
+    group = ""
+    if len(unit) > 1:
+        others = unit[1:]
+        group = (f"Group of {len(unit)} closely related tickets, write ONE entry for all of them\n"
+                 f"Also covers: {', '.join(other.key for other in others)}\n"
+                 f"Related summaries: {'; '.join(other.summary for other in others)}\n")
+
+    return f"""
+Ticket #{idx}:
+Key: {ticket.key}
+{group}Summary: {ticket.summary}
+Description: {description}
+Assignee: {ticket.assignee}
+Priority: {ticket.priority}
+Status: {ticket.status}{_related_lines(ticket)}
+---
+"""
+
+
+def _build_prompt(units: list) -> str:
+    """
+    Build the change log prompt for one batch of prompt units.
+
+    The model only returns structured content; links, numbering and markup
+    are added locally by release_renderers.
+    """
+    header = """You are a technical documentation writer creating a release document for a sprint.
 
-2. [[TICKET-KEY]({jira_base_url}/browse/TICKET-KEY)] [Component Tags] Title
-Description paragraph...
+**IMPORTANT FORMAT REQUIREMENTS:**
+Return JSON Lines: exactly one JSON object per ticket, one per line, in the order the tickets are given:
+{"key": "TICKET-KEY", "tags": ["Component", ...], "title": "Title", "blurb": "Description"}
 
 **EXAMPLE:**
-* Change log
-1. [[SPARK-3352]({jira_base_url}/browse/SPARK-3352)] [JAMS] [ML] Preserve Original Character Names Throughout the Pipeline
-Ensures that original character names are retained and propagated consistently across the entire ML pipeline. Prevents unintended renaming or loss of identity metadata between stages, improving traceability and output correctness.
+{"key": "SPARK-3352", "tags": ["JAMS", "ML"], "title": "Preserve Original Character Names Throughout the Pipeline", "blurb": "Ensures that original character names are retained and propagated consistently across the entire ML pipeline. Prevents unintended renaming or loss of identity metadata between stages, improving traceability and output correctness."}
 
 **INSTRUCTIONS:**
-1. Make the ticket key a clickable markdown link: [[TICKET-KEY]({jira_base_url}/browse/TICKET-KEY)]
-2. Extract component tags from the summary (e.g., [JAMS], [ML], [Backend], [API])
+1. Copy the ticket key exactly
+2. Extract component tags from the summary (e.g., JAMS, ML, Backend, API), without brackets
 3. Remove the tags from the title to avoid duplication
-4. Write clear 2-3 sentence descriptions focusing on:
+4. Write a clear 2-3 sentence blurb focusing on:
    - What the change accomplishes
    - What problem it solves
    - Impact on the system/users
-5. Number entries sequentially (1, 2, 3...)
-6. Keep the title concise and descriptive
+5. Keep the title concise and descriptive
+6. Use a ticket's Parent and Linked issues only as context for the blurb; do not document them separately
+7. A ticket marked as a group gets exactly one object: copy its Key and describe the combined change
 
 **Here are the tickets to document:**
 
 """
-        for idx, ticket in enumerate(tickets_data, 1):
-            prompt += f"""
-Ticket #{idx}:
-Key: {ticket['key']}
-Summary: {ticket['summary']}
-Description: {ticket['description']}
-Assignee: {ticket['assignee']}
-Priority: {ticket['priority']}
-Status: {ticket['status']}
----
-"""
-
-        prompt += """
+    footer = """
 
 **OUTPUT:**
-Return ONLY the markdown-formatted change log starting with "* Change log". No additional commentary or explanations."""
+Return ONLY the JSON Lines, one object per ticket. No markdown, code fences, commentary or explanations."""
+
+    parts = [header]
+    parts.extend(_format_unit(idx, unit) for idx, unit in enumerate(units, 1))
+    parts.append(footer)
+    return "".join(parts)
+
+
+def _make_batches(units: list, token_budget: int) -> list:
+    """
+    Greedily group prompt units into batches whose text fits the token budget
+    and whose entries fit one completion's output budget
+    """
+    max_units = entries_per_completion()
+    batches = []
+    current = []
+    current_tokens = 0
+
+    for idx, unit in enumerate(units, 1):
+        ticket_tokens = count_tokens(_format_unit(idx, unit))
+        if current and (current_tokens + ticket_tokens > token_budget or len(current) >= max_units):
+            batches.append(current)
+            current = []
+            current_tokens = 0
+        current.append(unit)
+        current_tokens += ticket_tokens
+
+    if current:
+        batches.append(current)
+
+    return batches
+
+
+def _report_budget(budgets: list, units: list):
+    """
+    Print the prompt/completion token budget for a run's requests
+    """
+    prompt_tokens = sum(prompt for prompt, _ in budgets)
+    max_tokens = sum(completion for _, completion in budgets)
+    # Only a unit's first ticket has its description in the prompt
+    truncated = sum(_truncated_description(unit[0].description)[1] for unit in units)
+    counting = "tiktoken" if exact_counts() else "estimated"
+
+    print(f"🧮 Token budget: {prompt_tokens} prompt + {max_tokens} max completion tokens "
+          f"over {len(budgets)} request(s) ({counting}); "
+          f"{truncated}/{len(units)} descriptions cut to {LLM_DESCRIPTION_TOKENS} tokens")
+
+
+def _openai_limiter():
+    return get_limiter("OpenAI", LLM_REQUESTS_PER_MINUTE / 60, LLM_PARALLELISM)
 
-        # Initialize OpenAI client
-        client = OpenAI(api_key=OPENAI_API_KEY)
 
-        print("🤖 Calling ChatGPT to generate release documentation...")
+def _with_retries(request, hold_slot: bool = False):
+    """
+    Run a raw-response OpenAI request under the shared limiter, retrying throttles
+    and transient errors with jittered backoff that honors Retry-After.
+
+    With hold_slot a successful request keeps its concurrency slot, and the
+    caller releases it once the returned stream has been read to the end.
+    """
+    limiter = _openai_limiter()
+    attempt = 0
+
+    while True:
+        limiter.acquire()
+        held = False
+        try:
+            raw = request()
+            held = hold_slot
+        except _retryable_openai_errors() as e:
+            # An exhausted quota will not recover by waiting
+            if attempt >= LLM_MAX_RETRIES or getattr(e, "code", None) == "insufficient_quota":
+                raise
+            response = getattr(e, "response", None)
+            retry_after = retry_after_seconds(response.headers) if response is not None else None
+            delay = backoff_delay(attempt, retry_after)
+            print(f"   🔁 OpenAI {type(e).__name__}, retrying in {delay:.1f}s")
+            throttled = isinstance(e, _retryable_openai_errors()[0])
+            raw = None
+        finally:
+            if not held:
+                limiter.release()
+
+        if raw is not None:
+            limiter.on_success(raw.headers)
+            try:
+                return raw.parse()
+            except BaseException:
+                if held:
+                    limiter.release()
+                raise
+
+        if throttled:
+            limiter.on_throttle(delay)
+        else:
+            time.sleep(delay)
+        attempt += 1
+
+
+def _messages(prompt: str) -> list:
+    return [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": prompt}
+    ]
+
+
+def _complete(client: "OpenAI", prompt: str, max_tokens: int,
+              progress: _StreamWriter | None = None) -> tuple[str, bool]:
+    """
+    The reply text, and whether it was cut off at max_tokens
+    """
+    messages = _messages(prompt)
 
+    if progress is None:
         # Make API call using gpt-4o (128k context window)
-        response = client.chat.completions.create(
-            model="gpt-4o",
-            messages=[
-                {"role": "system", "content": "You are a technical documentation writer specializing in clear, concise release notes."},
-                {"role": "user", "content": prompt}
-            ],
+        response = _with_retries(lambda: client.chat.completions.with_raw_response.create(
+            model=OPENAI_MODEL,
+            messages=messages,
             temperature=0.7,
-            max_tokens=16000  # Increased to handle large sprints with many tickets
-        )
+            max_tokens=max_tokens
+        ))
+        if response.usage is not None:
+            record_llm_usage(response.usage.prompt_tokens, response.usage.completion_tokens)
+            print(f"   🧮 Used {response.usage.prompt_tokens} prompt + "
+                  f"{response.usage.completion_tokens}/{max_tokens} completion tokens")
+        choice = response.choices[0]
+        return choice.message.content or "", choice.finish_reason == "length"
+
+    return _complete_streaming(client, messages, max_tokens, progress)
+
+
+def _complete_streaming(client: "OpenAI", messages: list, max_tokens: int,
+                        progress: _StreamWriter) -> tuple[str, bool]:
+    """
+    Stream a completion into the in-progress doc and report TTFT and tokens/sec
+    """
+    start = time.perf_counter()
+    first_token_at = None
+    prompt_tokens = None
+    completion_tokens = None
+    finish_reason = None
+    chunks = 0
+    pieces = []
+    buffer = []
+
+    stream = _with_retries(lambda: client.chat.completions.with_raw_response.create(
+        model=OPENAI_MODEL,
+        messages=messages,
+        temperature=0.7,
+        max_tokens=max_tokens,
+        stream=True,
+        stream_options={"include_usage": True},
+    ), hold_slot=True)
+
+    # The stream counts against the concurrency limit until it has been read
+    try:
+        for chunk in stream:
+            # The final usage chunk carries no choices
+            if chunk.usage is not None:
+                prompt_tokens = chunk.usage.prompt_tokens
+                completion_tokens = chunk.usage.completion_tokens
+            if not chunk.choices:
+                continue
+            finish_reason = chunk.choices[0].finish_reason or finish_reason
+            text = chunk.choices[0].delta.content
+            if not text:
+                continue
+            if first_token_at is None:
+                first_token_at = time.perf_counter()
+            chunks += 1
+            pieces.append(text)
+            progress.feed(buffer, text)
+    finally:
+        stream.close()
+        _openai_limiter().release()
+
+    progress.finish(buffer)
+
+    end = time.perf_counter()
+    tokens = completion_tokens or chunks
+    record_llm_usage(prompt_tokens, tokens)
+    if first_token_at is not None:
+        generation_seconds = max(end - first_token_at, 1e-6)
+        print(f"   ⚡ First token after {first_token_at - start:.2f}s, "
+              f"{tokens} tokens at {tokens / generation_seconds:.1f} tokens/s")
 
-        release_doc = response.choices[0].message.content
+    return "".join(pieces), finish_reason == "length"
 
-        # Save to markdown file in docs directory
-        filename = f"release_doc_{SPRINT_NAME.replace(' ', '_').replace(':', '')}.md"
-        filepath = DOCS_DIR / filename
-        with open(filepath, "w") as f:
-            f.write(f"# Release Documentation - {SPRINT_NAME}\n\n")
-            f.write(release_doc)
 
-        print(f"✅ Release documentation generated successfully!")
-        print(f"📄 Saved to: {filepath}\n")
+def _in_unit_order(entries: list, units: list) -> list:
+    order = {unit[0].key: idx for idx, unit in enumerate(units)}
+    return sorted(entries, key=lambda entry: order.get(entry["key"], len(order)))
 
-        # Print preview
-        print("Preview:")
-        print("-" * 80)
-        print(release_doc[:500] + "..." if len(release_doc) > 500 else release_doc)
-        print("-" * 80)
 
+def _render_units(client: "OpenAI", units: list, progress: _StreamWriter | None = None,
+                  prompt: str | None = None, max_tokens: int | None = None, attempt: int = 0) -> list:
+    """
+    Entries for one request's prompt units, regenerating the units its reply left out.
+
+    A reply cut off at max_tokens, or one that skipped units, is retried for
+    just the missing units, split in half; a single unit that was cut off gets
+    twice the output budget. Units still missing after ENTRY_RETRIES are reported.
+    """
+    prompt = prompt or _build_prompt(units)
+    max_tokens = max_tokens or output_budget(len(units))
+    text, truncated = _complete(client, prompt, max_tokens, progress=progress)
+    entries = parse_entries(text)
+
+    returned = {entry["key"] for entry in entries}
+    missing = [unit for unit in units if unit[0].key not in returned]
+    if not missing:
+        return entries
+
+    keys = ", ".join(unit[0].key for unit in missing)
+    # Splits that keep making progress always terminate; only fruitless retries are counted
+    if len(missing) == len(units):
+        attempt += 1
+    if attempt > ENTRY_RETRIES:
+        print(f"❌ No change log entry for {keys} after {ENTRY_RETRIES} retries; "
+              f"they are missing from the release doc")
+        return entries
+
+    cause = f"was cut off at {max_tokens} tokens" if truncated else "left out units"
+    print(f"   ✂️  Reply {cause}; regenerating {len(missing)} of {len(units)} units: {keys}")
+
+    if len(missing) == 1:
+        retry_tokens = min(LLM_MAX_OUTPUT_TOKENS, 2 * max_tokens) if truncated else None
+        retried = _render_units(client, missing, progress, max_tokens=retry_tokens, attempt=attempt)
+    else:
+        half = len(missing) // 2
+        retried = (_render_units(client, missing[:half], progress, attempt=attempt)
+                   + _render_units(client, missing[half:], progress, attempt=attempt))
+
+    return _in_unit_order(entries + retried, units)
+
+
+def _generate_chunked(client: "OpenAI", units: list, progress: _StreamWriter | None = None) -> list:
+    """
+    Map-reduce generation: render token-budgeted batches concurrently, return entries in order
+    """
+    batches = _make_batches(units, LLM_BATCH_TOKENS)
+    prompts = [_build_prompt(batch) for batch in batches]
+    max_tokens = [output_budget(len(batch)) for batch in batches]
+
+    print(f"🧩 Split {len(units)} prompt units into {len(batches)} batches "
+          f"(~{LLM_BATCH_TOKENS} tokens each, parallelism {LLM_PARALLELISM})")
+    _report_budget([(count_tokens(prompt), limit) for prompt, limit in zip(prompts, max_tokens)], units)
+
+    def render(batch_idx_and_batch):
+        batch_idx, batch = batch_idx_and_batch
+        start = time.perf_counter()
+        entries = _render_units(client, batch, progress, prompts[batch_idx - 1], max_tokens[batch_idx - 1])
+        print(f"   ✅ Batch {batch_idx}/{len(batches)} ({len(batch)} units) "
+              f"in {time.perf_counter() - start:.1f}s")
+        return entries
+
+    with ThreadPoolExecutor(max_workers=max(1, LLM_PARALLELISM)) as executor:
+        batch_entries = list(executor.map(render, enumerate(batches, 1)))
+
+    return [entry for entries in batch_entries for entry in entries]
+
+
+@lru_cache(maxsize=None)
+def _openai_client() -> "OpenAI":
+    """
+    One pooled OpenAI client per process; retries are handled by the shared scheduler
+    """
+    from openai import OpenAI
+
+    return OpenAI(api_key=OPENAI_API_KEY, base_url=OPENAI_BASE_URL, max_retries=0)
+
+
+def _generate_entries(units: list, progress: _StreamWriter | None = None) -> list:
+    """
+    Generate one change log entry per prompt unit with ChatGPT
+    """
+    client = _openai_client()
+
+    print(f"🤖 Calling ChatGPT to generate release documentation for {len(units)} prompt units...")
+    unit_keys = _unit_keys(units)
+
+    if RELEASE_DOC_CHUNKED:
+        return _with_unit_keys(_generate_chunked(client, units, progress), unit_keys)
+
+    # A clamped output budget would cut the reply off partway through the entries
+    if len(units) > entries_per_completion():
+        print(f"⚠️  {len(units)} prompt units need more than {LLM_MAX_OUTPUT_TOKENS} completion tokens; "
+              f"switching to chunked generation")
+        return _with_unit_keys(_generate_chunked(client, units, progress), unit_keys)
+
+    prompt = _build_prompt(units)
+    prompt_tokens = count_tokens(prompt)
+    max_tokens = output_budget(len(units))
+
+    if not fits_context(prompt_tokens, max_tokens):
+        print(f"⚠️  Prompt needs {prompt_tokens} + {max_tokens} tokens, more than the context window; "
+              f"switching to chunked generation")
+        return _with_unit_keys(_generate_chunked(client, units, progress), unit_keys)
+
+    _report_budget([(prompt_tokens, max_tokens)], units)
+    return _with_unit_keys(_render_units(client, units, progress, prompt, max_tokens), unit_keys)
+
+
+@lru_cache(maxsize=None)
+def _prompt_fingerprint() -> str:
+    """
+    Prompt version for the entry cache, derived from the prompt text itself
+    """
+    prompt_text = "\n".join([PROMPT_VERSION, SYSTEM_PROMPT, _build_prompt([])])
+    return hashlib.sha256(prompt_text.encode("utf-8")).hexdigest()[:16]
+
+
+def _lookup_cached(cache: EntryCache, units: list) -> tuple[dict, dict, list]:
+    """
+    Cache keys per unit, cached entries by first ticket key, and the units to generate
+    """
+    cache_keys = {
+        unit[0].key: cache.make_unit_key(unit, _prompt_fingerprint(), OPENAI_MODEL) for unit in units
+    }
+
+    entries_by_key = {}
+    misses = []
+    for unit in units:
+        cached = cache.get(cache_keys[unit[0].key])
+        if cached is None:
+            misses.append(unit)
+        else:
+            entries_by_key[unit[0].key] = json.loads(cached)
+
+    return cache_keys, entries_by_key, misses
+
+
+def _generate_with_cache(units: list, progress: _StreamWriter | None = None) -> list:
+    """
+    Serve unchanged prompt units from the entry cache and only generate the misses
+    """
+    cache = EntryCache(CACHE_DIR / "llm", LLM_CACHE_MAX_MB * 1024 * 1024)
+    cache_keys, entries_by_key, misses = _lookup_cached(cache, units)
+
+    unmatched = []
+    if misses:
+        for entry in _generate_entries(misses, progress):
+            key = entry["key"]
+            if key in cache_keys and key not in entries_by_key:
+                entries_by_key[key] = entry
+                cache.put(cache_keys[key], json.dumps(entry))
+            else:
+                unmatched.append(entry)
+        cache.evict()
+
+    print(f"💰 LLM entry cache: {cache.hits} hits, {cache.misses} misses "
+          f"({cache.hit_rate():.0%} of prompt units served without an OpenAI call)")
+
+    # Stitch entries back in unit order
+    entries = [entries_by_key[unit[0].key] for unit in units if unit[0].key in entries_by_key]
+    return entries + unmatched
+
+
+def _generate_deferred(units: list, basename: str) -> list:
+    """
+    Batch API mode: return entries only when every unit is cached (e.g. collected
+    from an earlier batch), otherwise queue the misses for the next submission
+    """
+    cache = EntryCache(CACHE_DIR / "llm", LLM_CACHE_MAX_MB * 1024 * 1024)
+    cache_keys, entries_by_key, misses = _lookup_cached(cache, units)
+
+    if not misses:
+        print(f"📥 All {len(units)} prompt units served from collected batch results")
+        return [entries_by_key[unit[0].key] for unit in units]
+
+    requests = []
+    for idx, batch in enumerate(_make_batches(misses, LLM_BATCH_TOKENS), 1):
+        body = {
+            "model": OPENAI_MODEL,
+            "messages": _messages(_build_prompt(batch)),
+            "temperature": 0.7,
+            "max_tokens": output_budget(len(batch)),
+        }
+        units_by_key = {
+            unit[0].key: {"cache_key": cache_keys[unit[0].key], "keys": [ticket.key for ticket in unit]}
+            for unit in batch
+        }
+        requests.append((f"{basename}-{idx}", body, units_by_key))
+
+    path = queue_requests(basename, requests)
+    print(f"📨 Queued {len(misses)} of {len(units)} prompt units as {len(requests)} batch requests in {path}; "
+          f"they are submitted when the run ends. Run again with --collect to write the docs")
+    return []
+
+
+def _prompt_units(tickets_data: list) -> list:
+    """
+    One unit per ticket, or clusters of near-duplicate tickets grouped by component
+    """
+    if not TICKET_CLUSTERING:
+        return [[ticket] for ticket in tickets_data]
+
+    start = time.perf_counter()
+    units = cluster_records(tickets_data, CLUSTER_SIMILARITY, CLUSTER_MAX_SIZE)
+    grouped = sum(len(unit) for unit in units if len(unit) > 1)
+    print(f"🧬 Clustered {len(tickets_data)} tickets into {len(units)} prompt units "
+          f"({grouped} tickets in {sum(len(unit) > 1 for unit in units)} groups) "
+          f"in {time.perf_counter() - start:.2f}s")
+    return units
+
+
+def generate_release_doc(state: JiraState) -> JiraState:
+    """
+    Generate structured change log entries using ChatGPT; render_release_docs writes the files
+    """
+    print("\n" + "="*80)
+    print("📝 GENERATING RELEASE DOCUMENTATION")
+    print("="*80 + "\n")
+
+    if state["status"] == "error":
+        print(f"❌ Cannot generate release doc: {state['error']}")
+        return state
+
+    tickets_data = ticket_records(state)
+
+    if not tickets_data:
+        print("No tickets to document.")
         return state
 
+    progress = None
+    try:
+        jira_base_url = JIRA_URL.rstrip('/')
+        sprint_name = state["sprint_name"]
+        units = _prompt_units(tickets_data)
+
+        # In streaming mode entries appear in a .partial markdown file while they are generated
+        if RELEASE_DOC_STREAM and not OPENAI_BATCH_MODE:
+            partial_path = DOCS_DIR / f"{doc_basename(state)}.md.partial"
+            progress = _StreamWriter(partial_path, f"# Release Documentation - {sprint_name}\n\n* Change log\n",
+                                     jira_base_url, _unit_keys(units))
+            print(f"📡 Streaming entries to {partial_path}")
+
+        if OPENAI_BATCH_MODE:
+            entries = _generate_deferred(units, doc_basename(state))
+            if not entries:
+                # Nothing to render until the queued batch is collected
+                return {**state, "release_entries": []}
+        elif LLM_CACHE_ENABLED:
+            entries = _generate_with_cache(units, progress)
+        else:
+            entries = _generate_entries(units, progress)
+
+        print(f"✅ Generated {len(entries)} change log entries for {len(tickets_data)} tickets")
+
+        return {
+            **state,
+            "release_entries": entries,
+        }
+
     except Exception as e:
         error_msg = f"Failed to generate release doc: {str(e)}"
         print(f"❌ {error_msg}")
@@ -161,3 +677,7 @@ Return ONLY the markdown-formatted change log starting with "* Change log". No a
             **state,
             "error": error_msg
         }
+
+    finally:
+        if progress is not None:
+            progress.close()
@@ -0,0 +1,127 @@
+"""
+Normalize raw JIRA issues into compact ticket records
+"""
+
+from state import JiraState, TicketRecord
+from adf import adf_to_text
+from config import KEEP_RAW_TICKETS, TICKET_STORE, CHECKPOINT_ENABLED
+from ticket_store import TicketStore, register_store, save_store
+
+
+def _name(value, attr: str = "name", default: str = "Unknown") -> str:
+    """
+    Read a display attribute from a nested JIRA object such as status or priority
+    """
+    if isinstance(value, dict):
+        return value.get(attr) or default
+    return default
+
+
+def _sprint_name(fields: dict) -> str:
+    """
+    Resolve the sprint name across the sprint field formats JIRA returns
+    """
+    sprint_field = fields.get("sprint")
+
+    if sprint_field:
+        # Handle list of sprints (common in standard API)
+        if isinstance(sprint_field, list):
+            first = sprint_field[0]
+            return first.get("name", "Unknown") if isinstance(first, dict) else str(first)
+        # Handle single sprint object (common in Agile API)
+        if isinstance(sprint_field, dict):
+            return sprint_field.get("name", "Unknown")
+        # Handle string sprint name
+        if isinstance(sprint_field, str):
+            return sprint_field
+
+    # If still no sprint, check custom fields
+    for field_key, field_value in fields.items():
+        if "sprint" in field_key.lower() and field_value:
+            if isinstance(field_value, list):
+                first = field_value[0]
+                return first.get("name", "Unknown") if isinstance(first, dict) else str(first)
+            if isinstance(field_value, dict):
+                return field_value.get("name", "Unknown")
+
+    return "No Sprint"
+
+
+def _related_text(issue: dict | None) -> str:
+    if not issue:
+        return ""
+    kind = f" ({issue['issue_type']})" if issue.get("issue_type") else ""
+    return f"{issue['key']}{kind}: {issue.get('summary') or 'No summary'}"
+
+
+def _parent(related: dict) -> str:
+    """
+    Parent and epic, listed once when they are the same issue
+    """
+    parts = [_related_text(related.get("parent")), _related_text(related.get("epic"))]
+    return "; ".join(dict.fromkeys(part for part in parts if part))
+
+
+def _links(related: dict) -> str:
+    return "; ".join(f"{link['type']} {_related_text(link)}" for link in related.get("links") or [])
+
+
+def normalize_ticket(ticket: dict) -> TicketRecord:
+    """
+    Build a TicketRecord from a raw JIRA issue
+    """
+    fields = ticket.get("fields", {})
+    related = ticket.get("related") or {}
+
+    return TicketRecord(
+        key=ticket.get("key", "N/A"),
+        id=str(ticket.get("id", "N/A")),
+        summary=fields.get("summary") or "No summary",
+        description=adf_to_text(fields.get("description")),
+        status=_name(fields.get("status")),
+        priority=_name(fields.get("priority"), default="None"),
+        issue_type=_name(fields.get("issuetype")),
+        project=_name(fields.get("project"), attr="key"),
+        assignee=_name(fields.get("assignee"), attr="displayName", default="Unassigned"),
+        sprint=_sprint_name(fields),
+        created=fields.get("created") or "Unknown",
+        updated=fields.get("updated") or "Unknown",
+        parent=_parent(related),
+        links=_links(related),
+    )
+
+
+def normalize_tickets(state: JiraState) -> JiraState:
+    """
+    Normalize every fetched ticket once for the display and generation nodes
+    """
+    if state["status"] == "error":
+        return state
+
+    if TICKET_STORE:
+        store = TicketStore()
+        for ticket in state["tickets"]:
+            store.add(normalize_ticket(ticket))
+
+        print(f"🧹 Normalized {len(store)} tickets into a columnar store "
+              f"({len(store.distinct('status'))} statuses, {len(store.distinct('assignee'))} assignees)")
+
+        return {
+            **state,
+            "records": [],
+            "ticket_store_id": register_store(store),
+            # Checkpoints only hold the reference; the saved table lets a later process reload it
+            "ticket_store_path": save_store(store, state) if CHECKPOINT_ENABLED else None,
+            "tickets": state["tickets"] if KEEP_RAW_TICKETS else [],
+        }
+
+    records = [normalize_ticket(ticket) for ticket in state["tickets"]]
+
+    print(f"🧹 Normalized {len(records)} tickets")
+
+    return {
+        **state,
+        "records": records,
+        # Raw payloads are only needed for the JSON dump
+        "tickets": state["tickets"] if KEEP_RAW_TICKETS else [],
+    }
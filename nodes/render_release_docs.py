@@ -0,0 +1,60 @@
+"""
+Render the generated change log entries into every configured doc format
+"""
+
+from pathlib import Path
+
+from state import JiraState
+from config import JIRA_URL, RELEASE_DOC_FORMATS
+from release_renderers import doc_basename, render_all, render_markdown
+
+# Get the project root directory (parent of nodes directory)
+PROJECT_ROOT = Path(__file__).parent.parent.absolute()
+DOCS_DIR = PROJECT_ROOT / "docs"
+
+
+def render_release_docs(state: JiraState) -> JiraState:
+    """
+    Write Markdown, HTML, Confluence storage and JSON docs in parallel from one set of entries
+    """
+    entries = state.get("release_entries") or []
+
+    if state["status"] == "error" or state.get("error") or not entries:
+        return state
+
+    try:
+        jira_base_url = JIRA_URL.rstrip('/')
+        sprint_name = state["sprint_name"]
+
+        basename = doc_basename(state)
+
+        paths = render_all(sprint_name, entries, jira_base_url, DOCS_DIR, RELEASE_DOC_FORMATS, basename)
+
+        # The streamed preview is superseded by the final docs
+        (DOCS_DIR / f"{basename}.md.partial").unlink(missing_ok=True)
+
+        print(f"✅ Release documentation generated successfully!")
+        for name, path in paths.items():
+            print(f"📄 {name}: {path}")
+
+        # Print preview
+        release_doc = render_markdown(sprint_name, entries, jira_base_url)
+        print("\nPreview:")
+        print("-" * 80)
+        print(release_doc[:500] + "..." if len(release_doc) > 500 else release_doc)
+        print("-" * 80)
+
+        return {
+            **state,
+            # The batch index links the markdown doc, or the first format written
+            "release_doc_path": paths.get("markdown") or next(iter(paths.values()), None),
+            "release_doc_paths": paths,
+        }
+
+    except Exception as e:
+        error_msg = f"Failed to render release docs: {str(e)}"
+        print(f"❌ {error_msg}")
+        return {
+            **state,
+            "error": error_msg
+        }
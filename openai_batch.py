@@ -0,0 +1,226 @@
+"""
+Deferred release doc generation through the OpenAI Batch API.
+
+In OPENAI_BATCH_MODE, generate_release_doc queues the prompts for entries
+missing from the entry cache instead of calling the API, one JSONL file per
+sprint. The entry point submits everything queued during the run as one
+batch. A later run with --collect downloads the finished batches into the
+entry cache, and its graph runs then render the docs from cache hits.
+"""
+
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+from config import (
+    OPENAI_API_KEY,
+    OPENAI_BASE_URL,
+    OPENAI_BATCH_WINDOW,
+    OPENAI_BATCH_POLL_SECONDS,
+    CACHE_DIR,
+    LLM_CACHE_MAX_MB,
+)
+from llm_cache import EntryCache
+from metrics import record_llm_usage
+from release_renderers import parse_entries
+
+BATCH_DIR = CACHE_DIR / "openai_batch"
+PENDING_DIR = BATCH_DIR / "pending"
+MANIFEST_PATH = BATCH_DIR / "manifest.json"
+
+ENDPOINT = "/v1/chat/completions"
+# Batch API limit on requests per input file
+MAX_REQUESTS_PER_BATCH = 50000
+FINISHED_STATUSES = {"collected", "failed", "expired", "cancelled"}
+
+_manifest_lock = threading.Lock()
+
+
+def _client():
+    from openai import OpenAI
+
+    return OpenAI(api_key=OPENAI_API_KEY, base_url=OPENAI_BASE_URL)
+
+
+def _load_manifest() -> dict:
+    if not MANIFEST_PATH.exists():
+        return {"batches": []}
+    with open(MANIFEST_PATH) as f:
+        return json.load(f)
+
+
+def _save_manifest(manifest: dict):
+    BATCH_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = MANIFEST_PATH.with_name(MANIFEST_PATH.name + ".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, MANIFEST_PATH)
+
+
+def queue_requests(name: str, requests: list) -> Path:
+    """
+    Queue one sprint's chat completion requests for the next batch submission.
+
+    `requests` holds (custom_id, body, units) tuples, where units maps each
+    prompt unit's first ticket key to its entry cache key and ticket keys.
+    Queuing the same name again replaces its earlier requests.
+    """
+    PENDING_DIR.mkdir(parents=True, exist_ok=True)
+    path = PENDING_DIR / f"{name}.jsonl"
+    tmp_path = path.with_name(path.name + ".tmp")
+
+    with open(tmp_path, "w") as f:
+        for custom_id, body, units in requests:
+            f.write(json.dumps({"custom_id": custom_id, "method": "POST", "url": ENDPOINT, "body": body}) + "\n")
+    with open(path.with_suffix(".units.json"), "w") as f:
+        json.dump({custom_id: units for custom_id, _, units in requests}, f)
+    os.replace(tmp_path, path)
+
+    return path
+
+
+def submit_pending() -> list:
+    """
+    Upload every queued request as Batch API input files and start the batches
+    """
+    pending = sorted(PENDING_DIR.glob("*.jsonl")) if PENDING_DIR.exists() else []
+    if not pending:
+        return []
+
+    lines = []
+    units = {}
+    for path in pending:
+        with open(path) as f:
+            lines.extend(line for line in f if line.strip())
+        with open(path.with_suffix(".units.json")) as f:
+            units.update(json.load(f))
+
+    client = _client()
+    stamp = datetime.now().strftime("%Y%m%dT%H%M%S")
+    submitted = []
+
+    for part, start in enumerate(range(0, len(lines), MAX_REQUESTS_PER_BATCH), 1):
+        chunk = lines[start:start + MAX_REQUESTS_PER_BATCH]
+        input_path = BATCH_DIR / f"batch_{stamp}_{part}.jsonl"
+        with open(input_path, "w") as f:
+            f.writelines(chunk)
+
+        with open(input_path, "rb") as f:
+            uploaded = client.files.create(file=f, purpose="batch")
+        batch = client.batches.create(
+            input_file_id=uploaded.id,
+            endpoint=ENDPOINT,
+            completion_window=OPENAI_BATCH_WINDOW,
+            metadata={"source": "release-docs"},
+        )
+
+        custom_ids = [json.loads(line)["custom_id"] for line in chunk]
+        submitted.append({
+            "id": batch.id,
+            "status": batch.status,
+            "input_file": str(input_path),
+            "submitted_at": datetime.now().isoformat(timespec="seconds"),
+            "requests": len(chunk),
+            "units": {custom_id: units[custom_id] for custom_id in custom_ids},
+        })
+        print(f"📨 Submitted OpenAI batch {batch.id} with {len(chunk)} requests")
+
+    with _manifest_lock:
+        manifest = _load_manifest()
+        manifest["batches"].extend(submitted)
+        _save_manifest(manifest)
+
+    for path in pending:
+        path.with_suffix(".units.json").unlink(missing_ok=True)
+        path.unlink()
+
+    return submitted
+
+
+def _store_results(client, batch, record: dict, cache: EntryCache) -> int:
+    """
+    Put the entries of a completed batch into the entry cache; returns entries stored
+    """
+    stored = 0
+    failed = 0
+
+    output = client.files.content(batch.output_file_id).text if batch.output_file_id else ""
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        result = json.loads(line)
+        response = result.get("response") or {}
+        units = record["units"].get(result.get("custom_id"), {})
+
+        if response.get("status_code") != 200:
+            failed += 1
+            continue
+
+        body = response["body"]
+        usage = body.get("usage") or {}
+        record_llm_usage(usage.get("prompt_tokens"), usage.get("completion_tokens"))
+
+        for entry in parse_entries(body["choices"][0]["message"]["content"]):
+            unit = units.get(entry["key"])
+            if unit is None:
+                continue
+            if len(unit["keys"]) > 1:
+                entry["keys"] = unit["keys"]
+            cache.put(unit["cache_key"], json.dumps(entry))
+            stored += 1
+
+    if failed or batch.error_file_id:
+        print(f"⚠️  Batch {batch.id}: {failed} requests failed; their tickets are queued again on the next run")
+
+    return stored
+
+
+def collect_batches(wait: bool = False) -> int:
+    """
+    Download finished batches into the entry cache, optionally polling until none are running.
+
+    Returns the number of entries stored.
+    """
+    with _manifest_lock:
+        manifest = _load_manifest()
+
+    open_batches = [record for record in manifest["batches"] if record["status"] not in FINISHED_STATUSES]
+    if not open_batches:
+        print("📭 No submitted OpenAI batches to collect")
+        return 0
+
+    client = _client()
+    cache = EntryCache(CACHE_DIR / "llm", LLM_CACHE_MAX_MB * 1024 * 1024)
+    stored = 0
+
+    while True:
+        for record in open_batches:
+            batch = client.batches.retrieve(record["id"])
+            record["status"] = batch.status
+
+            if batch.status == "completed":
+                entries = _store_results(client, batch, record, cache)
+                record["status"] = "collected"
+                stored += entries
+                print(f"📥 Collected batch {batch.id}: {entries} entries")
+            elif batch.status in FINISHED_STATUSES:
+                print(f"⚠️  Batch {batch.id} ended as {batch.status}; its tickets are queued again on the next run")
+
+        with _manifest_lock:
+            _save_manifest(manifest)
+
+        open_batches = [record for record in open_batches if record["status"] not in FINISHED_STATUSES]
+        if not open_batches or not wait:
+            break
+
+        print(f"⏳ {len(open_batches)} batch(es) still running, checking again in {OPENAI_BATCH_POLL_SECONDS:.0f}s")
+        time.sleep(OPENAI_BATCH_POLL_SECONDS)
+
+    cache.evict()
+    if open_batches:
+        print(f"⏳ {len(open_batches)} batch(es) still running; collect again later or use --wait")
+
+    return stored
@@ -0,0 +1,103 @@
+"""
+Field projection profiles and response trimming for JIRA issues
+"""
+
+# Fields requested from JIRA for each output profile
+FIELD_PROFILES = {
+    # Only what the change log prompt and incremental sync need
+    "release_doc": ["summary", "description", "status", "priority", "assignee", "updated"],
+    # Everything process_tickets prints
+    "console": [
+        "summary", "description", "status", "priority", "assignee", "updated",
+        "issuetype", "project", "created", "sprint",
+    ],
+    # Full payloads for the JSON dump, left untrimmed
+    "json": ["*all"],
+}
+
+# Attributes kept from nested objects; avatars, self URLs and the rest are dropped
+KEPT_ATTRIBUTES = {
+    "status": ("name",),
+    "priority": ("name",),
+    "issuetype": ("name",),
+    "assignee": ("displayName",),
+    "project": ("key", "name"),
+    "sprint": ("id", "name", "state"),
+    # Summaries of parents and linked issues come from one batched lookup instead
+    "parent": ("key",),
+}
+
+
+def profile_fields(profile: str) -> list:
+    """
+    Field list for a profile name, rejecting unknown profiles early
+    """
+    if profile not in FIELD_PROFILES:
+        raise ValueError(f"Unknown JIRA field profile '{profile}', expected one of {', '.join(FIELD_PROFILES)}")
+    return FIELD_PROFILES[profile]
+
+
+def trim_links(links: list) -> list:
+    """
+    Reduce issue links to their direction-aware type name and the other issue's key
+    """
+    trimmed = []
+    for link in links:
+        link_type = link.get("type", {})
+        if "outwardIssue" in link:
+            trimmed.append({"type": link_type.get("outward", "relates to"), "key": link["outwardIssue"].get("key")})
+        elif "inwardIssue" in link:
+            trimmed.append({"type": link_type.get("inward", "relates to"), "key": link["inwardIssue"].get("key")})
+    return trimmed
+
+
+def _trim_changelog(changelog: dict) -> dict:
+    return {
+        "histories": [
+            {
+                "created": history.get("created"),
+                "author": (history.get("author") or {}).get("displayName"),
+                "items": [
+                    {"field": item.get("field"), "from": item.get("fromString"), "to": item.get("toString")}
+                    for item in history.get("items", [])
+                ],
+            }
+            for history in changelog.get("histories", [])
+        ]
+    }
+
+
+def _trim_value(name: str, value):
+    if name == "issuelinks" and isinstance(value, list):
+        return trim_links(value)
+    kept = KEPT_ATTRIBUTES.get(name)
+    if kept is None or not isinstance(value, dict):
+        return value
+    return {attr: value[attr] for attr in kept if attr in value}
+
+
+def trim_issue(issue: dict, fields: list) -> dict:
+    """
+    Keep only the projected fields of an issue and the useful parts of nested objects
+    """
+    if "*all" in fields:
+        return issue
+
+    issue_fields = issue.get("fields", {})
+    trimmed = {
+        "id": issue.get("id"),
+        "key": issue.get("key"),
+        "fields": {name: _trim_value(name, issue_fields[name]) for name in fields if name in issue_fields},
+    }
+    if "changelog" in issue:
+        trimmed["changelog"] = _trim_changelog(issue["changelog"])
+    return trimmed
+
+
+def trim_page(page: dict, fields: list) -> dict:
+    """
+    Trim every issue in a search page in place, right after parsing
+    """
+    if "*all" not in fields:
+        page["issues"] = [trim_issue(issue, fields) for issue in page.get("issues", [])]
+    return page
@@ -0,0 +1,204 @@
+"""
+Shared adaptive rate limiting and retry scheduling for JIRA and OpenAI calls
+"""
+
+import asyncio
+import random
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from config import RETRY_BASE_DELAY, RETRY_MAX_DELAY
+
+# Statuses worth retrying: throttled or transiently unavailable
+RETRY_STATUSES = {429, 502, 503, 504}
+
+# Poll interval while waiting for a concurrency slot
+SLOT_POLL_SECONDS = 0.05
+
+# OpenAI reset headers use Go-style durations such as "1s", "6m0s" or "250ms"
+DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+DURATION_FORMAT = re.compile(r"(?:\d+(?:\.\d+)?(?:ms|h|m|s))+")
+DURATION_UNITS = {"h": 3600, "m": 60, "s": 1, "ms": 0.001}
+
+
+class AdaptiveLimiter:
+    """
+    Token bucket for request rate plus an AIMD concurrency limit.
+
+    Every success nudges the concurrency limit up additively; every throttle
+    halves it and pauses the bucket until the server's reset time, so
+    throughput settles just below what the server tolerates.
+    """
+
+    def __init__(self, name: str, rate_per_second: float, max_concurrency: int):
+        self.name = name
+        self.rate = rate_per_second
+        self.capacity = max(1.0, rate_per_second)
+        self.tokens = self.capacity
+        self.max_concurrency = max(1, max_concurrency)
+        self.concurrency_limit = float(self.max_concurrency)
+        self.in_flight = 0
+        self.paused_until = 0.0
+        self.throttle_count = 0
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> float:
+        """
+        Take a token and a concurrency slot, or return how long to wait before retrying
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now < self.paused_until:
+                return self.paused_until - now
+
+            if self.rate > 0:
+                self.tokens = min(self.capacity, self.tokens + (now - self._last_refill) * self.rate)
+                self._last_refill = now
+                if self.tokens < 1:
+                    return (1 - self.tokens) / self.rate
+
+            if self.in_flight >= int(self.concurrency_limit):
+                return SLOT_POLL_SECONDS
+
+            if self.rate > 0:
+                self.tokens -= 1
+            self.in_flight += 1
+            return 0.0
+
+    def acquire(self):
+        while (wait := self.try_acquire()) > 0:
+            time.sleep(wait)
+
+    async def aacquire(self):
+        while (wait := self.try_acquire()) > 0:
+            await asyncio.sleep(wait)
+
+    def release(self):
+        with self._lock:
+            self.in_flight = max(0, self.in_flight - 1)
+
+    def on_success(self, headers=None):
+        """
+        Additive increase, unless the server's rate-limit headers say we are near the limit
+        """
+        pause = rate_limit_pause(headers) if headers is not None else None
+        with self._lock:
+            if pause:
+                self.paused_until = max(self.paused_until, time.monotonic() + pause)
+                self.concurrency_limit = max(1.0, self.concurrency_limit / 2)
+                return
+            self.concurrency_limit = min(self.max_concurrency, self.concurrency_limit + 1 / self.concurrency_limit)
+
+    def on_throttle(self, delay: float):
+        """
+        Multiplicative decrease and a shared pause so every caller backs off together
+        """
+        with self._lock:
+            self.throttle_count += 1
+            self.concurrency_limit = max(1.0, self.concurrency_limit / 2)
+            self.paused_until = max(self.paused_until, time.monotonic() + delay)
+        print(f"   🐢 {self.name} throttled, backing off {delay:.1f}s "
+              f"(concurrency now {int(self.concurrency_limit)})")
+
+
+def _header(headers, name: str):
+    if headers is None:
+        return None
+    # requests/httpx headers are case-insensitive; plain dicts may not be
+    value = headers.get(name)
+    if value is None:
+        value = headers.get(name.lower())
+    return value
+
+
+def _parse_seconds(value: str | None) -> float | None:
+    """
+    Parse delta-seconds, an HTTP date, an ISO timestamp or an OpenAI duration like "6m0s"
+    """
+    if not value:
+        return None
+    value = value.strip()
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    if DURATION_FORMAT.fullmatch(value):
+        return sum(float(number) * DURATION_UNITS[unit] for number, unit in DURATION_PART.findall(value))
+
+    for parse in (parsedate_to_datetime, datetime.fromisoformat):
+        try:
+            reset_at = parse(value.replace("Z", "+00:00"))
+            if reset_at.tzinfo is None:
+                reset_at = reset_at.replace(tzinfo=timezone.utc)
+            return max(0.0, (reset_at - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            continue
+
+    return None
+
+
+def retry_after_seconds(headers) -> float | None:
+    """
+    Server-requested delay from Retry-After or the rate-limit reset headers
+    """
+    for name in ("Retry-After", "retry-after-ms", "X-RateLimit-Reset",
+                 "x-ratelimit-reset-requests", "x-ratelimit-reset-tokens"):
+        value = _header(headers, name)
+        if value is None:
+            continue
+        if name == "retry-after-ms":
+            try:
+                return float(value) / 1000
+            except ValueError:
+                continue
+        seconds = _parse_seconds(value)
+        if seconds is not None:
+            return seconds
+    return None
+
+
+def rate_limit_pause(headers) -> float | None:
+    """
+    Seconds to pause before the next request when a success response says the budget is spent
+    """
+    if str(_header(headers, "X-RateLimit-NearLimit")).lower() == "true":
+        return retry_after_seconds(headers) or RETRY_BASE_DELAY
+
+    for name in ("X-RateLimit-Remaining", "x-ratelimit-remaining-requests"):
+        remaining = _header(headers, name)
+        if remaining is not None and remaining.strip().isdigit() and int(remaining) == 0:
+            return retry_after_seconds(headers) or RETRY_BASE_DELAY
+
+    return None
+
+
+def backoff_delay(attempt: int, retry_after: float | None = None) -> float:
+    """
+    Full-jitter exponential backoff, never shorter than the server's Retry-After
+    """
+    delay = random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * (2 ** attempt)))
+    if retry_after is not None:
+        delay = max(delay, min(retry_after, RETRY_MAX_DELAY))
+    return delay
+
+
+_limiters: dict[str, AdaptiveLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_limiter(name: str, rate_per_second: float, max_concurrency: int) -> AdaptiveLimiter:
+    """
+    Return the process-wide limiter for a service, creating it on first use
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(name)
+        if limiter is None:
+            limiter = AdaptiveLimiter(name, rate_per_second, max_concurrency)
+            _limiters[name] = limiter
+    return limiter
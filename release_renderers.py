@@ -0,0 +1,161 @@
+"""
+Local renderers that turn structured change log entries into release docs.
+
+Entries are the LLM's per-ticket JSON objects: {"key", "tags", "title", "blurb"},
+plus "keys" when one entry covers a cluster of related tickets.
+Links, numbering and markup are added here, so every output format comes
+from one generation pass.
+"""
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from html import escape
+from pathlib import Path
+
+from state import target_slug
+
+
+def parse_entries(text: str) -> list:
+    """
+    Parse the JSON Lines reply into entry dicts, skipping fences and malformed lines
+    """
+    entries = []
+    for line in text.splitlines():
+        line = line.strip().rstrip(",")
+        if not line.startswith("{"):
+            continue
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(entry, dict) and entry.get("key"):
+            entries.append(entry)
+    return entries
+
+
+def doc_basename(state) -> str:
+    """
+    Release doc file name (without suffix) for a sprint target; targets in
+    different projects or boards may share a sprint name
+    """
+    return f"release_doc_{target_slug(state)}"
+
+
+def _tags(entry: dict) -> list:
+    return [str(tag).strip("[] ") for tag in entry.get("tags") or [] if str(tag).strip("[] ")]
+
+
+def _keys(entry: dict) -> list:
+    return entry.get("keys") or [entry["key"]]
+
+
+def markdown_entry(number: int, entry: dict, jira_base_url: str) -> str:
+    links = ", ".join(f"[{key}]({jira_base_url}/browse/{key})" for key in _keys(entry))
+    tags = "".join(f"[{tag}] " for tag in _tags(entry))
+    return f"{number}. [{links}] {tags}{entry.get('title', '')}\n{entry.get('blurb', '')}\n"
+
+
+def render_markdown(sprint_name: str, entries: list, jira_base_url: str) -> str:
+    lines = [f"# Release Documentation - {sprint_name}", "", "* Change log"]
+    lines.extend(markdown_entry(number, entry, jira_base_url) for number, entry in enumerate(entries, 1))
+    return "\n".join(lines)
+
+
+def render_html(sprint_name: str, entries: list, jira_base_url: str) -> str:
+    items = []
+    for entry in entries:
+        links = ", ".join(f'<a href="{escape(jira_base_url)}/browse/{escape(key)}">{escape(key)}</a>'
+                          for key in _keys(entry))
+        tags = "".join(f'<span class="tag">{escape(tag)}</span> ' for tag in _tags(entry))
+        items.append(
+            f'  <li><p>{links} {tags}'
+            f'<strong>{escape(entry.get("title", ""))}</strong></p>\n'
+            f'    <p>{escape(entry.get("blurb", ""))}</p></li>'
+        )
+
+    title = escape(f"Release Documentation - {sprint_name}")
+    return "\n".join([
+        "<!DOCTYPE html>",
+        '<html lang="en">',
+        f'<head><meta charset="utf-8"><title>{title}</title></head>',
+        "<body>",
+        f"<h1>{title}</h1>",
+        "<h2>Change log</h2>",
+        "<ol>",
+        *items,
+        "</ol>",
+        "</body>",
+        "</html>",
+        "",
+    ])
+
+
+def render_confluence(sprint_name: str, entries: list, jira_base_url: str) -> str:
+    """
+    Confluence storage format (XHTML), linking tickets with the Jira issue macro
+    """
+    items = []
+    for entry in entries:
+        macros = " ".join(
+            '<ac:structured-macro ac:name="jira">'
+            f'<ac:parameter ac:name="key">{escape(key)}</ac:parameter></ac:structured-macro>'
+            for key in _keys(entry)
+        )
+        tags = "".join(f"[{escape(tag)}] " for tag in _tags(entry))
+        items.append(
+            f"<li><p>{macros} {tags}<strong>{escape(entry.get('title', ''))}</strong></p>"
+            f"<p>{escape(entry.get('blurb', ''))}</p></li>"
+        )
+
+    return (f"<h1>{escape(f'Release Documentation - {sprint_name}')}</h1>"
+            f"<h2>Change log</h2><ol>{''.join(items)}</ol>\n")
+
+
+def render_json(sprint_name: str, entries: list, jira_base_url: str) -> str:
+    return json.dumps({
+        "sprint": sprint_name,
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "entries": [
+            {**entry, "keys": _keys(entry), "tags": _tags(entry),
+             "url": f"{jira_base_url}/browse/{entry['key']}",
+             "urls": [f"{jira_base_url}/browse/{key}" for key in _keys(entry)]}
+            for entry in entries
+        ],
+    }, indent=2) + "\n"
+
+
+# Format name -> (file suffix, renderer)
+RENDERERS = {
+    "markdown": (".md", render_markdown),
+    "html": (".html", render_html),
+    "confluence": (".confluence.xml", render_confluence),
+    "json": (".json", render_json),
+}
+
+
+def _write_atomic(path: Path, content: str):
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+def render_all(sprint_name: str, entries: list, jira_base_url: str, docs_dir: Path, formats: list,
+               basename: str) -> dict:
+    """
+    Render and atomically write every requested format in parallel; returns format -> path
+    """
+    unknown = [name for name in formats if name not in RENDERERS]
+    if unknown:
+        raise ValueError(f"Unknown release doc format(s) {', '.join(unknown)}, expected {', '.join(RENDERERS)}")
+
+    def render(name):
+        suffix, renderer = RENDERERS[name]
+        path = docs_dir / f"{basename}{suffix}"
+        _write_atomic(path, renderer(sprint_name, entries, jira_base_url))
+        return name, str(path)
+
+    with ThreadPoolExecutor(max_workers=max(1, len(formats))) as executor:
+        return dict(executor.map(render, formats))
@@ -2,17 +2,64 @@
 State definition for JIRA workflow
 """
 
-from typing import TypedDict, List, Dict, Any
+import re
+from dataclasses import dataclass
+from typing import Annotated, TypedDict, List, Dict, Any
+
+
+@dataclass(slots=True)
+class TicketRecord:
+    """Compact, normalized view of a JIRA issue shared by downstream nodes"""
+    key: str
+    id: str
+    summary: str
+    description: str
+    status: str
+    priority: str
+    issue_type: str
+    project: str
+    assignee: str
+    sprint: str
+    created: str
+    updated: str
+    # Parent/epic and linked issues, resolved in search fetch mode
+    parent: str = ""
+    links: str = ""
+
+
+def target_slug(state) -> str:
+    """File name part for a sprint target: project, board (when set) and sprint"""
+    parts = (state.get("project_key"), state.get("board_name"), state["sprint_name"])
+    return "_".join(re.sub(r"[^\w.-]+", "_", part.replace(":", "")).strip("_") for part in parts if part)
+
+
+def merge_metrics(left: Dict[str, Any] | None, right: Dict[str, Any] | None) -> Dict[str, Any]:
+    """Reducer for per-node metrics, so parallel branches can both report"""
+    return {**(left or {}), **(right or {})}
 
 
 class JiraState(TypedDict):
     """State for the JIRA ticket fetching workflow"""
+    # Connection settings; the API key stays in config so checkpoints never hold it
     jira_url: str
-    api_key: str
     email: str
+    project_key: str
+    board_name: str | None
+    sprint_name: str
+    # Fetch the ticket pages past the response cache (watch mode reruns after a detected change)
+    refresh_tickets: bool
     user_info: Dict[str, Any]
+    auth_error: str | None
     projects: List[Dict[str, Any]]
     sprints: List[Dict[str, Any]]
     tickets: List[Dict[str, Any]]
+    records: List[TicketRecord]
+    ticket_store_id: str | None
+    ticket_store_path: str | None
+    export_path: str | None
+    release_entries: List[Dict[str, Any]]
+    release_doc_path: str | None
+    release_doc_paths: Dict[str, str]
+    metrics: Annotated[Dict[str, Dict[str, float]], merge_metrics]
     error: str | None
     status: str
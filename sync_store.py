@@ -0,0 +1,152 @@
+"""
+Local sprint snapshots for incremental ticket sync, and the sprint name index
+"""
+
+import gzip
+import json
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+
+from config import CACHE_DIR, JIRA_FIELD_PROFILE
+
+SYNC_DIR = CACHE_DIR / "sync"
+SPRINT_INDEX_PATH = CACHE_DIR / "sprint_index.json"
+
+_index_lock = threading.Lock()
+
+# Format of the `updated` field returned by JIRA, e.g. 2024-05-02T10:31:07.123+0200
+JIRA_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%f%z"
+
+
+def parse_jira_datetime(value: str | None) -> datetime | None:
+    """
+    Parse a JIRA timestamp, returning None if it is missing or malformed
+    """
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, JIRA_DATETIME_FORMAT)
+    except ValueError:
+        return None
+
+
+def _snapshot_path(sprint_id) -> Path:
+    # Snapshots only hold the fields of the profile they were fetched with
+    return SYNC_DIR / f"sprint_{sprint_id}_{JIRA_FIELD_PROFILE}.json.gz"
+
+
+def load_snapshot(sprint_id) -> dict | None:
+    """
+    Load the stored issues and high-water mark for a sprint
+    """
+    try:
+        with gzip.open(_snapshot_path(sprint_id), "rt", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_snapshot(sprint_id, issues: list, high_water: str | None):
+    """
+    Atomically persist the sprint issues and high-water mark
+    """
+    SYNC_DIR.mkdir(parents=True, exist_ok=True)
+    path = _snapshot_path(sprint_id)
+    tmp_path = path.with_suffix(".tmp")
+
+    with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+        json.dump({"high_water": high_water, "issues": issues}, f)
+
+    os.replace(tmp_path, path)
+
+
+def high_water_mark(issues: list) -> str | None:
+    """
+    Latest `updated` timestamp across the issues, as JIRA formatted it
+    """
+    latest = None
+    latest_raw = None
+    for issue in issues:
+        raw = issue.get("fields", {}).get("updated")
+        parsed = parse_jira_datetime(raw)
+        if parsed and (latest is None or parsed > latest):
+            latest, latest_raw = parsed, raw
+    return latest_raw
+
+
+def minutes_since(mark: str) -> int | None:
+    """
+    Whole minutes elapsed since a high-water mark, rounded up.
+
+    Used for relative JQL (`updated >= -Nm`), which sidesteps the user's
+    JIRA timezone that absolute JQL dates are interpreted in.
+    """
+    parsed = parse_jira_datetime(mark)
+    if parsed is None:
+        return None
+    elapsed = (datetime.now(timezone.utc) - parsed).total_seconds()
+    return max(1, int(elapsed // 60) + 1)
+
+
+def merge_snapshot(snapshot_issues: list, changed_issues: list, current_keys: list) -> list:
+    """
+    Apply changed issues onto the snapshot and drop keys no longer in the sprint.
+
+    The result follows the server's order from the key list.
+    """
+    by_key = {issue.get("key"): issue for issue in snapshot_issues}
+    for issue in changed_issues:
+        by_key[issue.get("key")] = issue
+
+    return [by_key[key] for key in current_keys if key in by_key]
+
+
+def _index_key(project_key: str, board_name: str | None, sprint_name: str) -> str:
+    return f"{project_key}/{board_name or ''}/{sprint_name}"
+
+
+def _load_index() -> dict:
+    try:
+        with open(SPRINT_INDEX_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_index(index: dict):
+    SPRINT_INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = SPRINT_INDEX_PATH.with_suffix(".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(index, f, indent=2)
+    os.replace(tmp_path, SPRINT_INDEX_PATH)
+
+
+def lookup_sprint(project_key: str, board_name: str | None, sprint_name: str) -> dict | None:
+    """
+    Return the indexed sprint for a project/board/name, if a previous run found it
+    """
+    return _load_index().get(_index_key(project_key, board_name, sprint_name))
+
+
+def forget_sprint(project_key: str, board_name: str | None, sprint_name: str):
+    """
+    Drop a stale index entry, e.g. for a sprint that was deleted or renamed
+    """
+    with _index_lock:
+        index = _load_index()
+        if index.pop(_index_key(project_key, board_name, sprint_name), None) is not None:
+            _save_index(index)
+
+
+def remember_sprint(project_key: str, board_name: str | None, sprint: dict):
+    """
+    Record a sprint's id under its project/board/name so later runs skip the listing
+    """
+    entry = {field: sprint.get(field) for field in ("id", "name", "state", "originBoardId")}
+
+    with _index_lock:
+        index = _load_index()
+        index[_index_key(project_key, board_name, sprint.get("name"))] = entry
+        _save_index(index)
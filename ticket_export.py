@@ -0,0 +1,109 @@
+"""
+Streaming NDJSON export of fetched tickets, and lazy loaders for reading it back
+"""
+
+import gzip
+import json
+import mmap
+import os
+from pathlib import Path
+
+from config import JIRA_EXPORT_COMPRESSION
+from state import target_slug
+
+PROJECT_ROOT = Path(__file__).parent.absolute()
+DOCS_DIR = PROJECT_ROOT / "docs"
+
+SUFFIXES = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+
+
+def _open_zstd(path: Path, mode: str):
+    try:
+        import zstandard
+    except ImportError:
+        raise RuntimeError("zstd export needs the 'zstandard' package (pip install zstandard)")
+
+    if "w" in mode:
+        return zstandard.open(path, mode, cctx=zstandard.ZstdCompressor(level=3), encoding="utf-8")
+    return zstandard.open(path, mode, encoding="utf-8")
+
+
+def _open(path: Path, mode: str):
+    """
+    Open an export for text I/O, picking the codec from the file suffix
+    """
+    if path.name.endswith(".gz") or path.name.endswith(".gz.partial"):
+        return gzip.open(path, mode, encoding="utf-8")
+    if path.name.endswith(".zst") or path.name.endswith(".zst.partial"):
+        return _open_zstd(path, mode)
+    return open(path, mode, encoding="utf-8")
+
+
+def export_path_for(state, compression: str = JIRA_EXPORT_COMPRESSION) -> Path:
+    """
+    Export file for a sprint target, named like its release doc
+    """
+    if compression not in SUFFIXES:
+        raise ValueError(f"Unknown export compression '{compression}', expected one of {', '.join(SUFFIXES)}")
+    return DOCS_DIR / f"jira_tickets_{target_slug(state)}.ndjson{SUFFIXES[compression]}"
+
+
+class TicketExporter:
+    """
+    Append issues to a .partial NDJSON file as pages arrive, then rename it into place.
+
+    Readers of the final path only ever see a complete export.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.partial_path = self.path.with_name(self.path.name + ".partial")
+        self.count = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = _open(self.partial_path, "wt")
+
+    def write_issues(self, issues: list):
+        for issue in issues:
+            self._file.write(json.dumps(issue, separators=(",", ":")))
+            self._file.write("\n")
+        self.count += len(issues)
+
+    def finalize(self) -> Path:
+        self._file.close()
+        os.replace(self.partial_path, self.path)
+        return self.path
+
+    def abort(self):
+        self._file.close()
+        self.partial_path.unlink(missing_ok=True)
+
+
+def _iter_mmap_lines(path: Path):
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for line in iter(mm.readline, b""):
+                yield line
+
+
+def iter_tickets(path: str | Path, contains: str | None = None):
+    """
+    Lazily yield tickets from an NDJSON export.
+
+    Uncompressed exports are scanned through mmap; when `contains` is given,
+    lines without that substring are skipped before any JSON parsing.
+    """
+    path = Path(path)
+    needle = contains.encode("utf-8") if contains else None
+
+    if path.suffix in (".gz", ".zst"):
+        with _open(path, "rt") as f:
+            for line in f:
+                if line.strip() and (contains is None or contains in line):
+                    yield json.loads(line)
+        return
+
+    for line in _iter_mmap_lines(path):
+        if line.strip() and (needle is None or needle in line):
+            yield json.loads(line)
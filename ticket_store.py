@@ -0,0 +1,227 @@
+"""
+Columnar in-memory ticket store for large sprints.
+
+Tickets are kept as struct-of-arrays: text fields as plain lists, and
+status, priority, issue type, project, assignee and sprint as interned
+codes in compact arrays. Nodes reach a store by reference through the
+registry id kept in state["ticket_store_id"], so LangGraph's state copies
+never touch the ticket data. With checkpointing on, the table is also saved
+to CACHE_DIR/ticket_store and its path kept in state["ticket_store_path"],
+so resumed runs and --regenerate in a later process can reload it.
+"""
+
+import gzip
+import json
+import os
+import threading
+import uuid
+from array import array
+from collections import Counter
+from pathlib import Path
+
+from config import CACHE_DIR
+from state import TicketRecord, target_slug
+
+STORE_DIR = CACHE_DIR / "ticket_store"
+
+TEXT_COLUMNS = ("key", "id", "summary", "description", "created", "updated", "parent", "links")
+CATEGORY_COLUMNS = ("status", "priority", "issue_type", "project", "assignee", "sprint")
+
+
+class _CategoryColumn:
+    """
+    Interned values plus one 32-bit code per row, with a lazily built row index
+    """
+
+    def __init__(self):
+        self.values = []
+        self.codes = {}
+        self.data = array("I")
+        self._rows_by_code = None
+
+    def append(self, value: str):
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.codes[value] = code
+            self.values.append(value)
+        self.data.append(code)
+        self._rows_by_code = None
+
+    def value(self, row: int) -> str:
+        return self.values[self.data[row]]
+
+    def rows(self, value: str) -> array:
+        code = self.codes.get(value)
+        if code is None:
+            return array("I")
+
+        if self._rows_by_code is None:
+            self._rows_by_code = {}
+            for row, row_code in enumerate(self.data):
+                self._rows_by_code.setdefault(row_code, array("I")).append(row)
+
+        return self._rows_by_code.get(code, array("I"))
+
+    def counts(self) -> dict:
+        return {self.values[code]: count for code, count in Counter(self.data).most_common()}
+
+
+class TicketStore:
+    """
+    Struct-of-arrays ticket table with key, status and assignee lookups
+    """
+
+    def __init__(self):
+        self.text = {name: [] for name in TEXT_COLUMNS}
+        self.categories = {name: _CategoryColumn() for name in CATEGORY_COLUMNS}
+        self.row_by_key = {}
+
+    @classmethod
+    def from_records(cls, records) -> "TicketStore":
+        store = cls()
+        for record in records:
+            store.add(record)
+        return store
+
+    def __len__(self) -> int:
+        return len(self.text["key"])
+
+    def add(self, record: TicketRecord):
+        self.row_by_key[record.key] = len(self)
+        for name in TEXT_COLUMNS:
+            self.text[name].append(getattr(record, name))
+        for name in CATEGORY_COLUMNS:
+            self.categories[name].append(getattr(record, name))
+
+    def record(self, row: int) -> TicketRecord:
+        values = {name: self.text[name][row] for name in TEXT_COLUMNS}
+        values.update((name, self.categories[name].value(row)) for name in CATEGORY_COLUMNS)
+        return TicketRecord(**values)
+
+    def records(self, rows=None) -> list:
+        """
+        Materialize records for the given rows (all rows by default), in row order
+        """
+        return [self.record(row) for row in (range(len(self)) if rows is None else rows)]
+
+    def get(self, key: str) -> TicketRecord | None:
+        row = self.row_by_key.get(key)
+        return None if row is None else self.record(row)
+
+    def where(self, **filters) -> list:
+        """
+        Rows matching every category filter, e.g. where(status="Done", assignee="Ada")
+        """
+        rows = None
+        for name, value in filters.items():
+            if name not in self.categories:
+                raise ValueError(f"Cannot filter on '{name}', expected one of {', '.join(CATEGORY_COLUMNS)}")
+            matched = self.categories[name].rows(value)
+            rows = set(matched) if rows is None else rows & set(matched)
+        return sorted(rows) if rows is not None else list(range(len(self)))
+
+    def group_counts(self, column: str) -> dict:
+        """
+        Ticket count per distinct value of a category column, most common first
+        """
+        return self.categories[column].counts()
+
+    def distinct(self, column: str) -> list:
+        return list(self.categories[column].values)
+
+    def save(self, path: Path):
+        """
+        Write the columns to a gzipped JSON table, atomically
+        """
+        payload = {
+            "text": self.text,
+            "categories": {name: {"values": column.values, "codes": column.data.tolist()}
+                           for name, column in self.categories.items()},
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=1) as f:
+            json.dump(payload, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path) -> "TicketStore":
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            payload = json.load(f)
+
+        store = cls()
+        store.text = {name: payload["text"][name] for name in TEXT_COLUMNS}
+        for name in CATEGORY_COLUMNS:
+            column = store.categories[name]
+            column.values = payload["categories"][name]["values"]
+            column.codes = {value: code for code, value in enumerate(column.values)}
+            column.data = array("I", payload["categories"][name]["codes"])
+        store.row_by_key = {key: row for row, key in enumerate(store.text["key"])}
+        return store
+
+
+_stores: dict[str, TicketStore] = {}
+_stores_lock = threading.Lock()
+
+
+def register_store(store: TicketStore) -> str:
+    """
+    Keep a store in the process registry and return the id to put in state
+    """
+    store_id = uuid.uuid4().hex
+    with _stores_lock:
+        _stores[store_id] = store
+    return store_id
+
+
+def get_store(store_id: str | None) -> TicketStore | None:
+    with _stores_lock:
+        return _stores.get(store_id) if store_id else None
+
+
+def release_store(store_id: str | None):
+    with _stores_lock:
+        _stores.pop(store_id, None)
+
+
+def save_store(store: TicketStore, state) -> str:
+    """
+    Persist a run's store as its target's table and return the path to put in state
+    """
+    path = STORE_DIR / f"{target_slug(state)}.json.gz"
+    store.save(path)
+    return str(path)
+
+
+def state_store(state) -> TicketStore | None:
+    """
+    The run's columnar store, if it has one.
+
+    A store id from another process (e.g. a resumed checkpoint) is not in the
+    registry, so the store is reloaded from its saved table and registered
+    again under the same id.
+    """
+    store_id = state.get("ticket_store_id")
+    store = get_store(store_id)
+    path = state.get("ticket_store_path")
+    if store is None and store_id and path and Path(path).exists():
+        store = TicketStore.load(Path(path))
+        with _stores_lock:
+            store = _stores.setdefault(store_id, store)
+    return store
+
+
+def ticket_records(state) -> list:
+    """
+    The run's TicketRecords, from its columnar store when it has one
+    """
+    store = state_store(state)
+    if store is not None:
+        return store.records()
+    return state.get("records", [])
+
+
+def ticket_count(state) -> int:
+    store = state_store(state)
+    return len(store) if store is not None else len(state.get("records", []))
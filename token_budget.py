@@ -0,0 +1,96 @@
+"""
+Token counting and budgeting for OpenAI prompts.
+
+Uses tiktoken (a listed requirement) for exact counts. The ~4 characters per
+token estimate is only a fallback for installs without it, or when its
+encoding files cannot be loaded (e.g. offline on first use); a warning says so.
+"""
+
+from functools import lru_cache
+
+from config import (
+    OPENAI_MODEL,
+    LLM_CONTEXT_TOKENS,
+    LLM_MAX_OUTPUT_TOKENS,
+    LLM_TOKENS_PER_ENTRY,
+)
+
+TRUNCATION_MARKER = " [...truncated]"
+
+# Headroom for the change log header and numbering around the entries
+OUTPUT_OVERHEAD_TOKENS = 64
+
+
+@lru_cache(maxsize=None)
+def _encoding(model: str):
+    try:
+        import tiktoken
+    except ImportError:
+        print("⚠️  tiktoken is not installed (pip install -r requirements.txt); estimating token counts")
+        return None
+
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        # tiktoken downloads its encoding files on first use
+        print(f"⚠️  Could not load the tiktoken encoding for {model} ({e}); estimating token counts")
+        return None
+
+
+def exact_counts() -> bool:
+    return _encoding(OPENAI_MODEL) is not None
+
+
+def count_tokens(text: str, model: str = OPENAI_MODEL) -> int:
+    """
+    Tokens in the text for the model, or a character-based estimate without tiktoken
+    """
+    encoding = _encoding(model)
+    if encoding is None:
+        return len(text) // 4 + 1
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def truncate_to_tokens(text: str, max_tokens: int, model: str = OPENAI_MODEL) -> tuple[str, bool]:
+    """
+    Deterministically cut text to at most max_tokens, marking the cut.
+
+    Returns the (possibly) shortened text and whether it was truncated.
+    """
+    if max_tokens <= 0 or not text:
+        return text, False
+
+    encoding = _encoding(model)
+    if encoding is None:
+        max_chars = max_tokens * 4
+        if len(text) <= max_chars:
+            return text, False
+        # Prefer ending on a word boundary when one is close to the limit
+        cut = text.rfind(" ", max_chars // 2, max_chars)
+        return text[:cut if cut > 0 else max_chars].rstrip() + TRUNCATION_MARKER, True
+
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text, False
+    return encoding.decode(tokens[:max_tokens]).rstrip() + TRUNCATION_MARKER, True
+
+
+def output_budget(ticket_count: int) -> int:
+    """
+    max_tokens for a completion documenting the given number of tickets
+    """
+    return min(LLM_MAX_OUTPUT_TOKENS, OUTPUT_OVERHEAD_TOKENS + LLM_TOKENS_PER_ENTRY * ticket_count)
+
+
+def entries_per_completion() -> int:
+    """
+    Most tickets one completion can document before output_budget is clamped
+    """
+    return max(1, (LLM_MAX_OUTPUT_TOKENS - OUTPUT_OVERHEAD_TOKENS) // LLM_TOKENS_PER_ENTRY)
+
+
+def fits_context(prompt_tokens: int, max_tokens: int) -> bool:
+    return prompt_tokens + max_tokens <= LLM_CONTEXT_TOKENS
@@ -0,0 +1,267 @@
+"""
+Watch mode: a long-running process that keeps the compiled graph, the pooled
+JIRA session and the OpenAI client warm, and regenerates a sprint's docs only
+when its tickets changed.
+
+Each target is checked with a one-issue query for its ticket count and newest
+`updated` timestamp, every WATCH_INTERVAL seconds or as soon as a JIRA webhook
+reaches the optional local endpoint.
+"""
+
+import hashlib
+import hmac
+import json
+import re
+import signal
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from config import (
+    BATCH_WORKERS,
+    JIRA_FETCH_MODE,
+    JIRA_JQL,
+    METRICS_ENABLED,
+    WATCH_INTERVAL,
+    WATCH_WEBHOOK_HOST,
+    WATCH_WEBHOOK_PORT,
+    WATCH_WEBHOOK_SECRET,
+)
+from checkpoints import open_checkpointer, run_checkpointed, thread_config
+from graph import create_jira_graph
+from jira_client import get_jira_client, print_client_stats
+from metrics import write_metrics
+from nodes import fetch_user_info
+from nodes.fetch_tickets_agile import STORY_JQL
+from nodes.fetch_tickets_search import SEARCH_PATH
+from ticket_store import release_store, ticket_records
+
+ORDER_BY = re.compile(r"\s+ORDER\s+BY\s+.*$", re.IGNORECASE | re.DOTALL)
+
+
+def sprint_signature(state) -> tuple | None:
+    """
+    (ticket count, newest `updated`) for a target, from a single one-issue query.
+
+    The JQL search API reports no count, so in search mode only edits are
+    seen, not tickets leaving the query. None until the sprint id is known.
+    """
+    client = get_jira_client(state)
+    sprint_name = state["sprint_name"]
+    sprint_id = next((s.get("id") for s in state.get("sprints", []) if s.get("name") == sprint_name), None)
+
+    if JIRA_FETCH_MODE == "search":
+        if "{sprint_id}" in JIRA_JQL and sprint_id is None:
+            return None
+        jql = JIRA_JQL.format(sprint_id=sprint_id, sprint_name=sprint_name, project=state["project_key"])
+        path = SEARCH_PATH
+        params = {"jql": f"{ORDER_BY.sub('', jql)} ORDER BY updated DESC", "fields": "updated", "maxResults": 1}
+    else:
+        if sprint_id is None:
+            return None
+        path = f"/rest/agile/1.0/sprint/{sprint_id}/issue"
+        params = {"jql": f"{STORY_JQL} ORDER BY updated DESC", "fields": "updated", "maxResults": 1}
+
+    response = client.get(path, params=params, use_cache=False)
+    if response.status_code != 200:
+        raise RuntimeError(f"Change check failed: {response.status_code} - {response.text}")
+
+    page = response.json()
+    issues = page.get("issues", [])
+    newest = issues[0].get("fields", {}).get("updated") if issues else None
+    return page.get("total"), newest
+
+
+def _reflects(final_state, signature: tuple) -> bool:
+    """
+    Whether a run's fetched tickets match the change check that triggered it
+    """
+    total, newest = signature
+    records = ticket_records(final_state)
+    if total is not None and len(records) != total:
+        return False
+    return newest is None or any(record.updated == newest for record in records)
+
+
+class Watcher:
+    """
+    Regenerates the targets whose signature changed since their last run
+    """
+
+    def __init__(self, app, target_states: list, docs_dir: Path):
+        self.app = app
+        self.docs_dir = docs_dir
+        self.targets = {thread_config(state)["configurable"]["thread_id"]: state for state in target_states}
+        self.signatures = {}
+        self._dirty = set()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+
+    def notify(self, project: str | None):
+        """
+        Mark the targets of a project (all targets when unknown) for a check right away
+        """
+        with self._lock:
+            self._dirty.update(name for name, state in self.targets.items()
+                               if project is None or state["project_key"] == project)
+        self._wake.set()
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+
+    def _check(self, name: str) -> tuple[bool, tuple | None]:
+        try:
+            signature = sprint_signature(self.targets[name])
+        except Exception as e:
+            print(f"⚠️  {name}: {e}; checking again next cycle")
+            return False, self.signatures.get(name)
+        return signature is None or signature != self.signatures.get(name), signature
+
+    def _run(self, name: str, signature: tuple | None):
+        start = time.perf_counter()
+        # A detected change must not be rebuilt from cached issue pages
+        final_state = run_checkpointed(self.app, {**self.targets[name], "refresh_tickets": True})
+
+        # The resolved sprint id makes the next check a single request
+        self.targets[name] = {**self.targets[name], "sprints": final_state.get("sprints", [])}
+        if final_state.get("status") != "error" and not final_state.get("error"):
+            if signature is None:
+                signature = self._check(name)[1]
+            # Only a run that saw the change settles it; otherwise the next cycle runs again
+            if signature is None or _reflects(final_state, signature):
+                self.signatures[name] = signature
+                print(f"🔄 {name}: docs regenerated in {time.perf_counter() - start:.1f}s")
+            else:
+                self.signatures.pop(name, None)
+                print(f"⚠️  {name}: fetched tickets predate the detected change; regenerating next cycle")
+        else:
+            # Left unset so the next cycle retries
+            self.signatures.pop(name, None)
+
+        # Columnar stores live in this process's registry; drop each run's store once it is done
+        release_store(final_state.get("ticket_store_id"))
+
+        return final_state
+
+    def cycle(self, names: list, force: bool = False):
+        """
+        Check the given targets and regenerate the ones that changed
+        """
+        with ThreadPoolExecutor(max_workers=max(1, BATCH_WORKERS)) as executor:
+            if force:
+                changed = [(name, None) for name in names]
+            else:
+                checks = list(executor.map(self._check, names))
+                changed = [(name, signature) for name, (is_changed, signature) in zip(names, checks) if is_changed]
+
+            if not changed:
+                return
+
+            final_states = list(executor.map(lambda item: self._run(*item), changed))
+
+        print_client_stats()
+        if METRICS_ENABLED:
+            write_metrics(final_states, self.docs_dir)
+
+    def run(self):
+        # The first cycle renders every target so the docs match this process's view
+        self.cycle(list(self.targets), force=True)
+        print(f"\n👀 Watching {len(self.targets)} target(s), checking every {WATCH_INTERVAL:.0f}s")
+
+        while not self._stop.is_set():
+            woke = self._wake.wait(WATCH_INTERVAL)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+
+            with self._lock:
+                names = sorted(self._dirty) if woke else list(self.targets)
+                self._dirty.clear()
+            if names:
+                self.cycle(names)
+
+
+def _valid_signature(body: bytes, header: str) -> bool:
+    expected = "sha256=" + hmac.new(WATCH_WEBHOOK_SECRET.encode("utf-8"), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, header or "")
+
+
+def _event_project(event: dict) -> str | None:
+    issue = event.get("issue") or {}
+    project = ((issue.get("fields") or {}).get("project") or {}).get("key")
+    if not project and "-" in (issue.get("key") or ""):
+        project = issue["key"].rsplit("-", 1)[0]
+    return project
+
+
+class _WebhookHandler(BaseHTTPRequestHandler):
+    server: "WebhookServer"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, status: int):
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+        if WATCH_WEBHOOK_SECRET and not _valid_signature(body, self.headers.get("X-Hub-Signature")):
+            return self._reply(401)
+
+        try:
+            event = json.loads(body or b"{}")
+        except ValueError:
+            event = {}
+
+        self.server.watcher.notify(_event_project(event) if isinstance(event, dict) else None)
+        self._reply(204)
+
+
+class WebhookServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, watcher: Watcher):
+        super().__init__((WATCH_WEBHOOK_HOST, WATCH_WEBHOOK_PORT), _WebhookHandler)
+        self.watcher = watcher
+
+
+def run_watch(base_state: dict, targets: list | None, docs_dir: Path):
+    """
+    Authenticate once, compile the graph once, then keep the targets' docs fresh until stopped
+    """
+    auth_state = fetch_user_info(base_state)
+    if auth_state["status"] == "error":
+        print(f"❌ Watch mode aborted: {auth_state['error']}")
+        return
+
+    target_states = [
+        {**auth_state, "project_key": target["project"], "board_name": target.get("board"),
+         "sprint_name": target["sprint"]}
+        for target in targets
+    ] if targets else [auth_state]
+
+    with open_checkpointer() as checkpointer:
+        watcher = Watcher(create_jira_graph(checkpointer=checkpointer), target_states, docs_dir)
+        signal.signal(signal.SIGTERM, lambda *_: watcher.stop())
+
+        server = None
+        if WATCH_WEBHOOK_PORT:
+            server = WebhookServer(watcher)
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            print(f"🪝 Listening for JIRA webhooks on http://{WATCH_WEBHOOK_HOST}:{server.server_address[1]}/")
+
+        try:
+            watcher.run()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if server is not None:
+                server.shutdown()
+            print("👋 Watch mode stopped")